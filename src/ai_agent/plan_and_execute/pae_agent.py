@@ -12,7 +12,7 @@ from pydantic import BaseModel,Field
 async def search_naver_local(query: str, display: int = 5):
     """네이버 지역 검색을 통해 맛집이나 장소 정보를 가져옵니다."""
     client = get_naver_search_client()
-    return await client.search_local(query=query, display=display)
+    return await client.search_local(query=query, display=display, cache=True)
 
 @tool
 async def get_lat_lng(address: str):
@@ -2,6 +2,8 @@ from .endpoints.wikipedia import router as wikipedia_router
 from .endpoints.sk import router as sk_router
 from .endpoints.naver import router as naver_router
 from .endpoints.ai import router as ai_router
+from .endpoints.kakao import router as kakao_router
+from .endpoints.geocode import router as geocode_router
 from fastapi import APIRouter
 
 
@@ -13,6 +15,8 @@ aggregate_router.include_router(wikipedia_router,prefix="/wikipedia",tags=["wiki
 aggregate_router.include_router(sk_router,prefix="/sk",tags=["sk"])
 aggregate_router.include_router(naver_router,prefix="/naver",tags=["naver"])
 aggregate_router.include_router(ai_router,prefix="/ai_agent",tags=["ai_agent"])
+aggregate_router.include_router(kakao_router,prefix="/kakao",tags=["kakao"])
+aggregate_router.include_router(geocode_router,prefix="/geocode",tags=["geocode"])
 
 @aggregate_router.get("/exception")
 async def index():
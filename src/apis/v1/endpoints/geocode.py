@@ -0,0 +1,127 @@
+import asyncio
+from typing import Annotated, Literal
+
+from fastapi import APIRouter,Depends,Query,Request
+from fastapi.responses import StreamingResponse
+from handler.geocoder import get_geocoder, RacingGeocoder
+from handler.naver.geocode_job import get_geocode_job_manager, GeocodeJobManager
+from handler.naver.map_handler import get_naver_map_client, NaverMapClient
+from core.config import settings
+from core.exceptions import BadRequestException
+from core.responses import FastJSONResponse
+from shared.utils.logger.root import log
+router = APIRouter()
+
+
+@router.get("")
+async def geocode_handler(
+            address: Annotated[str,Query(description="변환할 주소")],
+            geocoder: RacingGeocoder = Depends(get_geocoder)):
+    """
+    여러 지오코딩 제공자(네이버, 카카오) 중 먼저 결과를 찾은 제공자의 좌표를 반환합니다
+    결과가 없으면 null을 반환합니다
+    :param address:
+    :param geocoder:
+    :return:
+    """
+    log.info(f"geocode: {address}")
+    return FastJSONResponse(await geocoder.geocode(address))
+
+
+@router.get("/stats")
+async def geocode_stats_handler(geocoder: RacingGeocoder = Depends(get_geocoder),
+                                client: NaverMapClient = Depends(get_naver_map_client)):
+    """
+    제공자별 지연 시간/결과 통계와 현재 호출 순서, 지오코딩 영속 캐시(SQLite) 통계를 반환합니다
+    영속 캐시 통계 중 entries는 파일 전체 기준이고, 나머지는 이 워커의 집계입니다
+    :param geocoder:
+    :param client:
+    :return:
+    """
+    persistent_cache = None
+    if client.geocode_cache is not None:
+        persistent_cache = {**client.geocode_cache.stats,
+                            "entries": await asyncio.to_thread(len, client.geocode_cache)}
+    return FastJSONResponse({
+        "order": geocoder.ranked(),
+        "providers": {name: stats.as_dict() for name, stats in geocoder.stats.items()},
+        "persistent_cache": persistent_cache,
+    })
+
+
+@router.post("/jobs")
+async def create_geocode_job_handler(
+            request: Request,
+            format: Annotated[Literal["csv", "ndjson"],Query(description="업로드 파일 형식")] = "csv",
+            column: Annotated[str,Query(description="주소가 담긴 CSV 열 이름 또는 NDJSON 키")] = "address",
+            manager: GeocodeJobManager = Depends(get_geocode_job_manager)):
+    """
+    주소 파일(CSV/NDJSON)을 요청 본문으로 업로드해 일괄 지오코딩 작업을 시작합니다
+    업로드는 스트림으로 디스크에 저장하고, 진행 상황은 GET /geocode/jobs/{job_id}로 조회합니다
+    파일 인코딩은 UTF-8 또는 CP949여야 하며 결과 파일은 UTF-8로 기록합니다
+    :param request: 본문 = 파일 내용 (예: curl -H 'Content-Type: text/csv' --data-binary @addresses.csv)
+    :param format:
+    :param column:
+    :param manager:
+    :return:
+    """
+    job = await manager.create(request.stream(), format, column, max_bytes=settings.GEOCODE_JOB_MAX_UPLOAD_BYTES)
+    log.info(f"geocode job: {job.id} ({job.input_bytes} bytes)")
+    return FastJSONResponse(job.progress(), status_code=202)
+
+
+@router.get("/jobs")
+async def list_geocode_jobs_handler(manager: GeocodeJobManager = Depends(get_geocode_job_manager)):
+    """
+    일괄 지오코딩 작업 목록과 진행 상황을 반환합니다
+    :param manager:
+    :return:
+    """
+    return FastJSONResponse([job.progress() for job in await manager.list_jobs()])
+
+
+@router.get("/jobs/{job_id}")
+async def geocode_job_handler(job_id: str, manager: GeocodeJobManager = Depends(get_geocode_job_manager)):
+    """
+    일괄 지오코딩 작업의 진행률, 처리량(행/초), 남은 시간 추정과 결과 집계를 반환합니다
+    :param job_id:
+    :param manager:
+    :return:
+    """
+    return FastJSONResponse((await manager.get(job_id)).progress())
+
+
+@router.post("/jobs/{job_id}/resume")
+async def resume_geocode_job_handler(job_id: str, manager: GeocodeJobManager = Depends(get_geocode_job_manager)):
+    """
+    실패한 작업을 마지막 체크포인트부터 다시 실행합니다
+    :param job_id:
+    :param manager:
+    :return:
+    """
+    job = await manager.get(job_id)
+    if job.status == "completed":
+        raise BadRequestException(detail=f"이미 완료된 작업입니다: {job_id}")
+    manager.start(job)
+    return FastJSONResponse(job.progress(), status_code=202)
+
+
+@router.get("/jobs/{job_id}/result")
+async def geocode_job_result_handler(
+            job_id: str,
+            follow: Annotated[bool,Query(description="작업이 끝날 때까지 새 결과를 이어서 전달")] = False,
+            manager: GeocodeJobManager = Depends(get_geocode_job_manager)):
+    """
+    결과 파일을 내려받습니다. 처리 중인 작업은 마지막 체크포인트까지의 결과를 반환합니다
+    :param job_id:
+    :param follow:
+    :param manager:
+    :return:
+    """
+    job = await manager.get(job_id)
+    media_type = "text/csv" if job.format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        manager.iter_output(job, follow=follow),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="geocode-{job.id}.{job.format}"'}
+    )
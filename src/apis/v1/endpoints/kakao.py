@@ -0,0 +1,43 @@
+from typing import Annotated
+
+from fastapi import APIRouter,Depends,Query
+from handler.kakao.local_handler import get_kakao_local_client, KakaoLocalClient
+from core.responses import FastJSONResponse
+from shared.utils.logger.root import log
+router = APIRouter()
+
+
+@router.post("/geocode")
+async def geocode_handler(
+            query: Annotated[str,Query(description="검색할 주소")],
+            size: Annotated[int,Query(ge=1, le=30, description="결과 수")] = 10,
+            cache: Annotated[bool,Query(description="응답 캐시 사용 여부")] = False,
+            client: KakaoLocalClient = Depends(get_kakao_local_client)):
+    """
+    카카오 로컬 API를 이용하여 주소를 좌표로 변환합니다
+    :param query:
+    :param size:
+    :param cache:
+    :param client:
+    :return:
+    """
+    log.info(f"kakao geocode: {query}")
+    return FastJSONResponse(await client.search_address(query, size=size, cache=cache))
+
+
+@router.post("/reverse-geocode")
+async def reverse_geocode_handler(
+            lat: Annotated[float,Query(description="위도")],
+            lng: Annotated[float,Query(description="경도")],
+            cache: Annotated[bool,Query(description="응답 캐시 사용 여부")] = False,
+            client: KakaoLocalClient = Depends(get_kakao_local_client)):
+    """
+    카카오 로컬 API를 이용하여 위도/경도 좌표의 법정동/행정동 정보를 가져옵니다
+    :param lat:
+    :param lng:
+    :param cache:
+    :param client:
+    :return:
+    """
+    log.info(f"kakao reverse geocode: {lat},{lng}")
+    return FastJSONResponse(await client.coord_to_region(lat, lng, cache=cache))
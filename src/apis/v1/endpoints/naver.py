@@ -1,49 +1,193 @@
-from typing import Annotated
+from typing import Annotated, List
 
-from fastapi import APIRouter,Depends,Query
+import orjson
+from fastapi import APIRouter,Depends,Query,Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, model_validator
 from handler.naver.map_handler import get_naver_map_client,get_naver_search_client, \
-    NaverMapClient
+    NaverMapClient, NaverSearchClient
+from core.config import settings
+from core.responses import FastJSONResponse, passthrough_response
 from shared.utils.logger.root import log
 router = APIRouter()
 
 
+class GeocodeBatchRequest(BaseModel):
+    addresses: List[str] = Field(min_length=1, max_length=settings.GEOCODE_BATCH_MAX_SIZE,
+                                 description="변환할 주소 목록")
+    concurrency: int | None = Field(default=None, ge=1, le=32, description="동시 조회 수")
+    cache: bool = Field(default=True, description="응답/영속 캐시 사용 여부")
+
+
+class ReverseGeocodeBatchRequest(BaseModel):
+    lat: List[float] = Field(min_length=1, max_length=settings.REVERSE_GEOCODE_BATCH_MAX_SIZE,
+                             description="위도 목록")
+    lng: List[float] = Field(min_length=1, max_length=settings.REVERSE_GEOCODE_BATCH_MAX_SIZE,
+                             description="경도 목록 (lat과 같은 길이)")
+    orders: str = Field(default="legalcode", description="주소 타입")
+    tolerance_m: float = Field(default=10.0, gt=0, le=1000, description="같은 위치로 묶을 허용 오차 (미터)")
+    concurrency: int | None = Field(default=None, ge=1, le=64, description="동시 조회 수")
+    cache: bool = Field(default=True, description="공간 캐시 사용 여부")
+
+    @model_validator(mode="after")
+    def _check_lengths(self):
+        if len(self.lat) != len(self.lng):
+            raise ValueError("lat과 lng의 길이가 같아야 합니다.")
+        return self
+
+
 
 
 
 @router.post("/geocode")
-async def geocode_handler(query: str,
+async def geocode_handler(request: Request,
+            query: str,
             coordinate: str | None = None,
             filter_type: str | None = None,
             count: int = 10,
-            page: int = 1,client: NaverMapClient = Depends(
+            page: int = 1,
+            cache: Annotated[bool,Query(description="응답 캐시 사용 여부")] = False,
+            client: NaverMapClient = Depends(
     get_naver_map_client),):
     """
     네이버 MAP API를 이용하여 도로명주소로부터 위도/경도 좌표로 변환합니다
+    (업스트림 응답을 디코딩하지 않고 그대로 전달)
+    :param request:
     :param query:
     :param coordinate:
     :param filter_type:
     :param count:
     :param page:
+    :param cache:
     :param client:
     :return:
     """
     log.info("naver")
-    return await client.geocode(query, coordinate, filter_type, count)
+    raw = await client.geocode_raw(query, coordinate, filter_type, count, page,
+                                   accept_encoding=request.headers.get("accept-encoding"),
+                                   cache=cache)
+    return passthrough_response(raw)
+
+@router.post("/geocode/batch")
+async def geocode_batch_handler(body: GeocodeBatchRequest,
+            client: NaverMapClient = Depends(
+    get_naver_map_client),):
+    """
+    여러 주소를 한 번의 요청으로 위도/경도 좌표로 변환합니다
+    중복 주소는 한 번만 조회하며, 결과는 입력 순서대로 항목별 상태/오류/지연 시간과 함께 반환합니다
+    :param body:
+    :param client:
+    :return:
+    """
+    log.info(f"naver geocode batch: {len(body.addresses)}")
+    result = await client.geocode_batch(body.addresses, concurrency=body.concurrency, cache=body.cache)
+    return FastJSONResponse(result)
 
 @router.post("/reverse-geocode")
-async def reverse_geocode_handler(lat: Annotated[float,Query(description="위도")],
+async def reverse_geocode_handler(request: Request,
+            lat: Annotated[float,Query(description="위도")],
             lng: Annotated[float,Query(description="경도")],
             orders: Annotated[str,Query(description="주소 타입")] = "legalcode,admcode,addr,roadaddr",
+            cache: Annotated[bool,Query(description="공간 캐시 사용 여부 (같은 geohash 셀의 조회 결과 재사용)")] = False,
                                   client : NaverMapClient = Depends(
     get_naver_map_client)):
     """
     네이버 MAP API를 이용하여 위도/경도 좌표로부터 주소명을 가져옵니다
+    (업스트림 응답을 디코딩하지 않고 그대로 전달)
+    :param request:
     :param lat:
     :param lng:
     :param orders:
+    :param cache:
     :param client:
     :return:
     """
     log.info("naver")
-    return await client.reverse_geocode(lat, lng, orders)
+    raw = await client.reverse_geocode_raw(lat, lng, orders,
+                                           accept_encoding=request.headers.get("accept-encoding"),
+                                           cache=cache)
+    return passthrough_response(raw)
+
+
+@router.post("/reverse-geocode/batch")
+async def reverse_geocode_batch_handler(body: ReverseGeocodeBatchRequest,
+            client: NaverMapClient = Depends(
+    get_naver_map_client),):
+    """
+    여러 위도/경도 좌표를 한 번의 요청으로 주소명으로 변환합니다
+    허용 오차(tolerance_m) 안의 좌표는 한 번만 조회하며, 결과는 입력 위치 그대로 반환합니다
+    :param body:
+    :param client:
+    :return:
+    """
+    log.info(f"naver reverse geocode batch: {len(body.lat)}")
+    result = await client.reverse_geocode_batch(body.lat, body.lng, orders=body.orders,
+                                                tolerance_m=body.tolerance_m,
+                                                concurrency=body.concurrency, cache=body.cache)
+    return FastJSONResponse(result)
+
+
+@router.get("/places/nearby")
+async def places_nearby_handler(
+            lat: Annotated[float,Query(description="위도")],
+            lng: Annotated[float,Query(description="경도")],
+            radius_m: Annotated[float,Query(gt=0, le=20000, description="검색 반경 (미터)")] = 1000.0,
+            category: Annotated[str | None,Query(description="카테고리 또는 업체명 (예: 카페)")] = None,
+            query: Annotated[str | None,Query(description="색인이 부족할 때 사용할 검색어 (예: 판교 카페)")] = None,
+            limit: Annotated[int,Query(ge=1, le=100, description="최대 결과 수")] = 20,
+            client: NaverSearchClient = Depends(
+    get_naver_search_client)):
+    """
+    지역 검색으로 수집한 장소 색인에서 근처 업체를 가까운 순으로 찾습니다
+    색인의 결과가 부족하거나 오래된 경우에만 네이버 지역 검색 API를 호출합니다
+    :param lat:
+    :param lng:
+    :param radius_m:
+    :param category:
+    :param query:
+    :param limit:
+    :param client:
+    :return:
+    """
+    log.info(f"naver places nearby: {lat},{lng} r={radius_m} {category}")
+    found = await client.search_nearby(lat, lng, radius_m, category=category, query=query, limit=limit)
+    return FastJSONResponse([{"place": place, "distance_m": round(distance, 1)} for place, distance in found])
+
 
+@router.get("/search/local/stream")
+async def search_local_stream_handler(
+            query: Annotated[str,Query(description="검색어 (예: 판교 맛집)")],
+            max_results: Annotated[int,Query(ge=1, le=settings.NAVER_SEARCH_STREAM_MAX_RESULTS,
+                                             description="최대 업체 수")] = 50,
+            sort: Annotated[str,Query(description="정렬 방식 (random: 정확도, comment: 리뷰 순)")] = "random",
+            cache: Annotated[bool,Query(description="페이지 응답 캐시 사용 여부")] = True,
+            client: NaverSearchClient = Depends(
+    get_naver_search_client)):
+    """
+    네이버 지역 검색 결과를 여러 페이지에 걸쳐 동시에 요청하고, 업체를 도착하는 순서대로 NDJSON으로 스트리밍합니다
+    (한 줄에 업체 하나, 중복 제거)
+    :param query:
+    :param max_results:
+    :param sort:
+    :param cache:
+    :param client:
+    :return:
+    """
+    log.info(f"naver local search stream: {query} ({max_results})")
+
+    async def lines():
+        async for place in client.iter_local(query, max_results=max_results, sort=sort, cache=cache):
+            yield orjson.dumps(place) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/search/stats")
+async def search_stats_handler(client: NaverSearchClient = Depends(
+    get_naver_search_client)):
+    """
+    지역 검색 검색어 캐시의 적중률과 장소 색인 크기를 반환합니다
+    :param client:
+    :return:
+    """
+    return FastJSONResponse({"query_cache": client.query_cache.stats, "place_index": {"places": len(client.place_index)}})
@@ -1,12 +1,43 @@
-from fastapi import APIRouter,Depends,Query
+from fastapi import APIRouter,Depends,Query,Request,Response
+from pydantic import BaseModel, Field, model_validator
 from handler.sk.tmap_handler import get_tmap_client, TMapClient
-from typing import Annotated
+from core.config import settings
+from core.exceptions import BadRequestException
+from core.responses import FastJSONResponse, passthrough_response
+from shared.utils.simplify import tolerance_for_zoom
+from typing import Annotated, List, Literal, Tuple
 router = APIRouter()
 
 
+class RouteMatrixRequest(BaseModel):
+    origins: List[Tuple[float, float]] = Field(min_length=1, description="출발지 [위도, 경도] 목록")
+    destinations: List[Tuple[float, float]] = Field(min_length=1, description="목적지 [위도, 경도] 목록")
+    search_option: int = Field(default=TMapClient.OPTION_RECOMMENDED, description="경로 탐색 옵션")
+    max_distance_m: float | None = Field(default=None, gt=0,
+                                         description="직선 거리가 이 값을 넘는 쌍은 계산하지 않음 (미터)")
+    nearest_k: int | None = Field(default=None, ge=1,
+                                  description="출발지마다 직선 거리가 가까운 목적지 k개만 계산")
+
+    @model_validator(mode="after")
+    def _check_size(self):
+        if len(self.origins) * len(self.destinations) > settings.TMAP_MATRIX_MAX_PAIRS:
+            raise ValueError(f"출발지 x 목적지 쌍은 최대 {settings.TMAP_MATRIX_MAX_PAIRS}개까지 요청할 수 있습니다.")
+        return self
+
+
+class MultiStopRouteRequest(BaseModel):
+    start: Tuple[float, float] = Field(description="출발지 [위도, 경도]")
+    stops: List[Tuple[float, float]] = Field(min_length=1, max_length=settings.TMAP_MULTI_STOP_MAX_STOPS,
+                                             description="경유지 [위도, 경도] 목록")
+    end: Tuple[float, float] | None = Field(default=None, description="도착지 [위도, 경도]. 없으면 마지막 경유지에서 끝남")
+    search_option: int = Field(default=TMapClient.OPTION_RECOMMENDED, description="경로 탐색 옵션")
+    optimize: bool = Field(default=True, description="방문 순서 최적화 여부 (False면 입력 순서대로 방문)")
+    output_format: Literal["geojson", "polyline"] = Field(default="geojson", description="경로 좌표 형식")
+
 
 @router.post("/pedestrian")
-async def get_pedestrian(start_lat : Annotated[float | None, Query(
+async def get_pedestrian(request: Request,
+    start_lat : Annotated[float | None, Query(
     description="출발지점의 위도입니다.",example=37.5088)],
     start_lng : Annotated[float | None, Query(
     description="출발지점의 경도입니다.",example=127.0632)],
@@ -14,16 +45,116 @@ async def get_pedestrian(start_lat : Annotated[float | None, Query(
     description="도착지점의 위도입니다.",example=37.5088)],
     end_lng : Annotated[float | None, Query(
     description="도착지점의 경도입니다.",example=127.0633)],
+    summary : Annotated[bool, Query(
+    description="True면 GeoJSON 대신 총 거리/소요 시간 요약만 반환합니다.")] = False,
+    cache : Annotated[bool, Query(
+    description="경로 캐시 사용 여부 (약 10m 단위로 스냅한 좌표 기준). 캐시 응답은 단일 LineString + 요약 정보입니다.")] = False,
+    output_format : Annotated[Literal["geojson", "polyline", "binary"], Query(
+    description="응답 형식. geojson: GeoJSON, polyline: Google Encoded Polyline(JSON), "
+                "binary: [경도, 위도, ...] float32 little-endian 배열 (요약 정보는 X-Route-* 헤더)")] = "geojson",
+    tolerance_m : Annotated[float | None, Query(gt=0, le=1000,
+    description="경로 단순화 허용 오차 (미터). 지정하면 Douglas-Peucker로 꼭짓점을 줄입니다.")] = None,
+    zoom : Annotated[float | None, Query(ge=0, le=22,
+    description="지도 줌 레벨. tolerance_m 대신 해당 줌에서 1픽셀 크기를 허용 오차로 사용합니다.")] = None,
     client : TMapClient = Depends(get_tmap_client),):
     """
     SK Map API를 이용하여 출발지점 - 도착지점간의 도보경로를 가져옵니다
+    기본적으로 업스트림 GeoJSON을 디코딩하지 않고 그대로 전달합니다.
+    :param request:
     :param start_lat:
     :param start_lng:
     :param end_lat:
     :param end_lng:
+    :param summary:
+    :param cache:
+    :param output_format:
+    :param tolerance_m:
+    :param zoom:
     :param client:
     :return:
     """
-    return await client.get_pedestrian_route(start_lng,start_lat,end_lng,
-                                             end_lat)
+    if tolerance_m is None and zoom is not None:
+        # 줌 레벨의 픽셀 크기는 위도에 따라 달라지므로 출발지 위도가 필요
+        if start_lat is None:
+            raise BadRequestException(status_code=422, message="zoom을 사용하려면 start_lat이 필요합니다.",
+                                      detail="zoom requires start_lat")
+        tolerance_m = tolerance_for_zoom(zoom, start_lat)
+    if summary and tolerance_m:
+        # 요약 + 단순화된 좌표 (지도 미리보기 등 저해상도 표시용)
+        route = await client.get_route(start_lng, start_lat, end_lng, end_lat, cache=cache, tolerance_m=tolerance_m)
+        return FastJSONResponse({
+            "total_distance_m": route.total_distance_m,
+            "total_time_sec": route.total_time_sec,
+            "points": len(route),
+            "coordinates": route.points(),
+        })
+    if summary:
+        # dataclass 모델을 jsonable_encoder를 거치지 않고 orjson으로 바로 직렬화
+        return FastJSONResponse(await client.get_route_summary((start_lat, start_lng),
+                                                               (end_lat, end_lng),
+                                                               option=TMapClient.OPTION_RECOMMENDED))
+    if output_format != "geojson":
+        route = await client.get_route(start_lng, start_lat, end_lng, end_lat, cache=cache, tolerance_m=tolerance_m)
+        if output_format == "polyline":
+            return FastJSONResponse({
+                "polyline": route.to_polyline(),
+                "points": len(route),
+                "total_distance_m": route.total_distance_m,
+                "total_time_sec": route.total_time_sec,
+            })
+        headers = {"X-Route-Points": str(len(route))}
+        # 요약이 없는 경로는 "None" 대신 헤더를 생략
+        if route.total_distance_m is not None:
+            headers["X-Route-Total-Distance"] = str(route.total_distance_m)
+        if route.total_time_sec is not None:
+            headers["X-Route-Total-Time"] = str(route.total_time_sec)
+        return Response(content=route.to_float32_bytes(), media_type="application/octet-stream", headers=headers)
+    if cache or tolerance_m:
+        route = await client.get_route(start_lng, start_lat, end_lng, end_lat, cache=cache, tolerance_m=tolerance_m)
+        return FastJSONResponse(route.to_geojson())
+    raw = await client.get_pedestrian_route_raw(start_lng,start_lat,end_lng,
+                                                end_lat,
+                                                accept_encoding=request.headers.get("accept-encoding"))
+    return passthrough_response(raw)
+
 
+@router.post("/pedestrian/matrix")
+async def get_pedestrian_matrix(body: RouteMatrixRequest,
+    client : TMapClient = Depends(get_tmap_client),):
+    """
+    출발지 N개 x 목적지 M개의 도보 거리/시간 행렬을 계산합니다
+    결과는 행 우선(row-major) 1차원 배열이며 (i, j) 원소는 i * cols + j 위치에 있습니다
+    status: 0 = 계산됨, 1 = 직선 거리 초과로 건너뜀, 2 = 조회 실패
+    :param body:
+    :param client:
+    :return:
+    """
+    matrix = await client.get_route_matrix(body.origins, body.destinations,
+                                           option=body.search_option,
+                                           max_distance_m=body.max_distance_m,
+                                           nearest_k=body.nearest_k)
+    return FastJSONResponse(matrix)
+
+
+@router.post("/pedestrian/multi-stop")
+async def get_pedestrian_multi_stop(body: MultiStopRouteRequest,
+    client : TMapClient = Depends(get_tmap_client),):
+    """
+    여러 경유지를 도는 도보경로를 방문 순서를 최적화하여 가져옵니다
+    order는 stops의 방문 순서(인덱스)이며, 경유지가 5개를 넘으면 여러 구간으로 나눠 조회한 뒤 이어 붙입니다
+    :param body:
+    :param client:
+    :return:
+    """
+    result = await client.get_multi_stop_route(body.start, body.stops, body.end,
+                                               option=body.search_option, optimize=body.optimize)
+    route = result.route
+    geometry = {"polyline": route.to_polyline()} if body.output_format == "polyline" else {"geojson": route.to_geojson()}
+    return FastJSONResponse({
+        "order": result.order,
+        "legs": result.legs,
+        "estimated_pairs": result.estimated_pairs,
+        "total_distance_m": route.total_distance_m,
+        "total_time_sec": route.total_time_sec,
+        **geometry,
+    })
@@ -113,5 +113,84 @@ class Settings(BaseSettings):
 
     SK_MAP_API_KEY: str = ""
 
+    KAKAO_REST_API_KEY: str = ""
+
+    # 지오코딩 파사드 (handler.geocoder): 제공자 순서 (키가 없는 제공자는 제외), hedge | race, 통계 부족 시 헤지 지연(초)
+    GEOCODE_PROVIDERS: str = "naver,kakao"
+    GEOCODE_RACE_STRATEGY: Literal["hedge", "race"] = "hedge"
+    GEOCODE_HEDGE_DELAY: float = 0.3
+
+    # 외부 API 헤지 요청 (p95 지연 후 같은 요청을 한 번 더 보냄) 사용 여부. 호출량이 늘어나므로 기본 비활성
+    UPSTREAM_HEDGE_ENABLED: bool = False
+
+    # 외부 API 공용 커넥션 풀 설정 (shared.infra.wrapper.aiohttp_wrapper)
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_POOL_LIMIT_PER_HOST: int = 30
+    HTTP_KEEPALIVE_TIMEOUT: float = 30.0
+    HTTP_DNS_CACHE_TTL: int = 300
+    HTTP_REQUEST_TIMEOUT: float = 10.0
+
+    # 지오코딩 영속 캐시 (SQLite, 같은 호스트의 워커가 공유). 경로를 비우면 비활성
+    GEOCODE_CACHE_PATH: str = "data/geocode_cache.sqlite3"
+    GEOCODE_CACHE_TTL: int = 60 * 60 * 24 * 30
+    # 검색 결과가 없는 주소는 짧게 보관
+    GEOCODE_CACHE_NEGATIVE_TTL: int = 60 * 60 * 24
+    # 만료된 캐시 엔트리를 파일에서 삭제하는 주기(초)
+    GEOCODE_CACHE_PURGE_INTERVAL: int = 60 * 60
+
+    # 오프라인 주소 사전 (shared.utils.address_dictionary build로 만든 파일). 비우면 사용하지 않음
+    ADDRESS_DICTIONARY_PATH: str = ""
+    # 사전에 없어 네이버로 조회한 주소를 기록하는 CSV (사전을 다시 만들 때 입력으로 사용). 비우면 기록하지 않음
+    ADDRESS_DICTIONARY_OVERLAY_PATH: str = ""
+
+    # 행정구역 경계 GeoJSON (시/군/구, 읍/면/동 폴리곤). 설정하면 get_address가 오프라인으로 지역 명칭을 찾음
+    REGION_BOUNDARY_PATH: str = ""
+
+    # 배치 지오코딩 (POST /naver/geocode/batch): 요청당 최대 주소 수, 동시 조회 수
+    GEOCODE_BATCH_MAX_SIZE: int = 100
+    GEOCODE_BATCH_CONCURRENCY: int = 8
+    # 배치 역지오코딩 (POST /naver/reverse-geocode/batch)
+    REVERSE_GEOCODE_BATCH_MAX_SIZE: int = 5000
+    REVERSE_GEOCODE_BATCH_CONCURRENCY: int = 16
+    # 대용량 주소 파일 일괄 지오코딩 작업 (POST /geocode/jobs): 작업 디렉터리(입력/결과/체크포인트), 청크 크기,
+    # 동시 조회 수, 동시에 실행할 작업 수, 작업 내 중복 주소 결과를 기억할 개수, 업로드 최대 크기(바이트)
+    GEOCODE_JOB_DIR: str = "data/geocode_jobs"
+    GEOCODE_JOB_CHUNK_SIZE: int = 200
+    GEOCODE_JOB_CONCURRENCY: int = 8
+    GEOCODE_JOB_MAX_RUNNING: int = 2
+    GEOCODE_JOB_DEDUPE_ENTRIES: int = 50_000
+    GEOCODE_JOB_MAX_UPLOAD_BYTES: int = 1 << 30
+
+    # 보행 경로 행렬 (POST /sk/pedestrian/matrix): 최대 쌍 수, 동시 요청 수, 직선 거리 기준
+    TMAP_MATRIX_MAX_PAIRS: int = 400
+    TMAP_MATRIX_CONCURRENCY: int = 8
+    TMAP_MATRIX_MAX_DISTANCE_M: float = 5000.0
+
+    # 다중 경유지 보행 경로 (POST /sk/pedestrian/multi-stop): 최대 경유지 수
+    TMAP_MULTI_STOP_MAX_STOPS: int = 30
+
+    # 보행 경로(좌표 포함) 캐시 메모리 한도. 공유 응답 캐시와 별도로 관리
+    TMAP_ROUTE_CACHE_MAX_ENTRIES: int = 5000
+    TMAP_ROUTE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # 지역 검색 검색어 캐시 (정규화한 검색어 기준)
+    NAVER_SEARCH_QUERY_CACHE_TTL: int = 60 * 60 * 6
+    NAVER_SEARCH_QUERY_CACHE_MAX_ENTRIES: int = 10000
+    NAVER_SEARCH_QUERY_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+    # 지역 검색 스트리밍 (GET /naver/search/local/stream): 동시 페이지 요청 수, start 파라미터 최댓값
+    NAVER_SEARCH_STREAM_CONCURRENCY: int = 4
+    NAVER_SEARCH_MAX_START: int = 1000
+    NAVER_SEARCH_STREAM_MAX_RESULTS: int = 200
+
+    # 지역 검색 결과로 만드는 장소 색인 (GET /naver/places/nearby). 경로를 비우면 메모리에만 보관
+    PLACE_INDEX_PATH: str = "data/place_index.json"
+    # 이보다 오래 전에 수집한 업체는 근처 검색에서 제외하고 색인에서 삭제 (다시 검색되면 갱신)
+    PLACE_INDEX_MAX_AGE: int = 60 * 60 * 24 * 7
+    # 색인에 보관할 최대 업체 수. 넘으면 오래 전에 수집한 업체부터 삭제
+    PLACE_INDEX_MAX_PLACES: int = 200_000
+    # 색인에서 찾은 업체가 이보다 적으면 지역 검색 API를 호출해 보충
+    PLACE_INDEX_MIN_RESULTS: int = 5
+
 
 settings = Settings()  # type: ignore
@@ -1,5 +1,6 @@
 from starlette.types import ASGIApp, Scope, Receive, Send
 from fastapi import Request
+from starlette.responses import JSONResponse
 from core.exceptions import AppBaseException
 from shared.utils.logger.context import trace_id_var
 from shared.utils.logger.root import log
@@ -39,4 +40,48 @@ class TraceIDMiddleWare:
         try:
             await self.app(scope, receive, send)
         finally:
-            trace_id_var.reset(token)
\ No newline at end of file
+            trace_id_var.reset(token)
+
+# 로그에 남길 요청 바디 최대 크기. 이보다 크거나 크기를 알 수 없는(chunked) 바디는 읽지 않고 그대로 스트리밍
+LOG_BODY_MAX_BYTES = 64 * 1024
+# 파일 업로드 경로 (일괄 지오코딩 작업 등). 바디가 수백 MB일 수 있으므로 Content-Type과 관계없이 읽지 않음
+STREAMING_UPLOAD_PATHS = ("/geocode/jobs",)
+
+
+def should_capture_body(request: Request) -> bool:
+    if request.url.path.rstrip("/").endswith(STREAMING_UPLOAD_PATHS):
+        return False
+    length = request.headers.get("content-length")
+    return length is not None and length.isdigit() and int(length) <= LOG_BODY_MAX_BYTES
+
+
+async def request_log_middleware(request: Request, call_next):
+    trace_id = str(uuid.uuid4())
+    trace_token = trace_id_var.set(trace_id)
+
+    # 1. 요청 바디 읽기
+    decoded_body = {}
+    if should_capture_body(request):
+        body = await request.body()
+        # 2. 바디 내용을 로그에 출력 (UTF-8이 아닌 바디(CP949 등)도 실패하지 않도록 대체 문자로 디코딩)
+        if body:
+            decoded_body = body.decode('utf-8', errors='replace')
+
+        # 3. 중요: 소비된 스트림을 재설정 (다음 미들웨어나 엔드포인트에서 읽을 수 있도록)
+        async def receive():
+            return {"type": "http.request", "body": body}
+
+        # request 객체의 _receive를 가로챔
+        request._receive = receive
+
+    try:
+        response = await call_next(request)
+        return response
+    except Exception as e:
+        log.error(f"에러 발생 [ID: {trace_id}]: {str(e)}",extra={"body":decoded_body})
+        return JSONResponse(
+            status_code=500,
+            content={"message": "Internal Server Error", "code": 99},
+        )
+    finally:
+        trace_id_var.reset(trace_token)
@@ -0,0 +1,35 @@
+from array import array
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+
+from handler.base import RawBody
+
+
+def _default(obj: Any) -> Any:
+    # 압축 좌표 배열(array.array) 등 orjson이 직접 지원하지 않는 타입
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson으로 직렬화하는 JSON 응답 (앱 기본 응답 클래스).
+    dataclass(slots) 모델, datetime, numpy 배열을 별도 변환 없이 바로 직렬화합니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def passthrough_response(raw: RawBody) -> Response:
+    """
+    업스트림 원본 바이트를 그대로 응답합니다. (JSON decode -> re-encode 생략)
+    업스트림이 압축해서 보낸 경우 Content-Encoding을 유지하여 압축된 바이트를 그대로 전달합니다.
+    """
+    headers = {"Vary": "Accept-Encoding"}
+    if raw.content_encoding:
+        headers["Content-Encoding"] = raw.content_encoding
+    return Response(content=raw.content, media_type=raw.content_type, headers=headers)
@@ -1,8 +1,95 @@
 import aiohttp
 import asyncio
-from typing import Any, Dict, Optional
-import ssl
-import certifi
+import orjson
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+from shared.infra.wrapper.aiohttp_wrapper import AioHttpClient, aiohttp_client
+from shared.infra.wrapper.concurrency_limiter import BulkheadFullError, get_bulkhead
+from shared.infra.wrapper.resilience import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+    HedgePolicy,
+    LatencyTracker,
+    RetryPolicy,
+)
+from shared.infra.wrapper.response_cache import CachePolicy, CacheableResponse, ResponseCache, response_cache
+from shared.infra.wrapper.singleflight import SingleFlight, make_request_key
+from shared.utils.json_projection import JsonProjection, PathItem
+
+# 응답 본문을 읽어 (값, 읽은 바이트 수)를 반환하는 함수
+ResponseReader = Callable[[aiohttp.ClientResponse], Awaitable[Tuple[Any, int]]]
+
+
+async def read_json(response: aiohttp.ClientResponse) -> Tuple[Any, int]:
+    """본문 전체를 bytes로 읽어 orjson으로 디코딩 (기본 reader)"""
+    raw_bytes = await response.read()
+    return (orjson.loads(raw_bytes) if raw_bytes else None), len(raw_bytes)
+
+
+@dataclass
+class RawBody:
+    """디코딩하지 않은 업스트림 응답 본문 (Passthrough용)"""
+    content: bytes
+    content_type: str
+    content_encoding: Optional[str] = None
+
+
+async def read_raw(response: aiohttp.ClientResponse) -> Tuple[RawBody, int]:
+    """
+    본문을 디코딩하지 않고 그대로 읽는 reader.
+    auto_decompress=False로 요청한 경우 압축된 바이트를 그대로 보존합니다.
+    """
+    content = await response.read()
+    return RawBody(
+        content=content,
+        content_type=response.headers.get("Content-Type", "application/json"),
+        content_encoding=response.headers.get("Content-Encoding")
+    ), len(content)
+
+
+_model_readers: Dict[Callable[[bytes], Any], ResponseReader] = {}
+
+
+def model_reader(model: Callable[[bytes], Any]) -> ResponseReader:
+    """
+    본문 bytes를 중간 dict 없이 바로 타입 모델로 변환하는 reader.
+    model은 bytes를 받아 객체를 반환하는 callable (예: GeocodeResponse.from_json) 입니다.
+    같은 model에는 같은 reader를 반환하므로 singleflight/캐시 키가 안정적으로 유지됩니다.
+    """
+    reader = _model_readers.get(model)
+    if reader is None:
+        async def reader(response: aiohttp.ClientResponse) -> Tuple[Any, int]:
+            raw_bytes = await response.read()
+            return (model(raw_bytes) if raw_bytes else None), len(raw_bytes)
+
+        _model_readers[model] = reader
+    return reader
+
+
+def projection_reader(
+        path: Sequence[PathItem],
+        max_matches: Optional[int] = None,
+        chunk_size: int = 64 * 1024
+) -> ResponseReader:
+    """
+    본문을 청크 단위로 읽으며 path에 해당하는 값만 디코딩하는 reader.
+    필요한 값을 찾은 뒤 남은 본문은 디코딩 없이 비우기만 하여 커넥션을 풀에 돌려줍니다.
+    """
+
+    async def read(response: aiohttp.ClientResponse) -> Tuple[List[Any], int]:
+        projection = JsonProjection(path, max_matches)
+        size = 0
+        async for chunk in response.content.iter_chunked(chunk_size):
+            size += len(chunk)
+            if not projection.done:
+                projection.feed(chunk)
+        return projection.results, size
+
+    return read
 
 
 class ExternalAPIError(Exception):
@@ -16,39 +103,291 @@ class ExternalAPIError(Exception):
 
 
 class BaseClient:
-    def __init__(self, base_url: str):
-        self.base_url = base_url
-        self._session: Optional[aiohttp.ClientSession] = None
+    """
+    외부 API 클라이언트 공통 베이스.
+    세션을 직접 만들지 않고 공유 전송 계층(AioHttpClient)의 커넥션 풀을 사용합니다.
+    풀의 생성/종료는 main.lifespan에서 관리됩니다.
+    """
+
+    # 업스트림별 기본 캐시 정책. 호출 시 cache=True로 opt-in 한 GET 요청에만 적용됩니다.
+    cache_policy: Optional[CachePolicy] = None
+    # 벌크헤드(적응형 동시성 제한) 이름. 지정하지 않으면 base_url의 호스트명을 사용합니다.
+    upstream: Optional[str] = None
+    # 장애 대응 정책 (None이면 비활성). 재시도/헤지는 멱등 요청에만 적용됩니다.
+    # 헤지는 업스트림 호출량(유료 API 쿼터)을 늘리므로 기본 비활성. 하위 클래스는 UPSTREAM_HEDGE_ENABLED로 켭니다.
+    retry_policy: Optional[RetryPolicy] = RetryPolicy()
+    circuit_breaker_policy: Optional[CircuitBreakerPolicy] = CircuitBreakerPolicy()
+    hedge_policy: Optional[HedgePolicy] = None
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+            self,
+            base_url: str,
+            http_client: Optional[AioHttpClient] = None,
+            cache: Optional[ResponseCache] = None
+    ):
+        self.base_url = base_url.rstrip("/")
+        self._http_client = http_client or aiohttp_client
+        self._cache = cache if cache is not None else response_cache
+        self._singleflight = SingleFlight()
+        self._bulkhead = get_bulkhead(self.upstream or urlsplit(self.base_url).hostname)
+        self._circuit_breaker = (
+            CircuitBreaker(self.base_url, self.circuit_breaker_policy) if self.circuit_breaker_policy else None
+        )
+        self._latency = LatencyTracker()
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            #SSL 컨텍스트 생성: certifi의 인증서 번들을 사용하도록 설정
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
+        return await self._http_client.get_session()
+
+    def _build_url(self, endpoint: str) -> str:
+        return f"{self.base_url}{endpoint}"
+
+    def _resolve_cache_policy(self, cache: Union[bool, CachePolicy, None]) -> Optional[CachePolicy]:
+        if isinstance(cache, CachePolicy):
+            return cache
+        return self.cache_policy if cache else None
 
-            #TCPConnector에 ssl_context 주입
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
+    async def request(
+            self,
+            method: str,
+            endpoint: str,
+            coalesce: bool = True,
+            cache: Union[bool, CachePolicy] = False,
+            idempotent: Optional[bool] = None,
+            reader: ResponseReader = read_json,
+            **kwargs
+    ) -> Dict[str, Any]:
+        """
+        외부 API를 호출하고 JSON 응답을 반환합니다.
 
-            self._session = aiohttp.ClientSession(
-                base_url=self.base_url,
-                timeout=aiohttp.ClientTimeout(total=10),
-                connector=connector  # 커넥터 적용
+        Args:
+            method (str): HTTP 메서드
+            endpoint (str): base_url 이하 경로
+            coalesce (bool): 동일 GET 요청(메서드/URL/파라미터/헤더)을 하나의 호출로 합칠지 여부
+            cache (bool | CachePolicy): GET 응답 캐시 사용 여부.
+                True면 클라이언트의 cache_policy를, CachePolicy를 주면 해당 정책을 사용합니다.
+            idempotent (bool, optional): 재시도/헤지 허용 여부. 지정하지 않으면 HTTP 메서드로 판단합니다.
+                (조회성 POST 등은 True로 지정)
+            reader (ResponseReader): 응답 본문을 읽는 함수 (기본: JSON 디코딩)
+        """
+        method = method.upper()
+        url = self._build_url(endpoint)
+        kwargs["idempotent"] = method in self.IDEMPOTENT_METHODS if idempotent is None else idempotent
+        kwargs["reader"] = reader
+        if method != "GET":
+            return (await self._execute(method, url, **kwargs)).value
+
+        # reader가 다르면 결과 형태가 다르므로 (디코딩된 dict vs 원본 bytes) 키에 포함
+        key = (make_request_key(method, url, kwargs.get("params"), kwargs.get("headers")), reader)
+        policy = self._resolve_cache_policy(cache)
+        if policy is not None:
+            return await self._cache.fetch(
+                key, policy, lambda etag: self._load(method, url, key, coalesce, etag, **kwargs)
             )
-        return self._session
+        return (await self._load(method, url, key, coalesce, **kwargs)).value
+
+    async def request_raw(
+            self,
+            method: str,
+            endpoint: str,
+            accept_encoding: Optional[str] = None,
+            **kwargs
+    ) -> RawBody:
+        """
+        [Passthrough] 응답 본문을 디코딩/재인코딩하지 않고 원본 바이트 그대로 반환합니다.
+        accept_encoding을 주면 업스트림 압축(gzip 등)을 풀지 않고 그대로 전달합니다.
+        (클라이언트가 보낸 Accept-Encoding을 그대로 넘겨야 함)
+
+        coalesce/cache/idempotent 등 나머지 옵션은 request()와 동일합니다.
+        """
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["Accept-Encoding"] = accept_encoding or "identity"
+        return await self.request(
+            method,
+            endpoint,
+            headers=headers,
+            reader=read_raw,
+            auto_decompress=False,
+            **kwargs
+        )
+
+    async def request_projection(
+            self,
+            method: str,
+            endpoint: str,
+            path: Sequence[PathItem],
+            max_matches: Optional[int] = None,
+            idempotent: Optional[bool] = None,
+            **kwargs
+    ) -> List[Any]:
+        """
+        응답 JSON 전체를 객체로 만들지 않고 path에 해당하는 값만 스트리밍으로 추출합니다.
+        (예: ("features", 0, "properties"), ("features", "*", "geometry"))
+
+        재시도/서킷 브레이커/헤지/벌크헤드는 request()와 동일하게 적용되며 응답 캐시는 사용하지 않습니다.
+        """
+        method = method.upper()
+        kwargs["idempotent"] = method in self.IDEMPOTENT_METHODS if idempotent is None else idempotent
+        kwargs["reader"] = projection_reader(path, max_matches)
+        return (await self._execute(method, self._build_url(endpoint), **kwargs)).value
+
+    async def _fetch_cached(
+            self,
+            key: Hashable,
+            load: Callable[[], Awaitable[Any]],
+            size_of: Callable[[Any], int],
+            policy: Optional[CachePolicy] = None,
+            cache: Optional[ResponseCache] = None
+    ) -> Any:
+        """
+        HTTP 요청 키가 아닌 임의의 키(공간 셀, 좌표 쌍 등)로 응답 캐시를 조회합니다.
+        캐시가 비어 있으면 load()의 결과를 해당 키의 값으로 저장하며,
+        같은 키의 동시 miss는 한 번의 호출로 합칩니다.
+
+        Args:
+            key: 캐시 키
+            load: 값을 만드는 코루틴 함수 (보통 request() 호출)
+            size_of: 값의 대략적인 메모리 크기(바이트)
+            policy: 캐시 정책 (기본: 클라이언트의 cache_policy)
+            cache: 사용할 캐시 (기본: 공유 응답 캐시). 큰 값을 별도 메모리 한도로 관리할 때 지정
+        """
+        async def loader(_etag: Optional[str]) -> CacheableResponse:
+            value = await self._singleflight.do(key, load)
+            return CacheableResponse(status=200, value=value, size=size_of(value))
+
+        return await (cache if cache is not None else self._cache).fetch(key, policy or self.cache_policy, loader)
+
+    async def _load(
+            self,
+            method: str,
+            url: str,
+            key: Hashable,
+            coalesce: bool,
+            etag: Optional[str] = None,
+            **kwargs
+    ) -> CacheableResponse:
+        if etag:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "If-None-Match": etag}
+        if coalesce:
+            return await self._singleflight.do((key, etag), lambda: self._execute(method, url, **kwargs))
+        return await self._execute(method, url, **kwargs)
+
+    async def _execute(self, method: str, url: str, idempotent: bool, **kwargs) -> CacheableResponse:
+        """서킷 브레이커 + 재시도(지수 백오프, 지터) + 헤지를 적용하여 요청합니다."""
+        retry = self.retry_policy if idempotent else None
+        attempts = retry.max_attempts if retry else 1
+
+        for attempt in range(attempts):
+            if self._circuit_breaker:
+                try:
+                    self._circuit_breaker.before_call()
+                except CircuitOpenError as e:
+                    raise ExternalAPIError(self.base_url, 503, str(e))
+            try:
+                if idempotent and self.hedge_policy:
+                    response = await self._send_hedged(method, url, **kwargs)
+                else:
+                    response = await self._send_timed(method, url, **kwargs)
+            except ExternalAPIError as e:
+                self._record_outcome(e.status_code)
+                if retry and attempt + 1 < attempts and e.status_code in retry.retry_statuses:
+                    await asyncio.sleep(retry.backoff(attempt))
+                    continue
+                raise
+            except asyncio.CancelledError:
+                # 호출자 취소: HALF_OPEN 시험 슬롯을 점유한 채 남지 않도록 결과 없이 반납
+                if self._circuit_breaker:
+                    self._circuit_breaker.cancel_call()
+                raise
+            except Exception:
+                # 분류되지 않은 예외(reader의 디코딩 오류 등)도 결과를 기록해야 HALF_OPEN 시험 슬롯이 남지 않음
+                if self._circuit_breaker:
+                    self._circuit_breaker.record_failure()
+                raise
+            self._record_outcome(response.status)
+            return response
+
+    def _record_outcome(self, status_code: int) -> None:
+        if not self._circuit_breaker:
+            return
+        # 4xx(408/429 제외)는 요청 자체의 문제이므로 업스트림 장애로 보지 않음
+        if status_code in (408, 429) or status_code >= 500:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
+
+    async def _send_timed(self, method: str, url: str, **kwargs) -> CacheableResponse:
+        started = time.monotonic()
+        response = await self._send(method, url, **kwargs)
+        self._latency.record(time.monotonic() - started)
+        return response
+
+    async def _send_hedged(self, method: str, url: str, **kwargs) -> CacheableResponse:
+        """
+        p95 기반 지연 후에도 응답이 없으면 동일 요청을 하나 더 보내고 먼저 성공한 응답을 사용합니다.
+        남은 요청은 취소합니다.
+        """
+        delay = self._latency.hedge_delay(self.hedge_policy)
+        primary = asyncio.ensure_future(self._send_timed(method, url, **kwargs))
+        if delay is None:
+            return await primary
+
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+            pending.add(asyncio.ensure_future(self._send_timed(method, url, **kwargs)))
 
-    async def request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
 
+    async def _send(
+            self,
+            method: str,
+            url: str,
+            reader: ResponseReader = read_json,
+            **kwargs
+    ) -> CacheableResponse:
         session = await self._get_session()
         try:
-            async with session.request(method, endpoint, **kwargs) as response:
-                if response.status >= 400:
-                    error_detail = await response.text()
-                    raise ExternalAPIError(self.base_url, response.status, error_detail)
-                return await response.json()
+            # 업스트림별 벌크헤드: 한 업스트림이 느려져도 다른 업스트림의 커넥션을 잠식하지 않도록 제한
+            async with self._bulkhead.slot() as permit:
+                async with session.request(method, url, **kwargs) as response:
+                    permit.status = response.status
+                    if response.status == 304:
+                        return CacheableResponse(status=304, value=None)
+                    if response.status >= 400:
+                        error_detail = await response.text()
+                        raise ExternalAPIError(self.base_url, response.status, error_detail)
+                    value, size = await reader(response)
+                    return CacheableResponse(
+                        status=response.status,
+                        value=value,
+                        size=size,
+                        etag=response.headers.get("ETag"),
+                        cache_control=response.headers.get("Cache-Control")
+                    )
+        except BulkheadFullError as e:
+            raise ExternalAPIError(self.base_url, 503, str(e))
+        except ValueError as e:
+            # orjson.JSONDecodeError, UnicodeDecodeError, 모델 변환 오류 등 본문을 해석할 수 없는 응답
+            raise ExternalAPIError(self.base_url, 502, f"Invalid response: {e}")
         except asyncio.TimeoutError:
             raise ExternalAPIError(self.base_url, 408, "Request Timeout")
         except aiohttp.ClientError as e:
             raise ExternalAPIError(self.base_url, 500, str(e))
 
     async def close(self):
-        if self._session and not self._session.closed:
-            await self._session.close()
\ No newline at end of file
+        # 커넥션 풀은 공유 자원이므로 개별 클라이언트에서 닫지 않습니다. (lifespan에서 종료)
+        pass
@@ -0,0 +1,187 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Literal, Optional, Tuple
+
+from handler.kakao.local_handler import kakao_local_client
+from handler.naver.map_handler import naver_map_client
+from shared.infra.wrapper.resilience import HedgePolicy, LatencyTracker
+from shared.utils.logger.root import log
+from core.config import settings
+from core.exceptions import ExternalAPIError
+
+# 주소 -> (위도, 경도). 결과가 없으면 None, 호출 실패는 예외
+Provider = Callable[[str], Awaitable[Optional[Tuple[float, float]]]]
+
+
+@dataclass(slots=True)
+class GeocodeMatch:
+    lat: float
+    lng: float
+    provider: str
+    elapsed_ms: float
+
+
+@dataclass
+class ProviderStats:
+    """제공자별 호출 결과와 최근 지연 시간. 취소된 호출(다른 제공자가 먼저 응답)은 지연/품질에 반영하지 않음"""
+    name: str
+    latency: LatencyTracker = field(default_factory=LatencyTracker)
+    successes: int = 0
+    empties: int = 0  # 정상 응답이지만 결과 없음
+    failures: int = 0
+    wins: int = 0
+    cancelled: int = 0
+
+    @property
+    def completed(self) -> int:
+        return self.successes + self.empties + self.failures
+
+    def score(self) -> float:
+        """기대 비용(초): 중앙값 지연 / 결과를 찾은 비율. 작을수록 먼저 호출"""
+        success_rate = self.successes / self.completed if self.completed else 0.0
+        return (self.latency.quantile(0.5) or 0.0) / max(success_rate, 0.05)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "successes": self.successes,
+            "empties": self.empties,
+            "failures": self.failures,
+            "wins": self.wins,
+            "cancelled": self.cancelled,
+            "p50_ms": round((self.latency.quantile(0.5) or 0.0) * 1000, 2),
+            "p95_ms": round((self.latency.quantile(0.95) or 0.0) * 1000, 2),
+            "score": round(self.score(), 4),
+        }
+
+
+class RacingGeocoder:
+    """
+    여러 지오코딩 제공자(네이버, 카카오 등)를 하나로 묶은 파사드.
+
+    - hedge: 점수(score)가 가장 좋은 제공자를 먼저 호출하고, 그 제공자의 p95 지연(HedgePolicy)만큼 응답이 없으면
+      다음 제공자를 추가로 호출합니다. 실패/결과 없음이면 기다리지 않고 바로 다음 제공자를 호출합니다.
+    - race: 모든 제공자를 동시에 호출합니다.
+
+    먼저 도착한 "좌표가 있는" 응답을 사용하고 나머지 호출은 취소합니다.
+    샘플이 min_samples개 미만인 제공자는 설정 순서를 따르며, 헤지/장애 전환 호출로 통계가 쌓입니다.
+    """
+
+    def __init__(
+            self,
+            providers: Dict[str, Provider],
+            strategy: Literal["hedge", "race"] = "hedge",
+            hedge_policy: HedgePolicy = HedgePolicy(),
+            default_hedge_delay: float = 0.3,
+            clock: Callable[[], float] = time.perf_counter
+    ):
+        self.providers = providers
+        self.strategy = strategy
+        self.hedge_policy = hedge_policy
+        self.default_hedge_delay = default_hedge_delay
+        self._clock = clock
+        self.stats: Dict[str, ProviderStats] = {name: ProviderStats(name) for name in providers}
+
+    def ranked(self) -> List[str]:
+        """호출 순서: 통계가 충분한 제공자는 점수 순, 나머지는 설정 순서대로 뒤에"""
+        names = list(self.providers)
+        measured = [n for n in names if self.stats[n].completed >= self.hedge_policy.min_samples]
+        measured.sort(key=lambda n: self.stats[n].score())
+        return measured + [n for n in names if n not in measured]
+
+    def _hedge_delay(self, name: str) -> float:
+        delay = self.stats[name].latency.hedge_delay(self.hedge_policy)
+        return self.default_hedge_delay if delay is None else delay
+
+    async def _call(self, name: str, address: str) -> Optional[Tuple[float, float]]:
+        stats = self.stats[name]
+        started = self._clock()
+        try:
+            coords = await self.providers[name](address)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            stats.failures += 1
+            raise
+        stats.latency.record(self._clock() - started)
+        if coords is None:
+            stats.empties += 1
+        else:
+            stats.successes += 1
+        return coords
+
+    async def geocode(self, address: str) -> Optional[GeocodeMatch]:
+        """
+        주소를 좌표로 변환합니다. 모든 제공자가 결과 없음이면 None,
+        결과 없이 모두 실패하면 ExternalAPIError를 발생시킵니다.
+        """
+        order = self.ranked()
+        started = self._clock()
+        pending: Dict[asyncio.Task, str] = {}
+        errors: List[Exception] = []
+        launched = 0
+
+        def launch() -> None:
+            nonlocal launched
+            name = order[launched]
+            launched += 1
+            pending[asyncio.ensure_future(self._call(name, address))] = name
+
+        launch()
+        while self.strategy == "race" and launched < len(order):
+            launch()
+
+        try:
+            while pending:
+                timeout = self._hedge_delay(order[0]) if launched < len(order) else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # 헤지: 선두 제공자가 느리면 다음 제공자도 호출
+                    launch()
+                    continue
+                for task in done:
+                    name = pending.pop(task)
+                    try:
+                        coords = task.result()
+                    except Exception as e:
+                        log.warning(f"지오코딩 제공자 {name} 실패: {e}")
+                        errors.append(e)
+                        coords = None
+                    if coords is not None:
+                        self.stats[name].wins += 1
+                        return GeocodeMatch(coords[0], coords[1], name, round((self._clock() - started) * 1000, 2))
+                    if launched < len(order):
+                        # 장애 전환: 실패/결과 없음이면 기다리지 않고 다음 제공자 호출
+                        launch()
+        finally:
+            for task, name in pending.items():
+                task.cancel()
+                self.stats[name].cancelled += 1
+
+        if errors and len(errors) == len(order):
+            raise ExternalAPIError(
+                service_name="Geocoding",
+                status_code=502,
+                detail=f"모든 지오코딩 제공자 호출 실패: {'; '.join(str(e) for e in errors)}"
+            )
+        return None
+
+
+def _configured_providers() -> Dict[str, Provider]:
+    available: Dict[str, Provider] = {"naver": naver_map_client.get_coordinates}
+    if settings.KAKAO_REST_API_KEY:
+        available["kakao"] = kakao_local_client.get_coordinates
+    names = [n.strip() for n in settings.GEOCODE_PROVIDERS.split(",") if n.strip() in available]
+    return {name: available[name] for name in names} or {"naver": naver_map_client.get_coordinates}
+
+
+# 싱글톤 인스턴스
+geocoder = RacingGeocoder(
+    _configured_providers(),
+    strategy=settings.GEOCODE_RACE_STRATEGY,
+    default_hedge_delay=settings.GEOCODE_HEDGE_DELAY
+)
+
+
+def get_geocoder() -> RacingGeocoder:
+    return geocoder
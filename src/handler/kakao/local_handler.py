@@ -0,0 +1,106 @@
+from typing import Optional, Tuple
+
+from handler.base import BaseClient, model_reader
+from handler.kakao.models import KakaoAddressResponse, KakaoRegionResponse
+from shared.infra.wrapper.resilience import HedgePolicy
+from shared.infra.wrapper.response_cache import CachePolicy
+from core.config import settings
+from core.exceptions import ExternalAPIError
+
+
+class KakaoLocalClient(BaseClient):
+    """
+    카카오 로컬 API 연동 클라이언트.
+    주소 검색(주소 -> 좌표)과 좌표 -> 행정구역 변환을 제공합니다.
+    """
+
+    ADDRESS_ENDPOINT = "/v2/local/search/address.json"
+    REGION_ENDPOINT = "/v2/local/geo/coord2regioncode.json"
+
+    # 주소-좌표 매핑은 거의 변하지 않으므로 NaverMapClient와 같은 정책 사용
+    cache_policy = CachePolicy(ttl=60 * 60 * 24, stale_while_revalidate=60 * 60)
+    upstream = "kakao-local"
+    hedge_policy = HedgePolicy() if settings.UPSTREAM_HEDGE_ENABLED else None
+
+    def __init__(self):
+        super().__init__(base_url="https://dapi.kakao.com")
+        self.headers = {
+            "Authorization": f"KakaoAK {settings.KAKAO_REST_API_KEY}",
+            "Accept": "application/json"
+        }
+
+    async def search_address(
+            self,
+            query: str,
+            page: int = 1,
+            size: int = 10,
+            analyze_type: str = "similar",
+            cache: bool = False
+    ) -> KakaoAddressResponse:
+        """
+        [주소 검색] 주소 문자열을 좌표로 변환합니다.
+
+        Args:
+            query (str): 검색할 주소 (예: "경기도 성남시 분당구 판교역로 166")
+            page (int): 결과 페이지 번호 (1~45)
+            size (int): 한 페이지의 결과 수 (1~30)
+            analyze_type (str): similar(입력과 비슷한 주소까지), exact(정확히 일치하는 주소만)
+            cache (bool): 응답 캐시 사용 여부
+        """
+        result = await self.request(
+            "GET",
+            self.ADDRESS_ENDPOINT,
+            params={"query": query, "page": page, "size": size, "analyze_type": analyze_type},
+            headers=self.headers,
+            cache=cache,
+            reader=model_reader(KakaoAddressResponse.from_json)
+        )
+        return result or KakaoAddressResponse(total_count=0)
+
+    async def coord_to_region(self, lat: float, lng: float, cache: bool = False) -> KakaoRegionResponse:
+        """[좌표 -> 행정구역] 법정동(B)/행정동(H) 정보를 반환합니다."""
+        result = await self.request(
+            "GET",
+            self.REGION_ENDPOINT,
+            params={"x": lng, "y": lat},
+            headers=self.headers,
+            cache=cache,
+            reader=model_reader(KakaoRegionResponse.from_json)
+        )
+        return result or KakaoRegionResponse()
+
+    async def get_coordinates(self, address: str) -> Optional[Tuple[float, float]]:
+        """
+        주소를 받아 (위도, 경도)를 반환하는 편의 메서드
+        """
+        try:
+            first = (await self.search_address(address, size=1, cache=True)).first
+            return (first.lat, first.lng) if first is not None else None
+        except Exception as e:
+            raise ExternalAPIError(
+                service_name="Kakao Local API",
+                status_code=500,
+                detail=f"좌표 변환 중 오류: {str(e)}"
+            )
+
+    async def get_address(self, lat: float, lng: float) -> Optional[str]:
+        """
+        위경도 좌표를 받아 지역 명칭(예: "서울특별시 강남구 역삼동")을 반환하는 편의 메서드
+        """
+        try:
+            region = (await self.coord_to_region(lat, lng, cache=True)).legal()
+            return region.to_address() if region is not None else None
+        except Exception as e:
+            raise ExternalAPIError(
+                service_name="Kakao Local API",
+                status_code=500,
+                detail=f"주소 변환 중 오류: {str(e)}"
+            )
+
+
+# 싱글톤 인스턴스
+kakao_local_client = KakaoLocalClient()
+
+
+def get_kakao_local_client() -> KakaoLocalClient:
+    return kakao_local_client
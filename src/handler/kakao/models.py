@@ -0,0 +1,99 @@
+"""
+카카오 로컬 API 응답용 경량 타입 모델 (handler.naver.models와 같은 방식).
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+
+@dataclass(slots=True)
+class KakaoAddress:
+    address_name: str  # 요청 주소와 매칭된 전체 주소 (지번 또는 도로명)
+    address_type: str  # REGION, ROAD, REGION_ADDR, ROAD_ADDR
+    road_address: str
+    jibun_address: str
+    x: float  # 경도(lng)
+    y: float  # 위도(lat)
+
+    @property
+    def lat(self) -> float:
+        return self.y
+
+    @property
+    def lng(self) -> float:
+        return self.x
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KakaoAddress":
+        return cls(
+            address_name=data.get("address_name", ""),
+            address_type=data.get("address_type", ""),
+            road_address=(data.get("road_address") or {}).get("address_name", ""),
+            jibun_address=(data.get("address") or {}).get("address_name", ""),
+            x=float(data.get("x") or 0.0),
+            y=float(data.get("y") or 0.0)
+        )
+
+
+@dataclass(slots=True)
+class KakaoAddressResponse:
+    total_count: int
+    documents: List[KakaoAddress] = field(default_factory=list)
+
+    @property
+    def first(self) -> Optional[KakaoAddress]:
+        return self.documents[0] if self.documents else None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KakaoAddressResponse":
+        return cls(
+            total_count=int((data.get("meta") or {}).get("total_count", 0)),
+            documents=[KakaoAddress.from_dict(d) for d in data.get("documents") or []]
+        )
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> "KakaoAddressResponse":
+        return cls.from_dict(orjson.loads(raw))
+
+
+@dataclass(slots=True)
+class KakaoRegion:
+    region_type: str  # B: 법정동, H: 행정동
+    code: str
+    area1: str = ""  # 시/도
+    area2: str = ""  # 시/군/구
+    area3: str = ""  # 읍/면/동
+    area4: str = ""  # 리
+
+    def to_address(self) -> str:
+        """예: "서울특별시 강남구 역삼동" """
+        return " ".join(p for p in (self.area1, self.area2, self.area3, self.area4) if p).strip()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KakaoRegion":
+        return cls(
+            region_type=data.get("region_type", ""),
+            code=data.get("code", ""),
+            area1=data.get("region_1depth_name", ""),
+            area2=data.get("region_2depth_name", ""),
+            area3=data.get("region_3depth_name", ""),
+            area4=data.get("region_4depth_name", "")
+        )
+
+
+@dataclass(slots=True)
+class KakaoRegionResponse:
+    documents: List[KakaoRegion] = field(default_factory=list)
+
+    def legal(self) -> Optional[KakaoRegion]:
+        """법정동(B) 결과. 없으면 첫 번째 결과"""
+        for region in self.documents:
+            if region.region_type == "B":
+                return region
+        return self.documents[0] if self.documents else None
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> "KakaoRegionResponse":
+        data = orjson.loads(raw)
+        return cls(documents=[KakaoRegion.from_dict(d) for d in data.get("documents") or []])
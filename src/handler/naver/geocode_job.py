@@ -0,0 +1,620 @@
+"""
+대용량 주소 파일(CSV/NDJSON) 일괄 지오코딩 작업.
+
+입력 파일을 한 청크씩 읽기 -> 정규화 -> 중복 제거 -> 캐시/동시 조회(NaverMapClient.geocode) -> 결과 파일에 이어쓰기
+순서로 처리하므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+청크를 쓸 때마다 체크포인트(읽은 위치, 쓴 크기, 집계)를 기록하므로 재시작 후 마지막 청크부터 이어서 처리합니다.
+
+작업 디렉터리 구조 ({GEOCODE_JOB_DIR}/{job_id}/):
+    input.csv | input.ndjson    업로드한 원본
+    output.csv | output.ndjson  결과 (원본 행 + 지오코딩 결과, 처리 중에도 체크포인트까지 다운로드 가능)
+    checkpoint.json             작업 상태
+    lock                        실행 중인 워커가 배타적 잠금(flock)을 거는 파일
+
+여러 워커(프로세스)가 같은 작업 디렉터리를 공유할 수 있습니다.
+작업은 lock을 잡은 워커 하나만 실행하고, 조회는 어느 워커에서든 체크포인트를 읽어 응답합니다.
+"""
+import asyncio
+import codecs
+import csv
+import fcntl
+import io
+import os
+import re
+import shutil
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+
+from handler.naver.map_handler import NaverMapClient, naver_map_client
+from shared.utils.address import normalize_address
+from shared.utils.fanout import Outcome, map_bounded
+from shared.utils.logger.root import log
+from core.config import settings
+from core.exceptions import BadRequestException, NotFoundException
+
+FORMATS = ("csv", "ndjson")
+# CSV 결과에 덧붙이는 열 (NDJSON은 "geocode" 키 아래에 같은 이름으로 기록)
+RESULT_FIELDS = ("status", "lat", "lng", "road_address", "jibun_address", "error")
+# 재시작 시 이어서 처리할 상태
+RESUMABLE = ("queued", "running")
+FINISHED = ("completed", "failed")
+# 입력 파일 인코딩 후보 (앞에서부터 시도). 한글 CSV는 엑셀 기본값인 CP949로 저장된 경우가 많음
+ENCODINGS = ("utf-8", "cp949")
+
+_JOB_ID = re.compile(r"[0-9a-f]{32}")
+
+_UPLOAD_BUFFER = 1 << 20
+_DOWNLOAD_CHUNK = 1 << 16
+
+
+@dataclass
+class GeocodeJob:
+    id: str
+    format: str
+    column: str
+    directory: str
+    encoding: str = "utf-8"  # 입력 파일 인코딩 (결과 파일은 항상 UTF-8)
+    status: str = "queued"  # queued | running | completed | failed
+    input_bytes: int = 0
+    input_offset: int = 0  # 처리를 마친 마지막 행의 끝 위치 (바이트)
+    output_bytes: int = 0  # 체크포인트까지 쓴 결과 크기 (다운로드 가능한 범위)
+    header: Optional[List[str]] = None  # CSV 헤더
+    rows: int = 0
+    succeeded: int = 0
+    not_found: int = 0
+    invalid: int = 0  # 주소가 비었거나 파싱할 수 없는 행
+    failed: int = 0
+    deduplicated: int = 0  # 같은 작업에서 이미 조회한 주소라 호출하지 않은 행
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    error: str = ""
+    # 처리량 계산용 (이번 실행 기준, 저장하지 않음)
+    _run_started: float = field(default=0.0, repr=False)
+    _run_rows: int = field(default=0, repr=False)
+    _run_offset: int = field(default=0, repr=False)
+
+    @property
+    def input_path(self) -> str:
+        return os.path.join(self.directory, f"input.{self.format}")
+
+    @property
+    def output_path(self) -> str:
+        return os.path.join(self.directory, f"output.{self.format}")
+
+    @property
+    def checkpoint_path(self) -> str:
+        return os.path.join(self.directory, "checkpoint.json")
+
+    @property
+    def lock_path(self) -> str:
+        return os.path.join(self.directory, "lock")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: v for k, v in self.__dict__.items() if not k.startswith("_") and k != "directory"}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], directory: str) -> "GeocodeJob":
+        return cls(directory=directory, **data)
+
+    def update(self, data: Dict[str, Any]) -> None:
+        """디스크에서 다시 읽은 체크포인트를 반영"""
+        for name, value in data.items():
+            setattr(self, name, value)
+
+    def progress(self) -> Dict[str, Any]:
+        """진행률(읽은 바이트 기준), 이번 실행의 처리량(행/초)과 남은 시간 추정"""
+        elapsed = time.monotonic() - self._run_started if self.status == "running" and self._run_started else 0.0
+        rows_per_sec = (self.rows - self._run_rows) / elapsed if elapsed > 0 else 0.0
+        bytes_per_sec = (self.input_offset - self._run_offset) / elapsed if elapsed > 0 else 0.0
+        remaining = self.input_bytes - self.input_offset
+        return {
+            **self.to_dict(),
+            "percent": round(100.0 * self.input_offset / self.input_bytes, 2) if self.input_bytes else 0.0,
+            "rows_per_sec": round(rows_per_sec, 2),
+            "eta_sec": round(remaining / bytes_per_sec, 1) if bytes_per_sec > 0 else None,
+        }
+
+
+@dataclass(slots=True)
+class _Row:
+    end: int  # 이 행을 읽은 뒤의 입력 파일 위치
+    record: Any  # CSV: 열 목록, NDJSON: 객체
+    address: Optional[str]
+    error: str = ""
+
+
+@dataclass(slots=True)
+class _Geocoded:
+    status: str  # ok | not_found | invalid | error
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    road_address: str = ""
+    jibun_address: str = ""
+    error: str = ""
+
+    def fields(self) -> List[Any]:
+        return [getattr(self, name) for name in RESULT_FIELDS]
+
+
+class _InputReader:
+    """입력 파일을 줄 단위로 읽으며 위치(바이트)를 기록합니다. 체크포인트와 진행률에 사용"""
+
+    def __init__(self, path: str, offset: int = 0, encoding: str = "utf-8"):
+        self._file = open(path, "rb")
+        self._file.seek(offset)
+        self.offset = offset
+        self.encoding = encoding
+
+    def lines(self) -> Iterator[str]:
+        # UTF-8과 CP949 모두 여러 바이트 문자 안에 줄바꿈(0x0A) 바이트가 나오지 않으므로 바이트 단위로 줄을 나눠도 안전
+        for raw in self._file:
+            text = raw.decode(self.encoding)
+            if self.offset == 0:
+                text = text.lstrip("\ufeff")
+            self.offset += len(raw)
+            yield text
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def detect_encoding(path: str) -> str:
+    """
+    입력 파일 전체를 ENCODINGS 순서대로 엄격하게 디코딩해 보고 처음 성공한 인코딩을 반환합니다.
+    대체 문자로 깨진 주소를 조회하지 않도록, 어느 인코딩으로도 읽을 수 없으면 400
+    """
+    decoders = {name: codecs.getincrementaldecoder(name)() for name in ENCODINGS}
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_UPLOAD_BUFFER), b""):
+            for name, decoder in list(decoders.items()):
+                try:
+                    decoder.decode(block)
+                except UnicodeDecodeError:
+                    del decoders[name]
+            if not decoders:
+                break
+    for name, decoder in decoders.items():
+        try:
+            decoder.decode(b"", final=True)
+            return name
+        except UnicodeDecodeError:
+            continue
+    raise BadRequestException(detail=f"파일 인코딩을 알 수 없습니다. ({', '.join(ENCODINGS)} 중 하나로 저장해 주세요)")
+
+
+def read_header(path: str, encoding: str = "utf-8") -> Tuple[List[str], int]:
+    """CSV 헤더와 헤더 다음 위치"""
+    reader = _InputReader(path, encoding=encoding)
+    try:
+        header = next(csv.reader(reader.lines()), None)
+        if not header:
+            raise BadRequestException(detail="CSV 헤더가 없습니다.")
+        return [name.strip() for name in header], reader.offset
+    finally:
+        reader.close()
+
+
+def iter_rows(job: GeocodeJob, reader: _InputReader) -> Iterator[_Row]:
+    """job.input_offset 이후의 데이터 행. 빈 줄은 건너뜀"""
+    if job.format == "csv":
+        index = job.header.index(job.column)
+        for record in csv.reader(reader.lines()):
+            if not record:
+                continue
+            address = record[index].strip() if index < len(record) else ""
+            yield _Row(reader.offset, record, address or None)
+        return
+
+    for line in reader.lines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            yield _Row(reader.offset, {"input": line}, None, "JSON 파싱 실패")
+            continue
+        value = record.get(job.column) if isinstance(record, dict) else None
+        address = value.strip() if isinstance(value, str) else ""
+        yield _Row(reader.offset, record if isinstance(record, dict) else {"input": record}, address or None)
+
+
+def encode_rows(job: GeocodeJob, rows: List[_Row], results: List[_Geocoded], header: bool) -> bytes:
+    if job.format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        if header:
+            writer.writerow(job.header + [f"geocode_{name}" for name in RESULT_FIELDS])
+        for row, result in zip(rows, results):
+            writer.writerow(row.record + ["" if v is None else v for v in result.fields()])
+        return buffer.getvalue().encode("utf-8")
+
+    return b"".join(
+        orjson.dumps({**row.record, "geocode": dict(zip(RESULT_FIELDS, result.fields()))}) + b"\n"
+        for row, result in zip(rows, results)
+    )
+
+
+class _RecentResults:
+    """작업 안에서 최근 조회한 주소(정규화 키)의 결과. 크기가 고정된 LRU라 입력이 커져도 메모리가 일정"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _Geocoded]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[_Geocoded]:
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: _Geocoded) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def _to_result(outcome: Outcome) -> _Geocoded:
+    if not outcome.ok:
+        return _Geocoded("error", error=str(outcome.error))
+    first = outcome.value.first if outcome.value else None
+    if first is None:
+        return _Geocoded("not_found")
+    return _Geocoded("ok", first.lat, first.lng, first.road_address, first.jibun_address)
+
+
+class GeocodeJobManager:
+    """
+    일괄 지오코딩 작업의 생성/실행/조회/재개를 담당합니다.
+    동시에 실행하는 작업 수는 max_running개로 제한하고, 나머지는 queued 상태로 대기합니다.
+    """
+
+    def __init__(
+            self,
+            client: NaverMapClient,
+            directory: str,
+            chunk_size: int = 200,
+            concurrency: int = 8,
+            max_running: int = 2,
+            dedupe_entries: int = 50_000
+    ):
+        self.client = client
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.dedupe_entries = dedupe_entries
+        self.jobs: Dict[str, GeocodeJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._slots = asyncio.Semaphore(max(1, max_running))
+
+    async def get(self, job_id: str) -> GeocodeJob:
+        """
+        작업 상태를 반환합니다.
+        이 워커에서 실행 중인 작업은 메모리의 최신 상태를, 그 외에는 체크포인트를 다시 읽어 반환하므로
+        다른 워커가 만들었거나 실행 중인 작업도 조회됩니다.
+        """
+        if self._running_here(job_id):
+            return self.jobs[job_id]
+        directory = os.path.join(self.directory, job_id)
+        try:
+            if not _JOB_ID.fullmatch(job_id):
+                raise FileNotFoundError(job_id)
+            data = await asyncio.to_thread(self._read_checkpoint, directory)
+        except (OSError, ValueError) as e:
+            raise NotFoundException(detail=f"지오코딩 작업이 없습니다: {job_id}") from e
+        return self._merge(directory, data)
+
+    async def list_jobs(self) -> List[GeocodeJob]:
+        """모든 워커의 작업 목록 (체크포인트 기준)"""
+        return [self._merge(directory, data) for directory, data in await asyncio.to_thread(self._scan)]
+
+    async def create(
+            self,
+            chunks: AsyncIterator[bytes],
+            format: str,
+            column: str = "address",
+            max_bytes: Optional[int] = None
+    ) -> GeocodeJob:
+        """
+        업로드 스트림을 작업 디렉터리에 저장하고 작업을 시작합니다. (업로드 전체를 메모리에 올리지 않음)
+
+        Args:
+            chunks: 업로드 본문 스트림 (예: Request.stream())
+            format (str): csv | ndjson
+            column (str): 주소가 담긴 CSV 열 이름 또는 NDJSON 키
+            max_bytes (int, optional): 업로드 최대 크기
+        """
+        if format not in FORMATS:
+            raise BadRequestException(detail=f"지원하지 않는 형식입니다: {format}")
+        job_id = uuid.uuid4().hex
+        job = GeocodeJob(id=job_id, format=format, column=column, directory=os.path.join(self.directory, job_id))
+        await asyncio.to_thread(os.makedirs, job.directory, exist_ok=True)
+
+        try:
+            f = await asyncio.to_thread(open, job.input_path, "wb")
+            try:
+                buffer = bytearray()
+                async for chunk in chunks:
+                    job.input_bytes += len(chunk)
+                    if max_bytes is not None and job.input_bytes > max_bytes:
+                        raise BadRequestException(detail=f"업로드 파일이 너무 큽니다. (최대 {max_bytes} 바이트)")
+                    buffer += chunk
+                    if len(buffer) >= _UPLOAD_BUFFER:
+                        await asyncio.to_thread(f.write, bytes(buffer))
+                        buffer.clear()
+                await asyncio.to_thread(f.write, bytes(buffer))
+            finally:
+                await asyncio.to_thread(f.close)
+
+            job.encoding = await asyncio.to_thread(detect_encoding, job.input_path)
+            if job.format == "csv":
+                job.header, job.input_offset = await asyncio.to_thread(read_header, job.input_path, job.encoding)
+                if column not in job.header:
+                    raise BadRequestException(detail=f"CSV에 주소 열이 없습니다: {column} (열: {', '.join(job.header)})")
+            await asyncio.to_thread(self._create_output, job)
+            await asyncio.to_thread(self._write_checkpoint, job)
+        except BaseException:
+            await asyncio.to_thread(shutil.rmtree, job.directory, True)
+            raise
+
+        self.jobs[job.id] = job
+        self.start(job)
+        return job
+
+    def start(self, job: GeocodeJob) -> None:
+        """작업을 (다시) 실행합니다. 실패한 작업은 마지막 체크포인트부터 이어서 처리"""
+        task = self._tasks.get(job.id)
+        if task is not None and not task.done():
+            return
+        job.status, job.error, job.finished_at = "queued", "", None
+        self._tasks[job.id] = asyncio.ensure_future(self._run(job))
+
+    def load(self) -> List[GeocodeJob]:
+        """작업 디렉터리의 체크포인트를 읽어 작업 목록을 복원합니다. (기동 시 스레드에서 호출)"""
+        return [self._merge(directory, data) for directory, data in self._scan()]
+
+    def resume_pending(self) -> List[GeocodeJob]:
+        """
+        재시작 전에 끝나지 않은 작업을 체크포인트부터 이어서 실행합니다.
+        모든 워커가 호출해도 작업별 lock을 먼저 잡은 워커만 실행하고, 나머지는 건너뜁니다.
+        """
+        pending = [job for job in self.jobs.values() if job.status in RESUMABLE]
+        for job in pending:
+            log.info(f"지오코딩 작업 재개: {job.id} ({job.rows}행 처리됨)")
+            self.start(job)
+        return pending
+
+    async def shutdown(self) -> None:
+        """실행 중인 작업을 멈춥니다. 상태는 체크포인트에 남아 다음 기동 시 재개"""
+        tasks = [task for task in self._tasks.values() if not task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def iter_output(self, job: GeocodeJob, follow: bool = False, poll_interval: float = 0.5) -> AsyncIterator[bytes]:
+        """
+        결과 파일을 체크포인트까지 읽어 전달합니다.
+        follow=True면 작업이 끝날 때까지 새로 기록되는 결과도 이어서 전달합니다.
+        """
+        sent = 0
+        f = await asyncio.to_thread(open, job.output_path, "rb")
+        try:
+            while True:
+                committed = job.output_bytes
+                while sent < committed:
+                    f.seek(sent)
+                    data = await asyncio.to_thread(f.read, min(_DOWNLOAD_CHUNK, committed - sent))
+                    if not data:
+                        break
+                    sent += len(data)
+                    yield data
+                if not follow or (job.status in FINISHED and sent >= job.output_bytes):
+                    return
+                await asyncio.sleep(poll_interval)
+                # 다른 워커가 실행 중인 작업은 체크포인트로 진행 상황을 확인
+                job = await self.get(job.id)
+        finally:
+            await asyncio.to_thread(f.close)
+
+    async def _run(self, job: GeocodeJob) -> None:
+        async with self._slots:
+            lease = await asyncio.to_thread(self._claim, job)
+            if lease is None:
+                log.info(f"지오코딩 작업을 다른 워커가 실행 중이므로 건너뜀: {job.id}")
+                return
+            try:
+                # lock을 기다리는 동안 다른 워커가 진행했을 수 있으므로 체크포인트에서 다시 시작
+                job.update(await asyncio.to_thread(self._read_checkpoint, job.directory))
+                if job.status != "completed":
+                    await self._process(job)
+            finally:
+                await asyncio.to_thread(os.close, lease)
+
+    async def _process(self, job: GeocodeJob) -> None:
+        job.status, job.error, job.finished_at = "running", "", None
+        job._run_started, job._run_rows, job._run_offset = time.monotonic(), job.rows, job.input_offset
+        await asyncio.to_thread(self._write_checkpoint, job)
+        reader = output = None
+        recent = _RecentResults(self.dedupe_entries)
+        try:
+            reader, output = await asyncio.to_thread(self._open, job)
+            rows = iter_rows(job, reader)
+            while True:
+                chunk = await asyncio.to_thread(lambda: list(islice(rows, self.chunk_size)))
+                if not chunk:
+                    break
+                results, reused = await self._geocode_chunk(chunk, recent)
+                payload = encode_rows(job, chunk, results, header=job.output_bytes == 0)
+                await asyncio.to_thread(self._append, output, payload)
+                # 결과를 디스크에 쓴 뒤에 위치/집계를 갱신해야 다운로드/체크포인트가 쓴 범위를 넘지 않음
+                job.input_offset = chunk[-1].end
+                job.output_bytes += len(payload)
+                job.rows += len(chunk)
+                job.deduplicated += reused
+                for result in results:
+                    if result.status == "ok":
+                        job.succeeded += 1
+                    elif result.status == "not_found":
+                        job.not_found += 1
+                    elif result.status == "invalid":
+                        job.invalid += 1
+                    else:
+                        job.failed += 1
+                await asyncio.to_thread(self._write_checkpoint, job)
+
+            if job.output_bytes == 0 and job.format == "csv":
+                payload = encode_rows(job, [], [], header=True)
+                await asyncio.to_thread(self._append, output, payload)
+                job.output_bytes += len(payload)
+            job.status = "completed"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            log.error(f"지오코딩 작업 실패 ({job.id}): {e}")
+            job.status, job.error = "failed", str(e)
+        finally:
+            for handle in (reader, output):
+                if handle is not None:
+                    await asyncio.to_thread(handle.close)
+
+        job.finished_at = time.time()
+        await asyncio.to_thread(self._write_checkpoint, job)
+        log.info(f"지오코딩 작업 {job.status}: {job.id} ({job.rows}행, 성공 {job.succeeded})")
+
+    async def _geocode_chunk(self, rows: List[_Row], recent: _RecentResults) -> Tuple[List[_Geocoded], int]:
+        """
+        청크의 주소를 정규화해 작업 안에서 처음 보는 주소만 동시에 조회합니다.
+
+        Returns:
+            (행 순서대로의 결과, 조회하지 않고 재사용한 행 수)
+        """
+        keys = [normalize_address(row.address) if row.address else "" for row in rows]
+        known: Dict[str, _Geocoded] = {}
+        queries: Dict[str, str] = {}
+        for row, key in zip(rows, keys):
+            if not key or key in known or key in queries:
+                continue
+            result = recent.get(key)
+            if result is not None:
+                known[key] = result
+            else:
+                queries[key] = row.address
+
+        outcomes = await map_bounded(
+            lambda address: self.client.geocode(query=address, count=1, cache=True),
+            list(queries.values()),
+            self.concurrency
+        )
+        for key, outcome in zip(queries, outcomes):
+            known[key] = _to_result(outcome)
+            if known[key].status != "error":
+                recent.put(key, known[key])
+
+        results, reused, queried = [], 0, set()
+        for row, key in zip(rows, keys):
+            if not key:
+                results.append(_Geocoded("invalid", error=row.error or "주소 없음"))
+                continue
+            if key in queries and key not in queried:
+                queried.add(key)
+            else:
+                reused += 1
+            results.append(known[key])
+        return results, reused
+
+    def _running_here(self, job_id: str) -> bool:
+        task = self._tasks.get(job_id)
+        return task is not None and not task.done()
+
+    def _merge(self, directory: str, data: Dict[str, Any]) -> GeocodeJob:
+        """디스크에서 읽은 상태를 반영합니다. 이 워커에서 실행 중인 작업은 메모리 상태가 최신이므로 그대로 둠"""
+        job = self.jobs.get(data["id"])
+        if job is None:
+            job = self.jobs[data["id"]] = GeocodeJob.from_dict(data, directory)
+        elif not self._running_here(job.id):
+            job.update(data)
+        return job
+
+    def _scan(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """작업 디렉터리의 체크포인트를 모두 읽습니다. (스레드에서 호출)"""
+        if not os.path.isdir(self.directory):
+            return []
+        found = []
+        for name in sorted(os.listdir(self.directory)):
+            directory = os.path.join(self.directory, name)
+            try:
+                found.append((directory, self._read_checkpoint(directory)))
+            except FileNotFoundError:
+                # 다른 워커가 아직 업로드 중인 작업
+                continue
+            except (OSError, ValueError) as e:
+                log.warning(f"지오코딩 작업 체크포인트 복원 실패 ({directory}): {e}")
+        return found
+
+    @staticmethod
+    def _claim(job: GeocodeJob) -> Optional[int]:
+        """
+        작업 실행권을 얻습니다. 작업별 lock 파일에 배타적 flock을 걸고 파일 디스크립터를 반환하며,
+        다른 워커가 이미 잡고 있으면 None. 프로세스가 죽으면 OS가 잠금을 풀어 다른 워커가 이어받을 수 있음
+        """
+        fd = os.open(job.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        return fd
+
+    @staticmethod
+    def _read_checkpoint(directory: str) -> Dict[str, Any]:
+        with open(os.path.join(directory, "checkpoint.json"), "rb") as f:
+            data = orjson.loads(f.read())
+        if not isinstance(data, dict) or "id" not in data:
+            raise ValueError("잘못된 체크포인트")
+        return data
+
+    @staticmethod
+    def _create_output(job: GeocodeJob) -> None:
+        open(job.output_path, "wb").close()
+
+    @staticmethod
+    def _open(job: GeocodeJob):
+        # 마지막 체크포인트 이후에 쓰인 결과는 버리고 다시 처리
+        with open(job.output_path, "ab") as f:
+            f.truncate(job.output_bytes)
+        return _InputReader(job.input_path, job.input_offset, job.encoding), open(job.output_path, "ab")
+
+    @staticmethod
+    def _append(output, payload: bytes) -> None:
+        output.write(payload)
+        output.flush()
+        os.fsync(output.fileno())
+
+    @staticmethod
+    def _write_checkpoint(job: GeocodeJob) -> None:
+        tmp_path = f"{job.checkpoint_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(job.to_dict()))
+        os.replace(tmp_path, job.checkpoint_path)
+
+
+# 싱글톤 인스턴스
+geocode_job_manager = GeocodeJobManager(
+    naver_map_client,
+    settings.GEOCODE_JOB_DIR,
+    chunk_size=settings.GEOCODE_JOB_CHUNK_SIZE,
+    concurrency=settings.GEOCODE_JOB_CONCURRENCY,
+    max_running=settings.GEOCODE_JOB_MAX_RUNNING,
+    dedupe_entries=settings.GEOCODE_JOB_DEDUPE_ENTRIES
+)
+
+
+def get_geocode_job_manager() -> GeocodeJobManager:
+    return geocode_job_manager
@@ -1,8 +1,32 @@
-from typing import Any, Dict, Optional, Tuple
-from handler.base import BaseClient
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+from handler.base import BaseClient, RawBody, model_reader
+from handler.naver.place_index import PlaceIndex
+from handler.naver.models import (
+    GeocodeBatchItem,
+    GeocodeBatchResult,
+    GeocodeResponse,
+    LocalPlace,
+    LocalSearchResponse,
+    ReverseGeocodeBatchItem,
+    ReverseGeocodeBatchResult,
+    ReverseGeocodeResponse,
+)
+from shared.infra.wrapper.concurrency_limiter import get_rate_limiter
+from shared.infra.wrapper.resilience import HedgePolicy
+from shared.infra.wrapper.response_cache import CachePolicy, ResponseCache
+from shared.infra.wrapper.sqlite_cache import SqliteCache
+from shared.utils import geohash
+from shared.utils.address import normalize_address
+from shared.utils.address_dictionary import AddressDictionary
+from shared.utils.fanout import map_unique
+from shared.utils.geo import snap_key
+from shared.utils.region_index import RegionIndex
+from shared.utils.logger.root import log
+from shared.utils.query import normalize_search_query
 from core.config import settings
 from core.exceptions import ExternalAPIError
-from typing import Any, Dict, List
 
 class NaverMapClient(BaseClient):
     """
@@ -10,6 +34,24 @@ class NaverMapClient(BaseClient):
     주소-좌표 간 상호 변환 기능을 제공합니다.
     """
 
+    GEOCODE_ENDPOINT = "/map-geocode/v2/geocode"
+    REVERSE_GEOCODE_ENDPOINT = "/map-reversegeocode/v2/gc"
+
+    # 주소-좌표 매핑은 거의 변하지 않으므로 길게 캐시하고, 만료 후 1시간은 stale 응답 + 백그라운드 갱신
+    cache_policy = CachePolicy(ttl=60 * 60 * 24, stale_while_revalidate=60 * 60)
+    upstream = "naver-maps"
+    hedge_policy = HedgePolicy() if settings.UPSTREAM_HEDGE_ENABLED else None
+
+    # 역지오코딩 공간 캐시의 orders별 geohash 정밀도 (7: 약 150m, 8: 약 38x19m, 9: 약 5m 셀)
+    # 법정동/행정동은 셀이 커도 결과가 거의 같지만, 지번/도로명은 건물 단위라 셀을 작게 잡아야 함
+    # 여러 orders를 함께 요청하면 가장 정밀한 값을 사용합니다.
+    REVERSE_GEOCODE_PRECISION: Dict[str, int] = {
+        "legalcode": 7,
+        "admcode": 7,
+        "addr": 8,
+        "roadaddr": 9,
+    }
+
     def __init__(self):
         # NCP Maps API 기본 URL
         super().__init__(base_url="https://maps.apigw.ntruss.com")
@@ -18,6 +60,19 @@ class NaverMapClient(BaseClient):
             "x-ncp-apigw-api-key": settings.NAVER_MAP_CLIENT_SECRET,
             "Accept": "application/json"
         }
+        # 정규화된 주소 -> 지오코딩 결과 영속 캐시 (재시작 후에도 유지, 워커 간 공유)
+        self.geocode_cache = (
+            SqliteCache(settings.GEOCODE_CACHE_PATH, namespace="naver-geocode")
+            if settings.GEOCODE_CACHE_PATH else None
+        )
+        # 오프라인 주소 사전 (설정된 경우 get_coordinates가 네트워크보다 먼저 조회, 네이버 장애 시에도 응답 가능)
+        self.address_dictionary = (
+            AddressDictionary(settings.ADDRESS_DICTIONARY_PATH or None,
+                              settings.ADDRESS_DICTIONARY_OVERLAY_PATH or None)
+            if settings.ADDRESS_DICTIONARY_PATH or settings.ADDRESS_DICTIONARY_OVERLAY_PATH else None
+        )
+        # 행정구역 경계 색인 (설정된 경우 get_address가 역지오코딩 호출 없이 지역 명칭을 찾음)
+        self.region_index = RegionIndex(settings.REGION_BOUNDARY_PATH) if settings.REGION_BOUNDARY_PATH else None
 
     async def geocode(
             self,
@@ -25,12 +80,122 @@ class NaverMapClient(BaseClient):
             coordinate: Optional[str] = None,
             filter_type: Optional[str] = None,
             count: int = 10,
-            page: int = 1
-    ) -> Dict[str, Any]:
+            page: int = 1,
+            cache: bool = False
+    ) -> GeocodeResponse:
         """
         [Geocoding] 주소 문자열을 좌표로 변환합니다./gc
+
+        cache=True면 응답 캐시(cache_policy)를 사용하고, 정렬 기준 좌표/필터 없이 첫 페이지를 조회하는 경우
+        정규화된 주소 키로 영속 캐시(geocode_cache)를 먼저 확인합니다.
+        """
+        persist_key = None
+        if cache and self.geocode_cache is not None and not coordinate and not filter_type and page == 1:
+            persist_key = f"{normalize_address(query)}|{count}"
+            cached = self.geocode_cache.get(persist_key)
+            if cached is not None:
+                return GeocodeResponse.from_bytes(cached)
+
+        result = await self.request(
+            "GET",
+            self.GEOCODE_ENDPOINT,
+            params=self._geocode_params(query, coordinate, filter_type, count, page),
+            headers=self.headers,
+            cache=cache,
+            reader=model_reader(GeocodeResponse.from_json)
+        )
+
+        if persist_key is not None and result is not None and result.status == "OK":
+            ttl = settings.GEOCODE_CACHE_TTL if result.addresses else settings.GEOCODE_CACHE_NEGATIVE_TTL
+            await self.geocode_cache.aset(persist_key, result.to_bytes(), ttl)
+        return result
+
+    async def geocode_raw(
+            self,
+            query: str,
+            coordinate: Optional[str] = None,
+            filter_type: Optional[str] = None,
+            count: int = 10,
+            page: int = 1,
+            accept_encoding: Optional[str] = None,
+            cache: bool = False
+    ) -> RawBody:
         """
-        endpoint = "/map-geocode/v2/geocode"
+        [Geocoding - Passthrough] 응답을 디코딩하지 않고 원본 바이트 그대로 반환합니다.
+        프록시 엔드포인트에서 decode -> re-encode 비용 없이 그대로 전달할 때 사용합니다.
+        """
+        return await self.request_raw(
+            "GET",
+            self.GEOCODE_ENDPOINT,
+            accept_encoding=accept_encoding,
+            params=self._geocode_params(query, coordinate, filter_type, count, page),
+            headers=self.headers,
+            cache=cache
+        )
+
+    async def geocode_batch(
+            self,
+            addresses: List[str],
+            concurrency: Optional[int] = None,
+            cache: bool = True
+    ) -> GeocodeBatchResult:
+        """
+        여러 주소를 한 번에 좌표로 변환합니다.
+
+        정규화 후 같은 주소는 한 번만 조회하고, 고유 주소는 최대 concurrency개씩 동시에 조회합니다.
+        결과는 입력 순서대로 반환하며 한 주소의 실패가 다른 주소에 영향을 주지 않습니다.
+
+        Args:
+            addresses (List[str]): 주소 목록
+            concurrency (int, optional): 동시 조회 수 (기본: settings.GEOCODE_BATCH_CONCURRENCY)
+            cache (bool): 응답/영속 캐시 사용 여부
+        """
+        started = time.perf_counter()
+        outcomes, unique = await map_unique(
+            lambda address: self.geocode(query=address, count=1, cache=cache),
+            addresses,
+            key=normalize_address,
+            concurrency=concurrency or settings.GEOCODE_BATCH_CONCURRENCY
+        )
+
+        items = []
+        seen = set()
+        for address, outcome in zip(addresses, outcomes):
+            item = GeocodeBatchItem(
+                query=address,
+                status="ok",
+                latency_ms=round(outcome.latency * 1000, 2),
+                deduplicated=id(outcome) in seen
+            )
+            seen.add(id(outcome))
+            first = outcome.value.first if outcome.ok and outcome.value else None
+            if not outcome.ok:
+                item.status = "error"
+                item.error = str(outcome.error)
+            elif first is None:
+                item.status = "not_found"
+            else:
+                item.lat, item.lng = first.lat, first.lng
+                item.road_address = first.road_address
+                item.jibun_address = first.jibun_address
+            items.append(item)
+
+        return GeocodeBatchResult(
+            items=items,
+            total=len(items),
+            unique=unique,
+            succeeded=sum(1 for item in items if item.status == "ok"),
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2)
+        )
+
+    @staticmethod
+    def _geocode_params(
+            query: str,
+            coordinate: Optional[str],
+            filter_type: Optional[str],
+            count: int,
+            page: int
+    ) -> Dict[str, Any]:
         params = {
             "query": query,
             "count": count,
@@ -41,20 +206,15 @@ class NaverMapClient(BaseClient):
             params["coordinate"] = coordinate
         if filter_type:
             params["filter"] = filter_type
-
-        return await self.request(
-            "GET",
-            endpoint,
-            params=params,
-            headers=self.headers
-        )
+        return params
 
     async def reverse_geocode(
             self,
             lat: float,
             lng: float,
-            orders: str = "legalcode,admcode,addr,roadaddr"
-    ) -> Dict[str, Any]:
+            orders: str = "legalcode,admcode,addr,roadaddr",
+            cache: bool = False
+    ) -> ReverseGeocodeResponse:
         """
         [Reverse Geocoding] 위경도 좌표를 주소 정보로 변환합니다.
 
@@ -62,33 +222,153 @@ class NaverMapClient(BaseClient):
             lat (float): 위도
             lng (float): 경도
             orders (str): 변환 타겟 타입 (법정동, 행정동, 지번, 도로명)
+            cache (bool): 공간 캐시 사용 여부. 같은 geohash 셀에서 이미 조회한 결과가 있으면 재사용합니다.
         """
-        endpoint = "/map-reversegeocode/v2/gc"
+        async def load() -> ReverseGeocodeResponse:
+            return await self.request(
+                "GET",
+                self.REVERSE_GEOCODE_ENDPOINT,
+                params=self._reverse_geocode_params(lat, lng, orders),
+                headers=self.headers,
+                reader=model_reader(ReverseGeocodeResponse.from_json)
+            )
+
+        if not cache:
+            return await load()
+        # 결과 객체 크기는 대략 결과 1건당 1KB로 추정
+        return await self._fetch_cached(
+            ("reverse-geocode", self._reverse_geocode_cell(lat, lng, orders), orders),
+            load,
+            lambda result: 1024 * max(1, len(result.results)) if result else 0
+        )
+
+    async def reverse_geocode_raw(
+            self,
+            lat: float,
+            lng: float,
+            orders: str = "legalcode,admcode,addr,roadaddr",
+            accept_encoding: Optional[str] = None,
+            cache: bool = False
+    ) -> RawBody:
+        """
+        [Reverse Geocoding - Passthrough] 응답을 디코딩하지 않고 원본 바이트 그대로 반환합니다.
+        cache=True면 reverse_geocode와 같은 공간 캐시를 사용합니다. (압축 방식별로 따로 보관)
+        """
+        async def load() -> RawBody:
+            return await self.request_raw(
+                "GET",
+                self.REVERSE_GEOCODE_ENDPOINT,
+                accept_encoding=accept_encoding,
+                params=self._reverse_geocode_params(lat, lng, orders),
+                headers=self.headers
+            )
+
+        if not cache:
+            return await load()
+        return await self._fetch_cached(
+            ("reverse-geocode-raw", self._reverse_geocode_cell(lat, lng, orders), orders, accept_encoding),
+            load,
+            lambda raw: len(raw.content)
+        )
+
+    async def reverse_geocode_batch(
+            self,
+            lats: List[float],
+            lngs: List[float],
+            orders: str = "legalcode",
+            tolerance_m: float = 10.0,
+            concurrency: Optional[int] = None,
+            cache: bool = True
+    ) -> ReverseGeocodeBatchResult:
+        """
+        여러 좌표를 한 번에 주소로 변환합니다. (lats[i], lngs[i])가 i번째 좌표입니다.
+
+        tolerance_m 격자로 좌표를 묶어 같은 칸의 좌표는 한 번만 조회하고(처음 등장한 좌표로 조회),
+        고유 위치는 최대 concurrency개씩 동시에 조회한 뒤 결과를 원래 위치로 나눠 담습니다.
+
+        Args:
+            lats (List[float]): 위도 목록
+            lngs (List[float]): 경도 목록 (lats와 길이가 같아야 함)
+            orders (str): 변환 타겟 타입
+            tolerance_m (float): 같은 위치로 볼 허용 오차 (미터)
+            concurrency (int, optional): 동시 조회 수 (기본: settings.REVERSE_GEOCODE_BATCH_CONCURRENCY)
+            cache (bool): 공간 캐시 사용 여부
+        """
+        if len(lats) != len(lngs):
+            raise ValueError("lats와 lngs의 길이가 다릅니다.")
+
+        started = time.perf_counter()
+        points = list(zip(lats, lngs))
+        outcomes, unique = await map_unique(
+            lambda point: self.reverse_geocode(point[0], point[1], orders=orders, cache=cache),
+            points,
+            key=lambda point: snap_key(point[0], point[1], tolerance_m),
+            concurrency=concurrency or settings.REVERSE_GEOCODE_BATCH_CONCURRENCY
+        )
+
+        items = []
+        seen = set()
+        for (lat, lng), outcome in zip(points, outcomes):
+            item = ReverseGeocodeBatchItem(
+                lat=lat,
+                lng=lng,
+                status="ok",
+                latency_ms=round(outcome.latency * 1000, 2),
+                deduplicated=id(outcome) in seen
+            )
+            seen.add(id(outcome))
+            result = outcome.value if outcome.ok else None
+            if not outcome.ok:
+                item.status = "error"
+                item.error = str(outcome.error)
+            elif result is None or not result.ok or not result.results:
+                item.status = "not_found"
+            else:
+                item.address = result.results[0].region.to_address()
+                item.code = result.results[0].code
+            items.append(item)
+
+        return ReverseGeocodeBatchResult(
+            items=items,
+            total=len(items),
+            unique=unique,
+            succeeded=sum(1 for item in items if item.status == "ok"),
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2)
+        )
+
+    def _reverse_geocode_cell(self, lat: float, lng: float, orders: str) -> str:
+        precision = max(
+            self.REVERSE_GEOCODE_PRECISION.get(order.strip(), 9) for order in orders.split(",")
+        )
+        return geohash.encode(lat, lng, precision)
+
+    @staticmethod
+    def _reverse_geocode_params(lat: float, lng: float, orders: str) -> Dict[str, Any]:
         # 좌표 형식: "경도,위도"
-        params = {
+        return {
             "coords": f"{lng},{lat}",
             "orders": orders,
             "output": "json"
         }
 
-        return await self.request(
-            "GET",
-            endpoint,
-            params=params,
-            headers=self.headers
-        )
-
     async def get_coordinates(self, address: str) -> Optional[Tuple[float, float]]:
         """
         주소를 받아 (위도, 경도)를 반환하는 편의 메서드 (Geocoding)
+        오프라인 주소 사전이 있으면 먼저 조회하고, 없는 주소만 네이버를 호출한 뒤 결과를 사전 오버레이에 기록합니다.
         """
+        if self.address_dictionary is not None:
+            coords = self.address_dictionary.lookup(address)
+            if coords is not None:
+                return coords
+
         try:
-            result = await self.geocode(query=address, count=1)
+            result = await self.geocode(query=address, count=1, cache=True)
 
-            if result.get("status") == "OK" and result["meta"]["totalCount"] > 0:
-                address_info = result["addresses"][0]
-                # x: 경도(lng), y: 위도(lat)
-                return float(address_info["y"]), float(address_info["x"])
+            first = result.first if result else None
+            if first is not None:
+                if self.address_dictionary is not None:
+                    await self.address_dictionary.remember(address, first.lat, first.lng)
+                return first.lat, first.lng
 
             return None
         except Exception as e:
@@ -102,24 +382,20 @@ class NaverMapClient(BaseClient):
         """
         위경도 좌표를 받아 읽기 쉬운 주소 문자열을 반환하는 편의 메서드 (Reverse Geocoding)
         예: "서울특별시 강남구 역삼동"
+        행정구역 경계 색인이 있으면 먼저 조회하고, 어느 경계에도 속하지 않는 좌표만 네이버를 호출합니다.
         """
-        try:
-            result = await self.reverse_geocode(lat, lng)
+        if self.region_index is not None:
+            names = self.region_index.lookup(lat, lng)
+            if names is not None:
+                return " ".join(name for name in names if name)
 
-            if result.get("status", {}).get("code") == 0:
-                results = result.get("results", [])
-                if not results:
-                    return None
+        try:
+            # 지역 명칭(area1~4)만 사용하므로 법정동 결과만 요청 (공간 캐시 셀도 더 크게 잡힘)
+            result = await self.reverse_geocode(lat, lng, orders="legalcode", cache=True)
 
+            if result and result.ok and result.results:
                 # 첫 번째 결과에서 지역 명칭 추출
-                region = results[0].get("region", {})
-                area1 = region.get("area1", {}).get("name", "")  # 시/도
-                area2 = region.get("area2", {}).get("name", "")  # 시/군/구
-                area3 = region.get("area3", {}).get("name", "")  # 읍/면/동
-                area4 = region.get("area4", {}).get("name", "")  # 리
-
-                address_parts = [area1, area2, area3, area4]
-                return " ".join([p for p in address_parts if p]).strip()
+                return result.results[0].region.to_address()
 
             return None
         except Exception as e:
@@ -134,25 +410,45 @@ class NaverMapClient(BaseClient):
 class NaverSearchClient(BaseClient):
     """
     네이버 검색 API - 지역 검색(Local) 연동 클라이언트.
-    업체명, 주소, 카테고리 및 위치(KATECH 좌표) 정보를 제공합니다.
+    업체명, 주소, 카테고리 및 위치(WGS84 x 10^7 정수 좌표) 정보를 제공합니다.
     """
 
-    def __init__(self):
+    cache_policy = CachePolicy(ttl=60 * 10, stale_while_revalidate=60 * 5)
+    upstream = "naver-search"
+    # 정규화한 검색어 캐시. 호출 한도가 가장 빠듯한 API라 백그라운드 갱신(stale-while-revalidate)은 하지 않음
+    query_cache_policy = CachePolicy(ttl=settings.NAVER_SEARCH_QUERY_CACHE_TTL)
+    # 검색 API는 일일 호출 한도가 빠듯하므로 헤지하지 않음 (재시도/서킷 브레이커만 사용)
+
+    def __init__(self, map_client: Optional[NaverMapClient] = None):
         # 검색 API용 기본 URL
         super().__init__(base_url="https://openapi.naver.com")
+        # 근처 검색(search_nearby)에서 검색어에 붙일 지역 명칭을 찾는 역지오코딩 클라이언트. 없으면 검색어만 사용
+        self.map_client = map_client
         self.headers = {
             "X-Naver-Client-Id": settings.NAVER_DEV_CLIENT_ID, # 발급받은 ID
             "X-Naver-Client-Secret": settings.NAVER_DEV_CLIENT_SECRET, # 발급받은 Secret
             "Accept": "application/json"
         }
+        # 표기만 다른 검색어("판교 맛집", "맛집 판교에서")를 하나로 묶는 캐시. 공유 응답 캐시와 별도 한도로 관리
+        self.query_cache = ResponseCache(
+            max_entries=settings.NAVER_SEARCH_QUERY_CACHE_MAX_ENTRIES,
+            max_bytes=settings.NAVER_SEARCH_QUERY_CACHE_MAX_BYTES
+        )
+        # 검색 결과로 수집한 업체의 위치 색인 (근처 업체 조회를 업스트림 호출 없이 처리)
+        self.place_index = PlaceIndex(
+            settings.PLACE_INDEX_PATH or None,
+            max_places=settings.PLACE_INDEX_MAX_PLACES,
+            max_age=settings.PLACE_INDEX_MAX_AGE
+        )
 
     async def search_local(
         self,
         query: str,
         display: int = 5,
         start: int = 1,
-        sort: str = "random"
-    ) -> List[Dict[str, Any]]:
+        sort: str = "random",
+        cache: bool = False
+    ) -> List[LocalPlace]:
         """
         키워드로 지역 업체를 검색하고 아이템 리스트를 반환합니다.
 
@@ -161,27 +457,166 @@ class NaverSearchClient(BaseClient):
             display (int): 한 번에 표시할 결과 개수 (최대 5)
             start (int): 검색 시작 위치
             sort (str): 정렬 방식 (random: 정확도, comment: 카페/블로그 리뷰 순)
+            cache (bool): 검색어 캐시 사용 여부. 정규화한 검색어(normalize_search_query)를 키로 사용하므로
+                공백/조사/키워드 순서만 다른 검색어는 업스트림을 다시 호출하지 않음
 
         Returns:
-            List[Dict[str, Any]]: 업체 정보 목록 (title, link, address, mapx, mapy 등)
+            List[LocalPlace]: 업체 정보 목록 (title, link, address, mapx, mapy 등)
         """
-        endpoint = "/v1/search/local.json"
-        params = {
-            "query": query,
-            "display": display,
-            "start": start,
-            "sort": sort
-        }
-
-        response = await self.request(
-            "GET",
-            endpoint,
-            params=params,
-            headers=self.headers
+        async def load() -> List[LocalPlace]:
+            response = await self.request(
+                "GET",
+                "/v1/search/local.json",
+                params={
+                    "query": query,
+                    "display": display,
+                    "start": start,
+                    "sort": sort
+                },
+                headers=self.headers,
+                reader=model_reader(LocalSearchResponse.from_json)
+            )
+            if not response:
+                return []
+            # 결과를 장소 색인에 반영하고 실제 업체 목록(items)만 반환
+            if self.place_index.add_many(response.items):
+                self.place_index.schedule_save()
+            return response.items
+
+        if not cache:
+            return await load()
+        key = ("local", normalize_search_query(query), display, start, sort)
+        return await self._fetch_cached(
+            key, load, lambda items: 256 + 512 * len(items), policy=self.query_cache_policy, cache=self.query_cache
         )
 
-        # 결과에서 실제 업체 목록(items)만 추출하여 반환
-        return response.get("items", [])
+    async def iter_local(
+        self,
+        query: str,
+        max_results: int = 50,
+        display: int = 5,
+        sort: str = "random",
+        concurrency: Optional[int] = None,
+        cache: bool = False
+    ) -> AsyncIterator[LocalPlace]:
+        """
+        지역 검색 결과를 여러 페이지(start=1, 6, 11, ...)에 걸쳐 동시에 요청하고, 도착하는 순서대로 업체를 내보냅니다.
+
+        - 남은 개수를 채우는 데 필요한 페이지만 요청하며 (동시 요청은 최대 concurrency개),
+          요청마다 업스트림 속도 제한기의 토큰을 받습니다.
+        - 같은 업체(link 또는 업체명+주소가 같음)는 한 번만 내보냅니다.
+        - max_results개를 채우거나 호출자가 순회를 멈추면(break) 진행 중인 요청을 취소합니다.
+        - display개보다 적게 돌아온 페이지가 있으면 그 뒤 페이지는 요청하지 않습니다.
+          실패한 페이지는 로그만 남기고 건너뜁니다.
+
+        Args:
+            query (str): 검색어
+            max_results (int): 최대 업체 수
+            display (int): 페이지당 결과 개수 (최대 5)
+            concurrency (int): 동시에 요청할 페이지 수
+        """
+        concurrency = concurrency or settings.NAVER_SEARCH_STREAM_CONCURRENCY
+        rate_limiter = get_rate_limiter(self.upstream)
+
+        async def fetch_page(start: int) -> List[LocalPlace]:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            return await self.search_local(query, display=display, start=start, sort=sort, cache=cache)
+
+        seen_links: Set[str] = set()
+        seen_places: Set[Tuple[str, str]] = set()
+        pending: Dict[asyncio.Task, int] = {}
+        next_start = 1
+        last_start = settings.NAVER_SEARCH_MAX_START
+        yielded = 0
+        try:
+            while True:
+                # 남은 개수를 채우는 데 필요한 만큼만 페이지 요청
+                needed_pages = -(-(max_results - yielded) // display) - len(pending)
+                while needed_pages > 0 and len(pending) < concurrency and next_start <= last_start:
+                    pending[asyncio.ensure_future(fetch_page(next_start))] = next_start
+                    next_start += display
+                    needed_pages -= 1
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    start = pending.pop(task)
+                    try:
+                        places = task.result()
+                    except Exception as e:
+                        log.warning(f"지역 검색 페이지 조회 실패 (query={query}, start={start}): {e}")
+                        continue
+                    if len(places) < display:
+                        # 마지막 페이지: 이후 페이지는 요청하지 않음 (이미 요청 중인 페이지는 그대로 받음)
+                        last_start = min(last_start, start)
+                    for place in places:
+                        place_key = (place.title, place.road_address or place.address)
+                        if (place.link and place.link in seen_links) or place_key in seen_places:
+                            continue
+                        if place.link:
+                            seen_links.add(place.link)
+                        seen_places.add(place_key)
+                        yield place
+                        yielded += 1
+                        if yielded >= max_results:
+                            return
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def search_nearby(
+        self,
+        lat: float,
+        lng: float,
+        radius_m: float = 1000.0,
+        category: Optional[str] = None,
+        query: Optional[str] = None,
+        limit: Optional[int] = None,
+        min_results: Optional[int] = None,
+        max_age: Optional[float] = None
+    ) -> List[Tuple[LocalPlace, float]]:
+        """
+        (lat, lng) 근처의 업체를 장소 색인에서 찾습니다.
+        최근 수집한 업체가 min_results개 미만일 때만 지역 검색 API를 호출해 색인을 보충합니다.
+        지역 검색 API는 좌표를 받지 않으므로, query가 없으면 역지오코딩한 지역 명칭을 category 앞에 붙여 검색합니다.
+        (예: "분당구 백현동 카페". 지역 명칭을 찾지 못하면 category만으로 검색하므로 다른 지역 업체만 수집될 수 있음)
+
+        Args:
+            radius_m (float): 검색 반경 (미터)
+            category (str): 카테고리 또는 업체명에 포함된 문자열 (예: "카페")
+            query (str): 색인이 부족할 때 사용할 검색어 (예: "판교 카페"). 없으면 지역 명칭 + category로 검색
+            limit (int): 최대 결과 수
+            min_results (int): 이 개수 이상이면 업스트림을 호출하지 않음
+            max_age (float): 이 시간(초)보다 오래 전에 수집한 업체는 제외
+
+        Returns:
+            List[Tuple[LocalPlace, float]]: (업체, 거리(m)) 목록, 가까운 순
+        """
+        min_results = settings.PLACE_INDEX_MIN_RESULTS if min_results is None else min_results
+        max_age = settings.PLACE_INDEX_MAX_AGE if max_age is None else max_age
+        found = self.place_index.nearby(lat, lng, radius_m, category=category, max_age=max_age, limit=limit)
+        keyword = query or category
+        if len(found) >= min_results or not keyword:
+            return found
+        if not query:
+            area = await self._area_name(lat, lng)
+            if area:
+                keyword = f"{area} {category}"
+        await self.search_local(keyword, cache=True)
+        return self.place_index.nearby(lat, lng, radius_m, category=category, max_age=max_age, limit=limit)
+
+    async def _area_name(self, lat: float, lng: float) -> Optional[str]:
+        """검색어에 붙일 지역 명칭 (시/군/구 + 읍/면/동, 예: "분당구 백현동"). 찾지 못하면 None"""
+        if self.map_client is None:
+            return None
+        try:
+            address = await self.map_client.get_address(lat, lng)
+        except ExternalAPIError as e:
+            log.warning(f"근처 검색 지역 명칭 조회 실패 ({lat},{lng}): {e}")
+            return None
+        return " ".join(address.split()[-2:]) if address else None
 
 
 
@@ -191,7 +626,7 @@ class NaverSearchClient(BaseClient):
 # 싱글톤 인스턴스
 naver_map_client = NaverMapClient()
 # 싱글톤 인스턴스
-naver_search_client = NaverSearchClient()
+naver_search_client = NaverSearchClient(naver_map_client)
 
 
 def get_naver_map_client():
@@ -0,0 +1,238 @@
+"""
+네이버 API 응답용 경량 타입 모델.
+중첩 dict를 그대로 들고 다니지 않고 필요한 필드만 __slots__ 기반 dataclass로 변환합니다.
+orjson은 dataclass를 직접 직렬화하므로 응답 시 별도 변환이 필요 없습니다.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+
+@dataclass(slots=True)
+class GeocodeAddress:
+    road_address: str
+    jibun_address: str
+    english_address: str
+    x: float  # 경도(lng)
+    y: float  # 위도(lat)
+    distance: float = 0.0
+
+    @property
+    def lat(self) -> float:
+        return self.y
+
+    @property
+    def lng(self) -> float:
+        return self.x
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GeocodeAddress":
+        return cls(
+            road_address=data.get("roadAddress", ""),
+            jibun_address=data.get("jibunAddress", ""),
+            english_address=data.get("englishAddress", ""),
+            x=float(data.get("x") or 0.0),
+            y=float(data.get("y") or 0.0),
+            distance=float(data.get("distance") or 0.0)
+        )
+
+
+@dataclass(slots=True)
+class GeocodeResponse:
+    status: str
+    total_count: int
+    addresses: List[GeocodeAddress] = field(default_factory=list)
+    error_message: str = ""
+
+    @property
+    def first(self) -> Optional[GeocodeAddress]:
+        if self.status == "OK" and self.addresses:
+            return self.addresses[0]
+        return None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GeocodeResponse":
+        return cls(
+            status=data.get("status", ""),
+            total_count=int((data.get("meta") or {}).get("totalCount", 0)),
+            addresses=[GeocodeAddress.from_dict(a) for a in data.get("addresses") or []],
+            error_message=data.get("errorMessage", "")
+        )
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> "GeocodeResponse":
+        return cls.from_dict(orjson.loads(raw))
+
+    def to_bytes(self) -> bytes:
+        """영속 캐시 저장용 직렬화 (from_bytes로 복원)"""
+        return orjson.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "GeocodeResponse":
+        data = orjson.loads(raw)
+        return cls(
+            status=data["status"],
+            total_count=data["total_count"],
+            addresses=[GeocodeAddress(**a) for a in data["addresses"]],
+            error_message=data["error_message"]
+        )
+
+
+@dataclass(slots=True)
+class Region:
+    area1: str = ""  # 시/도
+    area2: str = ""  # 시/군/구
+    area3: str = ""  # 읍/면/동
+    area4: str = ""  # 리
+
+    def to_address(self) -> str:
+        """예: "서울특별시 강남구 역삼동" """
+        return " ".join(p for p in (self.area1, self.area2, self.area3, self.area4) if p).strip()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Region":
+        return cls(
+            area1=(data.get("area1") or {}).get("name", ""),
+            area2=(data.get("area2") or {}).get("name", ""),
+            area3=(data.get("area3") or {}).get("name", ""),
+            area4=(data.get("area4") or {}).get("name", "")
+        )
+
+
+@dataclass(slots=True)
+class ReverseGeocodeResult:
+    name: str  # 변환 타입 (legalcode, admcode, addr, roadaddr)
+    code: str  # 법정동/행정동 코드
+    region: Region
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReverseGeocodeResult":
+        return cls(
+            name=data.get("name", ""),
+            code=(data.get("code") or {}).get("id", ""),
+            region=Region.from_dict(data.get("region") or {})
+        )
+
+
+@dataclass(slots=True)
+class ReverseGeocodeResponse:
+    status_code: int
+    results: List[ReverseGeocodeResult] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code == 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReverseGeocodeResponse":
+        return cls(
+            status_code=int((data.get("status") or {}).get("code", -1)),
+            results=[ReverseGeocodeResult.from_dict(r) for r in data.get("results") or []]
+        )
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> "ReverseGeocodeResponse":
+        return cls.from_dict(orjson.loads(raw))
+
+
+@dataclass(slots=True)
+class LocalPlace:
+    """
+    네이버 지역 검색 결과 항목.
+    mapx, mapy는 WGS84 경도/위도에 10^7을 곱한 정수입니다.
+    """
+    title: str
+    link: str
+    category: str
+    description: str
+    telephone: str
+    address: str
+    road_address: str
+    mapx: int
+    mapy: int
+
+    @property
+    def lng(self) -> float:
+        return self.mapx / 1e7
+
+    @property
+    def lat(self) -> float:
+        return self.mapy / 1e7
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LocalPlace":
+        return cls(
+            title=data.get("title", ""),
+            link=data.get("link", ""),
+            category=data.get("category", ""),
+            description=data.get("description", ""),
+            telephone=data.get("telephone", ""),
+            address=data.get("address", ""),
+            road_address=data.get("roadAddress", ""),
+            mapx=int(data.get("mapx") or 0),
+            mapy=int(data.get("mapy") or 0)
+        )
+
+
+@dataclass(slots=True)
+class LocalSearchResponse:
+    total: int
+    start: int
+    display: int
+    items: List[LocalPlace] = field(default_factory=list)
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> "LocalSearchResponse":
+        data = orjson.loads(raw)
+        return cls(
+            total=int(data.get("total", 0)),
+            start=int(data.get("start", 0)),
+            display=int(data.get("display", 0)),
+            items=[LocalPlace.from_dict(i) for i in data.get("items") or []]
+        )
+
+
+@dataclass(slots=True)
+class GeocodeBatchItem:
+    """배치 지오코딩 항목별 결과 (입력 순서 유지)"""
+    query: str
+    status: str  # "ok" | "not_found" | "error"
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    road_address: Optional[str] = None
+    jibun_address: Optional[str] = None
+    error: Optional[str] = None
+    latency_ms: float = 0.0
+    deduplicated: bool = False  # 앞선 동일 주소의 결과를 재사용했는지
+
+
+@dataclass(slots=True)
+class GeocodeBatchResult:
+    items: List[GeocodeBatchItem]
+    total: int
+    unique: int  # 정규화 후 실제로 조회한 주소 수
+    succeeded: int
+    elapsed_ms: float
+
+
+@dataclass(slots=True)
+class ReverseGeocodeBatchItem:
+    """배치 역지오코딩 항목별 결과 (입력 위치 유지)"""
+    lat: float
+    lng: float
+    status: str  # "ok" | "not_found" | "error"
+    address: Optional[str] = None  # 예: "경기도 성남시 분당구 정자동"
+    code: Optional[str] = None  # 첫 번째 결과의 법정동/행정동 코드
+    error: Optional[str] = None
+    latency_ms: float = 0.0
+    deduplicated: bool = False  # 허용 오차 안의 앞선 좌표 결과를 재사용했는지
+
+
+@dataclass(slots=True)
+class ReverseGeocodeBatchResult:
+    items: List[ReverseGeocodeBatchItem]
+    total: int
+    unique: int  # 허용 오차로 묶은 뒤 실제로 조회한 위치 수
+    succeeded: int
+    elapsed_ms: float
@@ -0,0 +1,248 @@
+import asyncio
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+from handler.naver.models import LocalPlace
+from shared.utils.geo import haversine_many, naver_to_wgs84, rank_nearest
+from shared.utils.kdtree import KDTree, chord_length, to_xyz
+from shared.utils.logger.root import log
+
+# 색인 저장 시 한 번에 직렬화하는 업체 수. orjson은 호출 동안 GIL을 잡으므로 나눠서 직렬화해 이벤트 루프가 중간에 실행되도록 함
+_SERIALIZE_BATCH = 2000
+
+def _coordinates(places: List[LocalPlace]) -> Tuple[np.ndarray, np.ndarray]:
+    count = len(places)
+    return naver_to_wgs84(
+        np.fromiter((p.mapx for p in places), dtype=np.int64, count=count),
+        np.fromiter((p.mapy for p in places), dtype=np.int64, count=count)
+    )
+
+
+def rank_places(
+        places: List[LocalPlace],
+        lat: float,
+        lng: float,
+        k: Optional[int] = None,
+        max_distance_m: Optional[float] = None
+) -> List[Tuple[LocalPlace, float]]:
+    """
+    검색 결과를 (lat, lng)에서 가까운 순으로 정렬해 상위 k개를 (업체, 거리(m))로 반환합니다.
+    좌표가 없는 업체는 제외합니다. 경로/좌표 API를 호출하기 전에 후보를 줄이는 용도입니다.
+    """
+    places = [p for p in places if p.mapx and p.mapy]
+    if not places:
+        return []
+    lats, lngs = _coordinates(places)
+    index, distances = rank_nearest(lat, lng, lats, lngs, k=k, max_distance_m=max_distance_m)
+    return [(places[i], float(d)) for i, d in zip(index, distances)]
+
+
+class PlaceIndex:
+    """
+    지역 검색(search_local)으로 수집한 업체의 위치 색인.
+    "X 근처의 Y 카테고리 업체"를 업스트림 호출 없이 찾기 위해 사용합니다.
+
+    - 업체는 link(없으면 제목+주소)로 중복 제거하며, 다시 수집되면 정보와 수집 시각을 갱신
+    - 수집 후 max_age초가 지난 업체는 삭제하고, max_places개를 넘으면 오래 전에 수집한 업체부터 삭제
+    - KD-tree는 추가 후 첫 조회 시점에 다시 만듦 (검색 결과가 들어올 때마다 빌드하지 않음)
+    - path가 있으면 JSON 파일로 저장/복원 (임시 파일에 쓴 뒤 교체하여 원자적으로 저장, 직렬화와 쓰기는 스레드에서)
+    """
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            save_every: int = 50,
+            max_places: Optional[int] = None,
+            max_age: Optional[float] = None,
+            clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.save_every = save_every
+        self.max_places = max_places
+        self.max_age = max_age
+        self._clock = clock
+        self._places: List[LocalPlace] = []
+        self._seen_at: List[float] = []
+        self._slots: Dict[str, int] = {}
+        self._tree: Optional[KDTree] = None
+        self._lats: Optional[np.ndarray] = None
+        self._lngs: Optional[np.ndarray] = None
+        self._loaded = False
+        self._unsaved = 0
+        self._saving: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._places)
+
+    @staticmethod
+    def _key(place: LocalPlace) -> str:
+        return place.link or f"{place.title}|{place.road_address or place.address}"
+
+    # --- 추가 ---
+    def add_many(self, places: Iterable[LocalPlace], seen_at: Optional[float] = None) -> int:
+        """업체를 추가/갱신하고 새로 추가된 개수를 반환합니다. 좌표가 없는 항목은 무시합니다."""
+        self._ensure_loaded()
+        now = self._clock() if seen_at is None else seen_at
+        added = 0
+        for place in places:
+            if not place.mapx or not place.mapy:
+                continue
+            key = self._key(place)
+            slot = self._slots.get(key)
+            if slot is None:
+                self._slots[key] = len(self._places)
+                self._places.append(place)
+                self._seen_at.append(now)
+                added += 1
+            else:
+                previous = self._places[slot]
+                if (previous.mapx, previous.mapy) != (place.mapx, place.mapy):
+                    self._tree = None
+                self._places[slot] = place
+                self._seen_at[slot] = now
+            self._unsaved += 1
+        if added:
+            self._tree = None
+            if self.max_places is not None and len(self._places) > self.max_places:
+                self.evict()
+        return added
+
+    def evict(self) -> int:
+        """
+        max_age가 지난 업체를 삭제하고, 그래도 max_places를 넘으면 오래 전에 수집한 업체부터 삭제합니다.
+        추가할 때마다 다시 정리하지 않도록 max_places의 90%까지 줄이며, 삭제한 개수를 반환합니다.
+        """
+        self._ensure_loaded()
+        if not self._places:
+            return 0
+        seen_at = np.asarray(self._seen_at)
+        keep = np.ones(len(seen_at), dtype=bool)
+        if self.max_age is not None:
+            keep &= self._clock() - seen_at <= self.max_age
+        if self.max_places is not None and np.count_nonzero(keep) > self.max_places:
+            target = max(1, int(self.max_places * 0.9))
+            # 남길 업체 중 최근 수집한 target개
+            candidates = np.flatnonzero(keep)
+            newest = candidates[np.argsort(-seen_at[candidates], kind="stable")[:target]]
+            keep[:] = False
+            keep[newest] = True
+        removed = len(keep) - int(np.count_nonzero(keep))
+        if not removed:
+            return 0
+        slots = np.flatnonzero(keep)
+        self._places = [self._places[i] for i in slots]
+        self._seen_at = [self._seen_at[i] for i in slots]
+        self._slots = {self._key(place): i for i, place in enumerate(self._places)}
+        self._tree = None
+        self._unsaved += removed
+        return removed
+
+    # --- 조회 ---
+    def nearby(
+            self,
+            lat: float,
+            lng: float,
+            radius_m: float,
+            category: Optional[str] = None,
+            max_age: Optional[float] = None,
+            limit: Optional[int] = None
+    ) -> List[Tuple[LocalPlace, float]]:
+        """
+        (lat, lng)에서 radius_m 이내의 업체를 가까운 순으로 반환합니다. [(업체, 거리(m)), ...]
+
+        Args:
+            category: 카테고리(예: "카페", "음식점>한식") 또는 제목에 포함된 문자열로 필터
+            max_age: 수집 후 이 시간(초)이 지난 업체는 제외
+        """
+        self._ensure_loaded()
+        tree = self._get_tree()
+        if tree is None:
+            return []
+        center = to_xyz(np.array([lat]), np.array([lng]))[0]
+        now = self._clock()
+        matched = [
+            i for i in tree.query_radius(center, chord_length(radius_m))
+            if (max_age is None or now - self._seen_at[i] <= max_age)
+            and (not category or category in self._places[i].category or category in self._places[i].title)
+        ]
+        if not matched:
+            return []
+        distances = haversine_many(lat, lng, self._lats[matched], self._lngs[matched])
+        order = np.argsort(distances, kind="stable")[:limit or None]
+        return [(self._places[matched[i]], float(distances[i])) for i in order]
+
+    def _get_tree(self) -> Optional[KDTree]:
+        if self._tree is None and self._places:
+            self._lats, self._lngs = _coordinates(self._places)
+            self._tree = KDTree(to_xyz(self._lats, self._lngs))
+        return self._tree
+
+    # --- 저장/복원 ---
+    def load(self) -> None:
+        """저장된 색인을 읽습니다. 파일이 클 수 있으므로 기동 시 스레드에서 미리 호출 (호출하지 않으면 첫 사용 시)"""
+        self._ensure_loaded()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                data = orjson.loads(f.read())
+            for entry in data:
+                self.add_many([LocalPlace(**entry["place"])], seen_at=entry["seen_at"])
+            self.evict()
+            self._unsaved = 0
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            # 손상된 파일은 무시하고 빈 색인으로 시작 (다음 저장 시 덮어씀)
+            log.warning(f"장소 색인 파일을 읽지 못했습니다: {e}")
+
+    def _snapshot(self) -> Tuple[List[LocalPlace], List[float]]:
+        """
+        저장할 스냅샷. 업체 객체는 갱신 시 교체만 하고 수정하지 않으므로 목록만 복사하면 일관됨
+        (복사는 이벤트 루프에서, 직렬화는 스레드에서)
+        """
+        self.evict()
+        self._unsaved = 0
+        return list(self._places), list(self._seen_at)
+
+    @staticmethod
+    def _serialize(places: List[LocalPlace], seen_at: List[float]) -> bytes:
+        parts = [
+            orjson.dumps([
+                {"place": place, "seen_at": at}
+                for place, at in zip(places[i:i + _SERIALIZE_BATCH], seen_at[i:i + _SERIALIZE_BATCH])
+            ])[1:-1]
+            for i in range(0, len(places), _SERIALIZE_BATCH)
+        ]
+        return b"[" + b",".join(parts) + b"]"
+
+    def _write(self, places: List[LocalPlace], seen_at: List[float]) -> None:
+        data = self._serialize(places, seen_at)
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
+
+    def save(self) -> None:
+        if not self.path or not self._loaded:
+            return
+        self._write(*self._snapshot())
+
+    def schedule_save(self) -> None:
+        """
+        변경이 save_every개 이상 쌓이면 저장합니다.
+        스냅샷(목록 복사)만 이벤트 루프에서 만들고, 직렬화와 파일 쓰기는 스레드에서 수행합니다.
+        """
+        if not self.path or self._unsaved < self.save_every or (self._saving and not self._saving.done()):
+            return
+        self._saving = asyncio.ensure_future(asyncio.to_thread(self._write, *self._snapshot()))
@@ -0,0 +1,173 @@
+"""
+T-Map API 응답용 경량 타입 모델.
+"""
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import orjson
+
+from shared.utils import polyline
+from shared.utils.simplify import douglas_peucker
+
+
+@dataclass(slots=True)
+class RouteSummary:
+    total_distance_m: Optional[int]  # 총 거리 (미터)
+    total_time_sec: Optional[int]  # 총 소요 시간 (초)
+    description: Optional[str]  # 첫 번째 안내 메시지
+
+    @classmethod
+    def from_properties(cls, properties: Dict[str, Any]) -> "RouteSummary":
+        """GeoJSON 첫 번째 Feature(SP)의 properties로부터 생성합니다."""
+        return cls(
+            total_distance_m=properties.get("totalDistance"),
+            total_time_sec=properties.get("totalTime"),
+            description=properties.get("description")
+        )
+
+
+@dataclass(slots=True)
+class RouteMatrix:
+    """
+    N x M 보행 거리/시간 행렬. 중첩 dict 대신 행 우선(row-major) 1차원 배열로 표현합니다.
+    (i, j) 원소의 위치는 i * cols + j 입니다.
+
+    status 코드: 0 = 계산됨, 1 = 직선 거리 기준 초과로 건너뜀, 2 = 조회 실패
+    """
+    rows: int
+    cols: int
+    distance_m: List[Optional[int]]
+    time_sec: List[Optional[int]]
+    status: List[int]
+    computed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed_ms: float = 0.0
+
+    OK = 0
+    SKIPPED = 1
+    ERROR = 2
+
+    def index(self, row: int, col: int) -> int:
+        return row * self.cols + col
+
+
+@dataclass(slots=True)
+class PedestrianRoute:
+    """
+    보행 경로의 요약 정보와 전체 경로 좌표.
+    좌표는 GeoJSON 중첩 리스트 대신 [경도0, 위도0, 경도1, 위도1, ...] 형태의 float64 배열로 보관합니다.
+    (좌표 1개당 16바이트, 같은 좌표의 list/float 객체 대비 약 1/8 크기)
+    """
+    total_distance_m: Optional[int]
+    total_time_sec: Optional[int]
+    coordinates: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        """좌표 개수"""
+        return len(self.coordinates) // 2
+
+    @property
+    def nbytes(self) -> int:
+        return self.coordinates.itemsize * len(self.coordinates) + 64
+
+    def points(self) -> List[List[float]]:
+        """[[경도, 위도], ...]"""
+        coords = self.coordinates
+        return [[coords[i], coords[i + 1]] for i in range(0, len(coords), 2)]
+
+    @classmethod
+    def from_geojson(cls, data: Dict[str, Any]) -> "PedestrianRoute":
+        """
+        T-Map 보행자 경로 FeatureCollection에서 요약 정보(첫 번째 Feature)와
+        LineString 좌표만 추출합니다. 연속된 LineString의 겹치는 끝점/시작점은 한 번만 담습니다.
+        """
+        features = data.get("features") or []
+        properties = (features[0].get("properties") or {}) if features else {}
+        coordinates = array("d")
+        last = None
+        for feature in features:
+            geometry = feature.get("geometry") or {}
+            if geometry.get("type") != "LineString":
+                continue
+            for point in geometry.get("coordinates") or []:
+                if point == last:
+                    continue
+                coordinates.append(point[0])
+                coordinates.append(point[1])
+                last = point
+        return cls(
+            total_distance_m=properties.get("totalDistance"),
+            total_time_sec=properties.get("totalTime"),
+            coordinates=coordinates
+        )
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> "PedestrianRoute":
+        return cls.from_geojson(orjson.loads(raw))
+
+    def as_numpy(self) -> np.ndarray:
+        """좌표 배열을 복사 없이 (N, 2) [경도, 위도] 읽기 전용 NumPy 배열로 반환"""
+        return np.frombuffer(self.coordinates, dtype=np.float64).reshape(-1, 2)
+
+    def simplified(self, tolerance_m: float) -> "PedestrianRoute":
+        """Douglas-Peucker로 tolerance_m(미터)보다 작은 굴곡을 제거한 경로 (요약 정보는 원본 유지)"""
+        points = self.as_numpy()
+        coordinates = array("d")
+        coordinates.frombytes(points[douglas_peucker(points, tolerance_m)].tobytes())
+        return PedestrianRoute(self.total_distance_m, self.total_time_sec, coordinates)
+
+    def to_polyline(self, precision: int = 5) -> str:
+        """Google Encoded Polyline (위도, 경도 순서)"""
+        return polyline.encode_flat(self.coordinates, precision)
+
+    def to_float32_bytes(self) -> bytes:
+        """
+        [경도0, 위도0, 경도1, 위도1, ...] float32 little-endian 바이트.
+        한국 경도 범위에서 float32 정밀도는 약 1m 이내입니다.
+        """
+        packed = array("f", self.coordinates)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        return packed.tobytes()
+
+    def to_geojson(self) -> Dict[str, Any]:
+        """요약 정보를 properties로 가진 단일 LineString Feature의 FeatureCollection"""
+        return {
+            "type": "FeatureCollection",
+            "features": [{
+                "type": "Feature",
+                "geometry": {"type": "LineString", "coordinates": self.points()},
+                "properties": {"totalDistance": self.total_distance_m, "totalTime": self.total_time_sec},
+            }],
+        }
+
+
+@dataclass(slots=True)
+class MultiStopRoute:
+    """
+    여러 경유지를 도는 보행 경로.
+    order는 입력 stops의 방문 순서(인덱스), route는 구간 경로를 이어 붙인 전체 경로입니다.
+    """
+    order: List[int]
+    route: PedestrianRoute
+    legs: int = 1  # T-Map 호출(경유지 5개 단위로 나눈 구간) 수
+    estimated_pairs: int = 0  # 캐시된 경로 요약이 없어 직선 거리로 추정한 지점 쌍 수
+
+    @staticmethod
+    def join(routes: List[PedestrianRoute]) -> PedestrianRoute:
+        """구간 경로를 순서대로 이어 붙임 (구간 경계의 중복 좌표는 한 번만 담음)"""
+        coordinates = array("d")
+        total_distance = total_time = 0
+        for route in routes:
+            coords = route.coordinates
+            if len(coordinates) >= 2 and len(coords) >= 2 and coordinates[-2:] == coords[:2]:
+                coords = coords[2:]
+            coordinates.extend(coords)
+            total_distance += route.total_distance_m or 0
+            total_time += route.total_time_sec or 0
+        return PedestrianRoute(total_distance, total_time, coordinates)
+
@@ -1,7 +1,17 @@
+import time
 import urllib.parse
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from handler.base import BaseClient
+import numpy as np
+
+from handler.base import BaseClient, RawBody, model_reader
+from handler.sk.models import MultiStopRoute, PedestrianRoute, RouteMatrix, RouteSummary
+from shared.infra.wrapper.concurrency_limiter import get_rate_limiter
+from shared.infra.wrapper.resilience import HedgePolicy
+from shared.infra.wrapper.response_cache import CachePolicy, ResponseCache
+from shared.utils.fanout import map_bounded
+from shared.utils.geo import haversine_many, rank_nearest, snap_key
+from shared.utils.tour import order_stops
 from core.config import settings
 from core.exceptions import ExternalAPIError
 
@@ -22,6 +32,20 @@ class TMapClient(BaseClient):
     OPTION_SHORTEST = 10  # 최단거리
     OPTION_SHORTEST_NO_STAIR = 30  # 최단거리 + 계단 제외
 
+    PEDESTRIAN_ENDPOINT = "/tmap/routes/pedestrian?version=1"
+
+    upstream = "tmap"
+    # 경로 탐색은 꼬리 지연이 크므로 설정으로 켜면 p95 이후 헤지 요청 허용
+    hedge_policy = HedgePolicy() if settings.UPSTREAM_HEDGE_ENABLED else None
+    # 보행 경로는 자주 바뀌지 않으므로 좌표 쌍 단위 결과를 길게 캐시
+    cache_policy = CachePolicy(ttl=60 * 60 * 6, stale_while_revalidate=60 * 60)
+    # 캐시 키용 좌표 스냅 단위 (미터)
+    SNAP_TOLERANCE_M = 10.0
+    # 보행자 경로 API의 passList 최대 경유지 수
+    MAX_PASS_POINTS = 5
+    # 캐시된 경로가 없는 지점 쌍의 보행 거리 추정치 = 직선 거리 x 우회 계수
+    DETOUR_FACTOR = 1.3
+
     def __init__(self):
         super().__init__(base_url="https://apis.openapi.sk.com")
         self.headers = {
@@ -29,6 +53,11 @@ class TMapClient(BaseClient):
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        # 좌표 배열을 포함하는 경로는 크기가 커서 공유 응답 캐시와 별도 한도로 관리 (LRU 퇴출)
+        self.route_cache = ResponseCache(
+            max_entries=settings.TMAP_ROUTE_CACHE_MAX_ENTRIES,
+            max_bytes=settings.TMAP_ROUTE_CACHE_MAX_BYTES
+        )
 
     def _url_encode(self, text: str) -> str:
         """
@@ -42,6 +71,35 @@ class TMapClient(BaseClient):
         """
         return urllib.parse.quote(text)
 
+    def _build_pedestrian_payload(
+            self,
+            start_x: float,
+            start_y: float,
+            end_x: float,
+            end_y: float,
+            start_name: str,
+            end_name: str,
+            search_option: int,
+            sort: str,
+            pass_list: Optional[str]
+    ) -> Dict[str, Any]:
+        payload = {
+            "startX": start_x,
+            "startY": start_y,
+            "endX": end_x,
+            "endY": end_y,
+            "startName": self._url_encode(start_name),
+            "endName": self._url_encode(end_name),
+            "searchOption": str(search_option),
+            "sort": sort,
+            "resCoordType": "WGS84GEO",
+            "reqCoordType": "WGS84GEO"
+        }
+
+        if pass_list:
+            payload["passList"] = pass_list
+        return payload
+
     async def get_pedestrian_route(
             self,
             start_x: float,
@@ -78,39 +136,167 @@ class TMapClient(BaseClient):
         Raises:
             ExternalAPIError: API 응답이 4xx, 5xx 에러인 경우 발생
         """
-        endpoint = "/tmap/routes/pedestrian?version=1"
+        payload = self._build_pedestrian_payload(
+            start_x, start_y, end_x, end_y, start_name, end_name, search_option, sort, pass_list
+        )
 
-        payload = {
-            "startX": start_x,
-            "startY": start_y,
-            "endX": end_x,
-            "endY": end_y,
-            "startName": self._url_encode(start_name),
-            "endName": self._url_encode(end_name),
-            "searchOption": str(search_option),
-            "sort": sort,
-            "resCoordType": "WGS84GEO",
-            "reqCoordType": "WGS84GEO"
-        }
+        # 경로 조회는 부수효과가 없는 조회성 POST이므로 재시도/헤지 대상(idempotent)으로 처리
+        return await self.request(
+            "POST",
+            self.PEDESTRIAN_ENDPOINT,
+            json=payload,
+            headers=self.headers,
+            idempotent=True
+        )
 
-        if pass_list:
-            payload["passList"] = pass_list
+    async def get_pedestrian_route_raw(
+            self,
+            start_x: float,
+            start_y: float,
+            end_x: float,
+            end_y: float,
+            start_name: str = "출발지",
+            end_name: str = "목적지",
+            search_option: int = 0,
+            sort: str = "index",
+            pass_list: Optional[str] = None,
+            accept_encoding: Optional[str] = None
+    ) -> RawBody:
+        """
+        [Passthrough] 보행자 경로 GeoJSON을 디코딩하지 않고 원본 바이트 그대로 반환합니다.
+        파라미터는 get_pedestrian_route와 동일합니다.
+        """
+        payload = self._build_pedestrian_payload(
+            start_x, start_y, end_x, end_y, start_name, end_name, search_option, sort, pass_list
+        )
+        return await self.request_raw(
+            "POST",
+            self.PEDESTRIAN_ENDPOINT,
+            accept_encoding=accept_encoding,
+            json=payload,
+            headers=self.headers,
+            idempotent=True
+        )
 
-        return await self.request(
+    async def get_route(
+            self,
+            start_x: float,
+            start_y: float,
+            end_x: float,
+            end_y: float,
+            search_option: int = 0,
+            sort: str = "index",
+            pass_list: Optional[str] = None,
+            cache: bool = True,
+            tolerance_m: Optional[float] = None
+    ) -> PedestrianRoute:
+        """
+        보행 경로를 요약 정보 + 압축 좌표 배열(PedestrianRoute)로 반환합니다.
+        응답 바이트를 바로 PedestrianRoute로 변환하며 GeoJSON dict는 보관하지 않습니다.
+
+        cache=True면 출발지/목적지/경유지를 약 10m 단위로 스냅한 좌표와
+        search_option, sort를 키로 route_cache에서 재사용합니다.
+        tolerance_m을 주면 Douglas-Peucker로 단순화한 경로를 반환하며, 단순화 결과도 허용 오차별로 캐시합니다.
+        (허용 오차는 0.5m 단위로 맞춰 캐시 키가 흩어지지 않게 함)
+        나머지 파라미터는 get_pedestrian_route와 동일합니다.
+        """
+        key = (
+            "pedestrian-route",
+            snap_key(start_y, start_x, self.SNAP_TOLERANCE_M),
+            snap_key(end_y, end_x, self.SNAP_TOLERANCE_M),
+            search_option,
+            sort,
+            self._snap_pass_list(pass_list)
+        )
+        if tolerance_m:
+            tolerance_m = max(0.5, round(tolerance_m * 2) / 2)
+
+            async def load_simplified() -> PedestrianRoute:
+                route = await self.get_route(start_x, start_y, end_x, end_y, search_option, sort, pass_list, cache)
+                return route.simplified(tolerance_m)
+
+            if not cache:
+                return await load_simplified()
+            return await self._fetch_cached(
+                key + (tolerance_m,), load_simplified, lambda route: route.nbytes, cache=self.route_cache
+            )
+
+        payload = self._build_pedestrian_payload(
+            start_x, start_y, end_x, end_y, "출발지", "목적지", search_option, sort, pass_list
+        )
+
+        async def load() -> PedestrianRoute:
+            return await self.request(
+                "POST",
+                self.PEDESTRIAN_ENDPOINT,
+                json=payload,
+                headers=self.headers,
+                idempotent=True,
+                reader=model_reader(PedestrianRoute.from_json)
+            )
+
+        if not cache:
+            return await load()
+        return await self._fetch_cached(key, load, lambda route: route.nbytes, cache=self.route_cache)
+
+    def _snap_pass_list(self, pass_list: Optional[str]) -> tuple:
+        """경유지 "x1,y1_x2,y2"를 스냅한 좌표 튜플로 변환 (순서 유지)"""
+        if not pass_list:
+            return ()
+        snapped = []
+        for waypoint in pass_list.split("_"):
+            x, y = waypoint.split(",")[:2]
+            snapped.append(snap_key(float(y), float(x), self.SNAP_TOLERANCE_M))
+        return tuple(snapped)
+
+    async def get_route_coordinates(
+            self,
+            start_x: float,
+            start_y: float,
+            end_x: float,
+            end_y: float,
+            search_option: int = 0,
+            pass_list: Optional[str] = None
+    ) -> List[List[float]]:
+        """
+        보행자 경로의 LineString 좌표만 순서대로 이어 붙여 반환합니다.
+        응답 GeoJSON 전체를 디코딩하지 않고 각 Feature의 geometry만 스트리밍으로 추출합니다.
+
+        Returns:
+            List[List[float]]: [[경도, 위도], ...]
+        """
+        payload = self._build_pedestrian_payload(
+            start_x, start_y, end_x, end_y, "출발지", "목적지", search_option, "index", pass_list
+        )
+        geometries = await self.request_projection(
             "POST",
-            endpoint,
+            self.PEDESTRIAN_ENDPOINT,
+            ("features", "*", "geometry"),
             json=payload,
-            headers=self.headers
+            headers=self.headers,
+            idempotent=True
         )
 
+        coordinates: List[List[float]] = []
+        for geometry in geometries:
+            if geometry.get("type") != "LineString":
+                continue
+            points = geometry.get("coordinates", [])
+            # 연속된 LineString은 끝점/시작점이 같으므로 중복 제거
+            if coordinates and points and coordinates[-1] == points[0]:
+                points = points[1:]
+            coordinates.extend(points)
+        return coordinates
+
     async def get_route_summary(
             self,
             start_coords: Tuple[float, float],
             end_coords: Tuple[float, float],
             start_name: str = "출발지",
             end_name: str = "목적지",
-            option: int = 10
-    ) -> Dict[str, Any]:
+            option: int = 10,
+            cache: bool = False
+    ) -> RouteSummary:
         """
         보행자 경로 안내 응답에서 실질적으로 필요한 요약 정보(총 거리, 소요 시간)만 추출합니다.
 
@@ -120,43 +306,224 @@ class TMapClient(BaseClient):
             start_name (str): 출발지 명칭
             end_name (str): 목적지 명칭
             option (int): 경로 탐색 옵션 (기본값: 최단거리 10)
+            cache (bool): 좌표 쌍 캐시 사용 여부. 출발지/목적지를 약 10m 단위로 스냅한 키로 결과를 재사용합니다.
 
         Returns:
-            Dict[str, Any]: {
-                "total_distance_m": 총 거리 (미터),
-                "total_time_sec": 총 소요 시간 (초),
-                "description": 첫 번째 안내 메시지
-            }
+            RouteSummary: total_distance_m(총 거리, 미터), total_time_sec(총 소요 시간, 초),
+                description(첫 번째 안내 메시지)
 
         Example:
             summary = await tmap_client.get_route_summary((37.1, 127.1), (37.2, 127.2))
-            print(summary["total_distance_m"]) # 6337
+            print(summary.total_distance_m) # 6337
         """
-        full_data = await self.get_pedestrian_route(
+        async def load() -> RouteSummary:
+            return await self._fetch_route_summary(start_coords, end_coords, start_name, end_name, option)
+
+        if not cache:
+            return await load()
+        return await self._fetch_cached(self._summary_key(start_coords, end_coords, option), load, lambda _: 256)
+
+    def _summary_key(self, start_coords: Tuple[float, float], end_coords: Tuple[float, float], option: int) -> tuple:
+        return (
+            "route-summary",
+            snap_key(start_coords[0], start_coords[1], self.SNAP_TOLERANCE_M),
+            snap_key(end_coords[0], end_coords[1], self.SNAP_TOLERANCE_M),
+            option
+        )
+
+    async def _fetch_route_summary(
+            self,
+            start_coords: Tuple[float, float],
+            end_coords: Tuple[float, float],
+            start_name: str,
+            end_name: str,
+            option: int
+    ) -> RouteSummary:
+        payload = self._build_pedestrian_payload(
             start_x=start_coords[1],  # 경도
             start_y=start_coords[0],  # 위도
             end_x=end_coords[1],
             end_y=end_coords[0],
             start_name=start_name,
             end_name=end_name,
-            search_option=option
+            search_option=option,
+            sort="index",
+            pass_list=None
+        )
+
+        # GeoJSON의 첫 번째 Feature(Point/SP)에 전체 요약 정보가 포함되므로
+        # 나머지 Feature(수천 개의 좌표)는 디코딩하지 않고 해당 properties만 추출
+        projected = await self.request_projection(
+            "POST",
+            self.PEDESTRIAN_ENDPOINT,
+            ("features", 0, "properties"),
+            json=payload,
+            headers=self.headers,
+            idempotent=True
         )
 
         try:
-            # GeoJSON의 첫 번째 Feature(Point/SP)에 전체 요약 정보가 포함됨
-            properties = full_data["features"][0]["properties"]
-            return {
-                "total_distance_m": properties.get("totalDistance"),
-                "total_time_sec": properties.get("totalTime"),
-                "description": properties.get("description")
-            }
-        except (KeyError, IndexError) as e:
+            return RouteSummary.from_properties(projected[0])
+        except (KeyError, IndexError, AttributeError) as e:
             raise ExternalAPIError(
                 service_name="T-Map Pedestrian API",
                 status_code=500,
                 detail=f"응답 데이터 파싱 중 오류가 발생했습니다: {str(e)}"
             )
 
+    async def get_route_matrix(
+            self,
+            origins: List[Tuple[float, float]],
+            destinations: List[Tuple[float, float]],
+            option: int = 0,
+            max_distance_m: Optional[float] = None,
+            concurrency: Optional[int] = None,
+            nearest_k: Optional[int] = None
+    ) -> RouteMatrix:
+        """
+        출발지 N개 x 목적지 M개의 보행 거리/시간 행렬을 계산합니다.
+
+        - 직선(haversine) 거리가 max_distance_m을 넘는 쌍은 T-Map을 호출하지 않고 건너뜀
+        - nearest_k가 있으면 출발지마다 직선 거리가 가까운 목적지 nearest_k개만 계산 (나머지는 건너뜀)
+        - 나머지 쌍은 최대 concurrency개씩 동시에 조회하며, 캐시에 없는 쌍만 속도 한도(RATE_LIMITS["tmap"])를 소모
+        - 쌍별 결과는 get_route_summary(cache=True)와 같은 캐시를 공유
+
+        Args:
+            origins (List[Tuple[float, float]]): 출발지 (위도, 경도) 목록
+            destinations (List[Tuple[float, float]]): 목적지 (위도, 경도) 목록
+            option (int): 경로 탐색 옵션
+            max_distance_m (float, optional): 직선 거리 기준 (기본: settings.TMAP_MATRIX_MAX_DISTANCE_M)
+            concurrency (int, optional): 동시 요청 수 (기본: settings.TMAP_MATRIX_CONCURRENCY)
+            nearest_k (int, optional): 출발지별로 계산할 최대 목적지 수
+
+        Example:
+            matrix = await tmap_client.get_route_matrix([(37.50, 127.06)], [(37.51, 127.06), (37.52, 127.07)])
+            matrix.time_sec[matrix.index(0, 1)]  # 첫 번째 출발지 -> 두 번째 목적지 소요 시간(초)
+        """
+        started = time.perf_counter()
+        max_distance_m = settings.TMAP_MATRIX_MAX_DISTANCE_M if max_distance_m is None else max_distance_m
+        rows, cols = len(origins), len(destinations)
+        size = rows * cols
+        matrix = RouteMatrix(rows=rows, cols=cols, distance_m=[None] * size, time_sec=[None] * size,
+                             status=[RouteMatrix.SKIPPED] * size)
+
+        # 직선 거리로 후보를 먼저 거른 뒤 남은 쌍만 T-Map 호출
+        dest_lats = np.fromiter((d[0] for d in destinations), dtype=np.float64, count=cols)
+        dest_lngs = np.fromiter((d[1] for d in destinations), dtype=np.float64, count=cols)
+        pairs = []
+        for i, origin in enumerate(origins):
+            nearest, _ = rank_nearest(origin[0], origin[1], dest_lats, dest_lngs,
+                                      k=nearest_k, max_distance_m=max_distance_m)
+            pairs.extend((i, int(j)) for j in np.sort(nearest))
+        rate_limiter = get_rate_limiter(self.upstream)
+
+        def pair_loader(origin: Tuple[float, float], destination: Tuple[float, float]) -> Callable[[], Awaitable[RouteSummary]]:
+            async def load() -> RouteSummary:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                return await self._fetch_route_summary(origin, destination, "출발지", "목적지", option)
+            return load
+
+        async def compute(pair: Tuple[int, int]) -> RouteSummary:
+            origin, destination = origins[pair[0]], destinations[pair[1]]
+            return await self._fetch_cached(
+                self._summary_key(origin, destination, option), pair_loader(origin, destination), lambda _: 256
+            )
+
+        outcomes = await map_bounded(compute, pairs, concurrency or settings.TMAP_MATRIX_CONCURRENCY)
+        for (i, j), outcome in zip(pairs, outcomes):
+            k = i * cols + j
+            if outcome.ok:
+                matrix.distance_m[k] = outcome.value.total_distance_m
+                matrix.time_sec[k] = outcome.value.total_time_sec
+                matrix.status[k] = RouteMatrix.OK
+                matrix.computed += 1
+            else:
+                matrix.status[k] = RouteMatrix.ERROR
+                matrix.failed += 1
+
+        matrix.skipped = size - len(pairs)
+        matrix.elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        return matrix
+
+
+    def _tour_cost_matrix(self, points: List[Tuple[float, float]], option: int) -> Tuple[np.ndarray, int]:
+        """
+        지점 간 보행 거리 행렬 (미터). 라이브 호출 없이 TTL 안의 캐시된 경로 요약(get_route_summary/행렬)만 사용하고,
+        캐시에 없거나 만료된 쌍은 직선 거리 x DETOUR_FACTOR로 추정합니다. (추정한 쌍 수를 함께 반환)
+        """
+        lats = np.fromiter((p[0] for p in points), dtype=np.float64, count=len(points))
+        lngs = np.fromiter((p[1] for p in points), dtype=np.float64, count=len(points))
+        cost = np.empty((len(points), len(points)), dtype=np.float64)
+        estimated = 0
+        for i, origin in enumerate(points):
+            cost[i] = haversine_many(origin[0], origin[1], lats, lngs) * self.DETOUR_FACTOR
+            for j, destination in enumerate(points):
+                if i == j:
+                    continue
+                summary = self._cache.get_fresh(self._summary_key(origin, destination, option))
+                if summary is not None and summary.total_distance_m is not None:
+                    cost[i, j] = summary.total_distance_m
+                else:
+                    estimated += 1
+        return cost, estimated
+
+    async def get_multi_stop_route(
+            self,
+            start: Tuple[float, float],
+            stops: List[Tuple[float, float]],
+            end: Optional[Tuple[float, float]] = None,
+            option: int = 0,
+            optimize: bool = True,
+            cache: bool = True,
+            concurrency: Optional[int] = None
+    ) -> MultiStopRoute:
+        """
+        출발지에서 여러 경유지를 거치는 보행 경로를 방문 순서를 최적화해 조회합니다.
+
+        - 방문 순서: 지점 간 거리 행렬에 최근접 이웃 + 2-opt 적용 (end가 있으면 마지막에 고정).
+          거리 행렬은 캐시된 경로 요약만 사용하고 없는 쌍은 직선 거리로 추정하므로 순서 계산에 T-Map 호출이 없음
+        - 경로 조회: 정렬한 경유지를 passList(최대 MAX_PASS_POINTS개)로 보내며,
+          경유지가 더 많으면 구간을 나눠 동시에 요청한 뒤 이어 붙임 (각 구간은 get_route 캐시 사용)
+
+        Args:
+            start (Tuple[float, float]): 출발지 (위도, 경도)
+            stops (List[Tuple[float, float]]): 경유지 (위도, 경도) 목록
+            end (Tuple[float, float], optional): 도착지. 없으면 마지막으로 방문한 경유지에서 끝남
+            option (int): 경로 탐색 옵션
+            optimize (bool): False면 입력 순서대로 방문
+
+        Returns:
+            MultiStopRoute: 방문 순서(stops 인덱스)와 전체 경로
+        """
+        points = [start, *stops] + ([end] if end is not None else [])
+        estimated = 0
+        if optimize and len(stops) > 1:
+            cost, estimated = self._tour_cost_matrix(points, option)
+            path = order_stops(cost, end_fixed=end is not None)
+        else:
+            path = list(range(len(points)))
+
+        # 한 구간 = 시작 + 경유지 최대 MAX_PASS_POINTS개 + 끝. 다음 구간은 이전 구간의 끝에서 시작
+        step = self.MAX_PASS_POINTS + 1
+        legs = [path[k:k + step + 1] for k in range(0, len(path) - 1, step)]
+
+        async def fetch_leg(leg: List[int]) -> PedestrianRoute:
+            (start_lat, start_lng), (end_lat, end_lng) = points[leg[0]], points[leg[-1]]
+            pass_list = "_".join(f"{points[i][1]},{points[i][0]}" for i in leg[1:-1]) or None
+            return await self.get_route(start_lng, start_lat, end_lng, end_lat, option, pass_list=pass_list, cache=cache)
+
+        outcomes = await map_bounded(fetch_leg, legs, concurrency or settings.TMAP_MATRIX_CONCURRENCY)
+        for outcome in outcomes:
+            if not outcome.ok:
+                raise outcome.error
+
+        return MultiStopRoute(
+            order=[i - 1 for i in path[1:] if 1 <= i <= len(stops)],
+            route=MultiStopRoute.join([outcome.value for outcome in outcomes]),
+            legs=len(legs),
+            estimated_pairs=estimated
+        )
 
 # 싱글톤 인스턴스 제공
 tmap_client = TMapClient()
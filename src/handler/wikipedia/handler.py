@@ -1,9 +1,13 @@
 import asyncio
 from shared.infra.wrapper.aiohttp_wrapper import AioHttpClient,get_http_client
+from shared.infra.wrapper.response_cache import CachePolicy
 from fastapi import Depends
 
 class WikipediaHandler:
 
+    # 문서 요약은 자주 바뀌지 않으므로 6시간 캐시, 이후 하루 동안은 stale 응답 + 백그라운드 갱신
+    CACHE_POLICY = CachePolicy(ttl=60 * 60 * 6, stale_while_revalidate=60 * 60 * 24)
+
     def __init__(self, http_client: AioHttpClient):
         self._client = http_client
 
@@ -37,7 +41,8 @@ class WikipediaHandler:
         }
         try:
             # 주입받은 최적화 클라이언트 사용
-            data = await self._client.get(url,headers=headers, params=params)
+            data = await self._client.get(url,headers=headers, params=params, cache=self.CACHE_POLICY,
+                                         upstream="wikipedia")
             return data
         except Exception as e:
             # 에러 발생 시 전체 로직이 죽지 않고 해당 언어만 에러 메시지 반환
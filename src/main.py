@@ -1,7 +1,8 @@
+import asyncio
 from fastapi import FastAPI,Depends,Request,HTTPException
 from starlette.responses import JSONResponse
 
-from core.middleware.log_middleware import TraceIDMiddleWare
+from core.middleware.log_middleware import TraceIDMiddleWare, request_log_middleware
 from contextlib import asynccontextmanager
 from shared.infra.wrapper.aiohttp_wrapper import aiohttp_client, AioHttpClient
 from core.exceptions import register_application_exception,AuthTokenException, \
@@ -9,58 +10,47 @@ from core.exceptions import register_application_exception,AuthTokenException, \
 from shared.utils.logger.root import log
 from shared.utils.logger.context import trace_id_var
 from apis.router import aggregate_router
+from handler.naver.map_handler import naver_map_client, naver_search_client
+from handler.naver.geocode_job import geocode_job_manager
+from core.responses import FastJSONResponse
+from core.config import settings
 import uuid
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 모든 외부 API 클라이언트(BaseClient 하위 클래스, Wikipedia)가 공유하는 커넥션 풀
     await aiohttp_client.initialize_session()
+    # 행정구역 경계 파일은 수십 MB일 수 있으므로 첫 요청 전에 스레드에서 미리 색인
+    if naver_map_client.region_index is not None:
+        await asyncio.to_thread(naver_map_client.region_index.load)
+    # 저장된 장소 색인도 첫 근처 검색 전에 스레드에서 복원
+    await asyncio.to_thread(naver_search_client.place_index.load)
+    # 재시작 전에 끝나지 않은 일괄 지오코딩 작업은 체크포인트부터 이어서 처리
+    await asyncio.to_thread(geocode_job_manager.load)
+    geocode_job_manager.resume_pending()
+    # 지오코딩 영속 캐시의 만료 엔트리를 주기적으로 삭제 (파일이 무한히 커지지 않도록)
+    purge_task = None
+    if naver_map_client.geocode_cache is not None:
+        purge_task = asyncio.create_task(
+            naver_map_client.geocode_cache.run_purge(settings.GEOCODE_CACHE_PURGE_INTERVAL)
+        )
     yield
+    if purge_task is not None:
+        purge_task.cancel()
+    await geocode_job_manager.shutdown()
     await aiohttp_client.close_session()
+    # 수집한 장소 색인을 디스크에 저장 (다음 기동 시 복원)
+    await asyncio.to_thread(naver_search_client.place_index.save)
 
 
-app = FastAPI(title="tutorial", lifespan=lifespan)
+app = FastAPI(title="tutorial", lifespan=lifespan, default_response_class=FastJSONResponse)
 app.include_router(aggregate_router)
 register_application_exception(app)
 #app.add_middleware(TraceIDMiddleWare)
 
 
-from fastapi import Request, Response
-from starlette.responses import JSONResponse
-import uuid
-
-@app.middleware("http")
-async def middleware(request: Request, call_next):
-    trace_id = str(uuid.uuid4())
-    trace_token = trace_id_var.set(trace_id)
-
-    # 1. 요청 바디 읽기
-    decoded_body = {}
-    body = await request.body()
-    # 2. 바디 내용을 로그에 출력 (디코딩 필요 시 .decode() 사용)
-    if body:
-        decoded_body = body.decode('utf-8')
-
-    # 3. 중요: 소비된 스트림을 재설정 (다음 미들웨어나 엔드포인트에서 읽을 수 있도록)
-    async def receive():
-        return {"type": "http.request", "body": body}
-
-    # request 객체의 _receive를 가로챔
-    request._receive = receive
-
-    try:
-        response = await call_next(request)
-        return response
-    except Exception as e:
-        log.error(f"에러 발생 [ID: {trace_id}]: {str(e)}",extra={"body":decoded_body})
-        return JSONResponse(
-            status_code=500,
-            content={"message": "Internal Server Error", "code": 99},
-        )
-    finally:
-        trace_id_var.reset(trace_token)
-
-
-
+# 요청 바디 로깅 + trace id (core.middleware.log_middleware)
+app.middleware("http")(request_log_middleware)
 
 
 @app.get("/error")
@@ -1,8 +1,17 @@
-from aiohttp import ClientSession, TCPConnector, BaseConnector
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, BaseConnector
 from typing import Protocol
 import orjson
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Hashable
+import asyncio
 import socket
+import ssl
+import certifi
+from urllib.parse import urlsplit
+
+from core.config import settings
+from shared.infra.wrapper.concurrency_limiter import get_bulkhead
+from shared.infra.wrapper.response_cache import CachePolicy, CacheableResponse, ResponseCache, response_cache
+from shared.infra.wrapper.singleflight import SingleFlight, make_request_key
 
 
 class HTTPClientSessionInterface(Protocol):
@@ -24,54 +33,152 @@ class HTTPClientSessionInterface(Protocol):
         pass
 
 
+def create_ssl_context() -> ssl.SSLContext:
+    """certifi 인증서 번들을 사용하는 SSL 컨텍스트 (프로세스당 1회 생성 후 재사용)"""
+    return ssl.create_default_context(cafile=certifi.where())
+
+
 class AioHttpClient(HTTPClientSessionInterface):
-    def __init__(self):
+    """
+    모든 외부 API 핸들러가 공유하는 HTTP 전송 계층.
+    하나의 TCPConnector(호스트별 커넥션 제한, Keep-Alive, DNS 캐시)와
+    하나의 SSL 컨텍스트를 재사용하여 중복 TLS 핸드셰이크를 줄입니다.
+    """
+
+    def __init__(self, cache: Optional[ResponseCache] = None):
         self._session: Optional[ClientSession] = None
+        self._cache = cache if cache is not None else response_cache
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._init_lock = asyncio.Lock()
+        self._singleflight = SingleFlight()
+
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            self._ssl_context = create_ssl_context()
+        return self._ssl_context
 
     async def initialize_session(self) -> ClientSession:
         """Lifespan 시작 시 호출: 세션 풀 생성"""
+        if self._session is not None and not self._session.closed:
+            return self._session
+
         connector = TCPConnector(
-            limit=100,
-            ttl_dns_cache=300,
+            limit=settings.HTTP_POOL_LIMIT,
+            limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,
             family=socket.AF_INET,
+            ssl=self.ssl_context,
             enable_cleanup_closed=True
         )
         self._session = ClientSession(
             connector=connector,
+            timeout=ClientTimeout(total=settings.HTTP_REQUEST_TIMEOUT),
             json_serialize=lambda x: orjson.dumps(x).decode("utf-8")
         )
 
         return self._session
 
+    async def get_session(self) -> ClientSession:
+        """
+        공유 세션을 반환합니다.
+        Lifespan 밖(에이전트 단독 실행, 스크립트 등)에서 호출되면 최초 1회 지연 생성합니다.
+        """
+        if self._session is None or self._session.closed:
+            async with self._init_lock:
+                await self.initialize_session()
+        return self._session
+
     async def close_session(self) -> None:
         """Lifespan 종료 시 호출"""
-        if self._session:
+        if self._session and not self._session.closed:
             await self._session.close()
+        self._session = None
 
     # --- 공통 요청 처리 메서드 (내부용) ---
-    async def _request(self, method: str, url: str, **kwargs) -> Optional[dict]:
-        if not self._session:
-            raise RuntimeError("Client is not initialized. Check lifespan.")
+    async def _request(
+            self,
+            method: str,
+            url: str,
+            coalesce: bool = True,
+            cache: Optional[CachePolicy] = None,
+            upstream: Optional[str] = None,
+            **kwargs
+    ) -> Optional[dict]:
         # 기본 헤더 설정 (압축 전송 요청)
-        headers = kwargs.pop("headers", {}) or {}
+        headers = dict(kwargs.pop("headers", None) or {})
         headers.setdefault("Accept-Encoding", "br, gzip, deflate")
         headers.setdefault("Content-Type", "application/json")
-
-        async with self._session.request(method, url, headers=headers, **kwargs) as response:
-            response.raise_for_status()  # 4xx, 5xx 에러 발생 시 예외 송출
-
-            # [Performance] bytes로 읽어서 orjson으로 파싱 (Zero-copy 지향)
-            raw_bytes = await response.read()
-            if not raw_bytes:
-                return None
-            return orjson.loads(raw_bytes)
-
-    async def get(self, url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[dict] = None) -> Any:
-        return await self._request("GET", url, params=params, headers=headers)
-
-    async def post(self, url: str, json: Optional[Dict[str, Any]] = None, headers: Optional[dict] = None) -> Any:
+        # 벌크헤드 이름 (지정하지 않으면 호스트명)
+        kwargs["upstream"] = upstream or urlsplit(url).hostname
+
+        if method != "GET":
+            return (await self._send(method, url, headers=headers, **kwargs)).value
+
+        key = make_request_key(method, url, kwargs.get("params"), headers)
+        if cache is not None:
+            # 캐시 정책이 주어진 호출만 응답 캐시를 거침 (TTL/LRU + stale-while-revalidate)
+            return await self._cache.fetch(
+                key, cache, lambda etag: self._load(method, url, key, coalesce, etag, headers=headers, **kwargs)
+            )
+        return (await self._load(method, url, key, coalesce, headers=headers, **kwargs)).value
+
+    async def _load(
+            self,
+            method: str,
+            url: str,
+            key: Hashable,
+            coalesce: bool,
+            etag: Optional[str] = None,
+            **kwargs
+    ) -> CacheableResponse:
+        if etag:
+            kwargs["headers"] = {**kwargs["headers"], "If-None-Match": etag}
+        if coalesce:
+            # 동일 GET 요청이 동시에 들어오면 업스트림 호출 1회로 합침
+            return await self._singleflight.do((key, etag), lambda: self._send(method, url, **kwargs))
+        return await self._send(method, url, **kwargs)
+
+    async def _send(self, method: str, url: str, upstream: str, **kwargs) -> CacheableResponse:
+        session = await self.get_session()
+        # 업스트림별 벌크헤드: 한 업스트림이 느려져도 다른 업스트림의 커넥션을 잠식하지 않도록 제한
+        async with get_bulkhead(upstream).slot() as permit:
+            async with session.request(method, url, **kwargs) as response:
+                permit.status = response.status
+                if response.status == 304:
+                    return CacheableResponse(status=304, value=None)
+                response.raise_for_status()  # 4xx, 5xx 에러 발생 시 예외 송출
+
+                # [Performance] bytes로 읽어서 orjson으로 파싱 (Zero-copy 지향)
+                raw_bytes = await response.read()
+                return CacheableResponse(
+                    status=response.status,
+                    value=orjson.loads(raw_bytes) if raw_bytes else None,
+                    size=len(raw_bytes),
+                    etag=response.headers.get("ETag"),
+                    cache_control=response.headers.get("Cache-Control")
+                )
+
+    async def get(
+            self,
+            url: str,
+            params: Optional[Dict[str, Any]] = None,
+            headers: Optional[dict] = None,
+            cache: Optional[CachePolicy] = None,
+            upstream: Optional[str] = None
+    ) -> Any:
+        return await self._request("GET", url, params=params, headers=headers, cache=cache, upstream=upstream)
+
+    async def post(
+            self,
+            url: str,
+            json: Optional[Dict[str, Any]] = None,
+            headers: Optional[dict] = None,
+            upstream: Optional[str] = None
+    ) -> Any:
         # aiohttp의 json= 파라미터는 위에서 설정한 json_serialize(orjson)를 사용함
-        return await self._request("POST", url, json=json, headers=headers)
+        return await self._request("POST", url, json=json, headers=headers, upstream=upstream)
 
 
 
@@ -0,0 +1,258 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Deque, Dict, Optional, Tuple
+
+
+class BulkheadFullError(Exception):
+    """업스트림 벌크헤드의 대기열이 가득 찼거나 대기 시간이 초과된 경우"""
+
+    def __init__(self, name: str, detail: str):
+        self.name = name
+        self.detail = detail
+        super().__init__(f"[{name}] {detail}")
+
+
+@dataclass(frozen=True)
+class BulkheadConfig:
+    """
+    Attributes:
+        initial_limit: 시작 동시 요청 수
+        min_limit / max_limit: 동시 요청 수 하한/상한
+        max_queue: 슬롯을 기다릴 수 있는 최대 요청 수 (초과 시 즉시 거절)
+        queue_timeout: 슬롯 대기 최대 시간(초), None이면 무제한
+        backoff_ratio: 과부하 신호(429/5xx/타임아웃/지연 증가) 시 limit에 곱하는 비율
+        latency_tolerance: 최근 지연이 기준 지연의 몇 배를 넘으면 과부하로 볼지
+    """
+    initial_limit: int = 10
+    min_limit: int = 1
+    max_limit: int = 100
+    max_queue: int = 200
+    queue_timeout: Optional[float] = 5.0
+    backoff_ratio: float = 0.7
+    latency_tolerance: float = 2.0
+
+
+class _Permit:
+    __slots__ = ("status",)
+
+    def __init__(self):
+        # 업스트림 응답 상태 코드. 응답 없이 예외로 끝나면 None
+        self.status: Optional[int] = None
+
+
+class AdaptiveLimiter:
+    """
+    업스트림 하나에 대한 AIMD(Additive Increase / Multiplicative Decrease) 동시성 제한기.
+
+    - 정상 응답마다 limit을 1/limit씩 증가 (대략 왕복 1회당 +1)
+    - 429, 5xx, 타임아웃, 지연 급증 시 limit에 backoff_ratio를 곱해 감소 (왕복 1회당 최대 1번)
+    - 슬롯이 없으면 제한된 크기의 FIFO 대기열에서 기다리고, 가득 차면 BulkheadFullError
+    """
+
+    _SHORT_ALPHA = 0.2
+    _LONG_ALPHA = 0.01
+    _WARMUP_SAMPLES = 20
+
+    def __init__(self, name: str, config: Optional[BulkheadConfig] = None, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.config = config or BulkheadConfig()
+        self._clock = clock
+        self._limit = float(self.config.initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._recent_latency: Optional[float] = None
+        self._baseline_latency: Optional[float] = None
+        self._samples = 0
+        self._last_decrease = float("-inf")
+        self.rejected = 0
+        self.overloads = 0
+
+    @property
+    def limit(self) -> int:
+        return max(self.config.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "recent_latency": self._recent_latency or 0.0,
+            "baseline_latency": self._baseline_latency or 0.0,
+            "rejected": self.rejected,
+            "overloads": self.overloads,
+        }
+
+    async def acquire(self) -> None:
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return
+        if len(self._waiters) >= self.config.max_queue:
+            self.rejected += 1
+            raise BulkheadFullError(self.name, "대기열이 가득 찼습니다.")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.config.queue_timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 슬롯을 반납
+                self._release_slot()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(e, asyncio.TimeoutError):
+                self.rejected += 1
+                raise BulkheadFullError(self.name, "슬롯 대기 시간이 초과되었습니다.") from None
+            raise
+
+    def release(self, latency: float, overloaded: bool) -> None:
+        self._observe(latency, overloaded)
+        self._release_slot()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[_Permit]:
+        """
+        사용 예:
+            async with limiter.slot() as permit:
+                async with session.request(...) as response:
+                    permit.status = response.status
+        """
+        await self.acquire()
+        permit = _Permit()
+        started = self._clock()
+        overloaded = True
+        try:
+            yield permit
+            overloaded = self._is_overload_status(permit.status)
+        except asyncio.CancelledError:
+            # 호출자 취소는 업스트림 상태와 무관
+            overloaded = False
+            raise
+        except Exception:
+            overloaded = permit.status is None or self._is_overload_status(permit.status)
+            raise
+        finally:
+            self.release(self._clock() - started, overloaded)
+
+    @staticmethod
+    def _is_overload_status(status: Optional[int]) -> bool:
+        return status is not None and (status == 429 or status >= 500)
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _observe(self, latency: float, overloaded: bool) -> None:
+        if not overloaded:
+            self._samples += 1
+            self._recent_latency = latency if self._recent_latency is None else (
+                self._recent_latency + self._SHORT_ALPHA * (latency - self._recent_latency))
+            self._baseline_latency = latency if self._baseline_latency is None else (
+                self._baseline_latency + self._LONG_ALPHA * (latency - self._baseline_latency))
+            overloaded = (
+                self._samples >= self._WARMUP_SAMPLES
+                and self._recent_latency > self._baseline_latency * self.config.latency_tolerance
+            )
+
+        if overloaded:
+            self.overloads += 1
+            now = self._clock()
+            # 같은 혼잡 구간에서 연속 감소하지 않도록 최근 왕복 시간만큼은 한 번만 감소
+            if now - self._last_decrease >= (self._recent_latency or 0.0):
+                self._last_decrease = now
+                self._limit = max(float(self.config.min_limit), self._limit * self.config.backoff_ratio)
+        elif self._in_flight >= self.limit:
+            # 실제로 limit까지 사용 중일 때만 증가 (유휴 상태에서 limit이 무한정 커지는 것 방지)
+            self._limit = min(float(self.config.max_limit), self._limit + 1.0 / self._limit)
+
+
+# 업스트림별 벌크헤드 설정
+BULKHEAD_CONFIGS: Dict[str, BulkheadConfig] = {
+    "naver-maps": BulkheadConfig(initial_limit=20, max_limit=60),
+    "naver-search": BulkheadConfig(initial_limit=5, max_limit=20),
+    "tmap": BulkheadConfig(initial_limit=10, max_limit=40),
+    "wikipedia": BulkheadConfig(initial_limit=10, max_limit=40),
+}
+
+_bulkheads: Dict[str, AdaptiveLimiter] = {}
+
+
+def get_bulkhead(name: str) -> AdaptiveLimiter:
+    """업스트림 이름별 벌크헤드(싱글톤)를 반환합니다. 설정이 없는 업스트림은 기본값을 사용합니다."""
+    limiter = _bulkheads.get(name)
+    if limiter is None:
+        limiter = AdaptiveLimiter(name, BULKHEAD_CONFIGS.get(name))
+        _bulkheads[name] = limiter
+    return limiter
+
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 요청 속도 제한기 (초당 rate개, 최대 burst개까지 몰아서 허용).
+    동시성(벌크헤드)과 별개로, 일일/초당 호출 한도가 있는 업스트림에 대량 요청을 보낼 때 사용합니다.
+    """
+
+    def __init__(self, name: str, rate: float, burst: Optional[int] = None, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+        self.waited = 0.0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        # 락 안에서 기다리므로 토큰은 도착 순서(FIFO)대로 배분됨
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                self.waited += delay
+                await asyncio.sleep(delay)
+                self._refill()
+            self._tokens -= 1
+
+
+# 업스트림별 요청 속도 한도 (초당 요청 수, burst)
+RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "tmap": (10.0, 10),
+    "naver-search": (10.0, 5),
+}
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(name: str) -> Optional[RateLimiter]:
+    """업스트림 이름별 속도 제한기(싱글톤)를 반환합니다. 한도가 설정되지 않은 업스트림은 None"""
+    limiter = _rate_limiters.get(name)
+    if limiter is None and name in RATE_LIMITS:
+        rate, burst = RATE_LIMITS[name]
+        limiter = RateLimiter(name, rate, burst)
+        _rate_limiters[name] = limiter
+    return limiter
@@ -0,0 +1,145 @@
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, FrozenSet, Optional
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    지수 백오프(Full Jitter) 재시도 정책. 멱등 요청에만 적용됩니다.
+
+    Attributes:
+        max_attempts: 최초 요청을 포함한 최대 시도 횟수
+        base_delay / max_delay: 백오프 기준/최대 대기 시간(초)
+        retry_statuses: 재시도 대상 상태 코드
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+    retry_statuses: FrozenSet[int] = frozenset({408, 429, 500, 502, 503, 504})
+
+    def backoff(self, attempt: int) -> float:
+        """attempt(0부터)번째 실패 후 대기 시간: uniform(0, min(max_delay, base_delay * 2^attempt))"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """
+    Attributes:
+        failure_threshold: 연속 실패가 이 횟수에 도달하면 OPEN
+        recovery_timeout: OPEN 유지 시간(초). 이후 HALF_OPEN으로 전환하여 시험 요청 허용
+        half_open_max_calls: HALF_OPEN 상태에서 동시에 허용하는 시험 요청 수
+    """
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    최근 지연 분포의 분위수(p95 등)만큼 기다려도 응답이 없으면 동일 요청을 한 번 더 보내고
+    먼저 끝난 응답을 사용합니다.
+
+    Attributes:
+        quantile: 헤지 지연 기준 분위수
+        min_delay / max_delay: 헤지 지연 하한/상한(초)
+        min_samples: 헤지를 시작하기 위한 최소 지연 샘플 수 (그 전에는 헤지하지 않음)
+    """
+    quantile: float = 0.95
+    min_delay: float = 0.05
+    max_delay: float = 2.0
+    min_samples: int = 20
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않은 경우"""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"[{name}] circuit open (retry after {retry_after:.1f}s)")
+
+
+class CircuitBreaker:
+    """
+    CLOSED -> (연속 실패) -> OPEN -> (recovery_timeout 경과) -> HALF_OPEN
+    HALF_OPEN에서 시험 요청이 성공하면 CLOSED, 실패하면 다시 OPEN.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, policy: Optional[CircuitBreakerPolicy] = None, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.policy = policy or CircuitBreakerPolicy()
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.policy.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._half_open_calls = 0
+        return self._state
+
+    def before_call(self) -> None:
+        """요청 전에 호출. 요청을 보낼 수 없으면 CircuitOpenError"""
+        state = self.state
+        if state == self.OPEN:
+            raise CircuitOpenError(self.name, self.policy.recovery_timeout - (self._clock() - self._opened_at))
+        if state == self.HALF_OPEN:
+            if self._half_open_calls >= self.policy.half_open_max_calls:
+                raise CircuitOpenError(self.name, 0.0)
+            self._half_open_calls += 1
+
+    def cancel_call(self) -> None:
+        """결과 없이 끝난 요청(호출자 취소)의 HALF_OPEN 시험 슬롯을 반납합니다."""
+        if self._state == self.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._failures = 0
+        self._half_open_calls = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self.policy.failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+            self._half_open_calls = 0
+
+
+@dataclass
+class LatencyTracker:
+    """최근 N개 성공 응답의 지연 시간(초)을 보관하고 분위수를 계산합니다."""
+    window: int = 200
+    _samples: Deque[float] = field(default_factory=deque)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, latency: float) -> None:
+        self._samples.append(latency)
+        if len(self._samples) > self.window:
+            self._samples.popleft()
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def hedge_delay(self, policy: HedgePolicy) -> Optional[float]:
+        """샘플이 부족하면 None (헤지하지 않음)"""
+        if len(self._samples) < policy.min_samples:
+            return None
+        return min(policy.max_delay, max(policy.min_delay, self.quantile(policy.quantile)))
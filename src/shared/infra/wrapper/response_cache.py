@@ -0,0 +1,264 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+from shared.utils.logger.root import log
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    업스트림별 응답 캐시 정책.
+
+    Attributes:
+        ttl (float): 신선(fresh) 상태로 간주하는 시간(초)
+        stale_while_revalidate (float): TTL 만료 후 캐시 값을 즉시 반환하면서
+            백그라운드에서 갱신하는 허용 시간(초)
+        respect_cache_control (bool): 업스트림 Cache-Control(max-age, no-store 등)을 따를지 여부
+    """
+    ttl: float
+    stale_while_revalidate: float = 0.0
+    respect_cache_control: bool = True
+
+
+@dataclass
+class CacheableResponse:
+    """캐시 계층과 HTTP 클라이언트 사이에서 주고받는 응답 단위"""
+    status: int
+    value: Any
+    size: int = 0
+    etag: Optional[str] = None
+    cache_control: Optional[str] = None
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    size: int
+    expires_at: float
+    stale_until: float
+    etag: Optional[str] = None
+
+
+def parse_cache_control(header: Optional[str]) -> Dict[str, Optional[str]]:
+    """'max-age=60, no-cache' -> {"max-age": "60", "no-cache": None}"""
+    directives: Dict[str, Optional[str]] = {}
+    if not header:
+        return directives
+    for part in header.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, value = part.partition("=")
+        directives[name.strip().lower()] = value.strip().strip('"') or None
+    return directives
+
+
+def _directive_seconds(directives: Dict[str, Optional[str]], name: str) -> Optional[float]:
+    try:
+        return float(directives[name]) if directives.get(name) is not None else None
+    except ValueError:
+        return None
+
+
+class ResponseCache:
+    """
+    메모리 상한(엔트리 수, 바이트 크기)을 가진 LRU 응답 캐시.
+
+    - TTL 이내: 캐시 값 반환 (hit)
+    - TTL 경과 + stale-while-revalidate 이내: 캐시 값을 즉시 반환하고 백그라운드에서 갱신
+    - 그 외: ETag가 있으면 If-None-Match로 재검증, 304면 기존 값을 연장하여 사용
+    """
+
+    def __init__(
+            self,
+            max_entries: int = 2048,
+            max_bytes: int = 64 * 1024 * 1024,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._refreshing: Set[Hashable] = set()
+        self._background_tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+        }
+
+    # --- 저장소 연산 ---
+    def get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def get_fresh(self, key: Hashable) -> Any:
+        """TTL 안의 값만 반환합니다. 없거나 만료됐으면 None (업스트림 호출/통계 갱신 없음)"""
+        entry = self.get_entry(key)
+        if entry is None or self._clock() >= entry.expires_at:
+            return None
+        return entry.value
+
+    def set(
+            self,
+            key: Hashable,
+            value: Any,
+            size: int,
+            ttl: float,
+            stale_while_revalidate: float = 0.0,
+            etag: Optional[str] = None
+    ) -> None:
+        if size > self.max_bytes:
+            return
+        self.invalidate(key)
+        now = self._clock()
+        entry = CacheEntry(
+            value=value,
+            size=size,
+            expires_at=now + ttl,
+            stale_until=now + ttl + stale_while_revalidate,
+            etag=etag
+        )
+        self._entries[key] = entry
+        self._total_bytes += size
+        self._evict()
+
+    def invalidate(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self._total_bytes -= entry.size
+            self.evictions += 1
+
+    # --- 정책 적용 ---
+    def _store(self, key: Hashable, response: CacheableResponse, policy: CachePolicy) -> None:
+        ttl = policy.ttl
+        swr = policy.stale_while_revalidate
+        if policy.respect_cache_control and response.cache_control:
+            directives = parse_cache_control(response.cache_control)
+            if "no-store" in directives or "private" in directives:
+                return
+            if "no-cache" in directives:
+                # 저장은 하되 매번 ETag 재검증
+                ttl = 0.0
+            max_age = _directive_seconds(directives, "max-age")
+            if max_age is not None:
+                ttl = min(ttl, max_age)
+            upstream_swr = _directive_seconds(directives, "stale-while-revalidate")
+            if upstream_swr is not None:
+                swr = max(swr, upstream_swr)
+
+        if ttl <= 0 and not response.etag:
+            return
+        self.set(key, response.value, response.size, ttl, swr, response.etag)
+
+    async def fetch(
+            self,
+            key: Hashable,
+            policy: CachePolicy,
+            loader: Callable[[Optional[str]], Awaitable[CacheableResponse]]
+    ) -> Any:
+        """
+        캐시를 거쳐 값을 조회합니다.
+
+        Args:
+            key: 요청 키 (make_request_key 결과)
+            policy: 적용할 캐시 정책
+            loader: etag(없으면 None)를 받아 업스트림을 호출하는 코루틴 함수.
+                etag가 주어지면 If-None-Match 헤더를 실어 보내야 합니다.
+        """
+        entry = self.get_entry(key)
+        now = self._clock()
+
+        if entry is not None and now < entry.expires_at:
+            self.hits += 1
+            return entry.value
+
+        if entry is not None and now < entry.stale_until:
+            self.stale_hits += 1
+            self._schedule_refresh(key, policy, loader)
+            return entry.value
+
+        self.misses += 1
+        return await self._load(key, policy, loader, entry)
+
+    async def _load(
+            self,
+            key: Hashable,
+            policy: CachePolicy,
+            loader: Callable[[Optional[str]], Awaitable[CacheableResponse]],
+            entry: Optional[CacheEntry]
+    ) -> Any:
+        response = await loader(entry.etag if entry else None)
+        if response.status == 304 and entry is not None:
+            self.revalidations += 1
+            self.set(key, entry.value, entry.size, policy.ttl, policy.stale_while_revalidate, entry.etag)
+            return entry.value
+        self._store(key, response, policy)
+        return response.value
+
+    def _schedule_refresh(
+            self,
+            key: Hashable,
+            policy: CachePolicy,
+            loader: Callable[[Optional[str]], Awaitable[CacheableResponse]]
+    ) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh():
+            try:
+                await self._load(key, policy, loader, self._entries.get(key))
+            except Exception as e:
+                # 갱신 실패 시 기존 값은 stale 기간 동안 계속 사용
+                log.warning(f"캐시 백그라운드 갱신 실패: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.ensure_future(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+
+# 싱글톤 인스턴스 (모든 HTTP 클라이언트가 공유, 메모리 상한 일원화)
+response_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    return response_cache
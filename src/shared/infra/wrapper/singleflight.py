@@ -0,0 +1,68 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def make_request_key(
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None
+) -> Tuple:
+    """
+    동일 요청 판별용 키를 생성합니다.
+    파라미터는 정렬 + 문자열화하여 순서/타입 차이(1 vs "1")를 흡수하고,
+    헤더는 이름을 소문자로 정규화합니다. (인증 헤더가 다르면 다른 요청으로 취급)
+    """
+    norm_params = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None))
+    norm_headers = tuple(sorted((k.lower(), str(v)) for k, v in (headers or {}).items()))
+    return method.upper(), url, norm_params, norm_headers
+
+
+class _Call:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    동일 키로 동시에 들어온 비동기 호출을 하나의 업스트림 호출로 합칩니다.
+
+    - 최초 호출자만 실제 코루틴을 실행하고, 나머지는 같은 Task의 결과를 공유합니다.
+    - 예외는 대기 중인 모든 호출자에게 동일하게 전파됩니다.
+    - 한 호출자가 취소되어도 다른 호출자의 요청은 계속 진행되며,
+      모든 호출자가 취소된 경우에만 업스트림 호출을 취소합니다.
+    - 결과 객체는 호출자 간에 공유되므로 수정하지 않고 읽기 전용으로 사용해야 합니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, _Call] = {}
+
+    @property
+    def inflight_count(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        call = self._inflight.get(key)
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()))
+            self._inflight[key] = call
+            call.task.add_done_callback(lambda _, c=call: self._forget(key, c))
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # 결과를 기다리는 호출자가 더 이상 없으면 업스트림 호출도 중단
+                call.task.cancel()
+                self._forget(key, call)
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        if self._inflight.get(key) is call:
+            del self._inflight[key]
@@ -0,0 +1,176 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from shared.utils.logger.root import log
+
+
+class SqliteCache:
+    """
+    SQLite 기반 영속 key-value 캐시 (TTL 지원).
+    같은 호스트의 여러 워커 프로세스가 하나의 파일을 공유하며, 재시작 후에도 유지됩니다.
+
+    - WAL 모드: 읽기는 쓰기에 막히지 않으므로 조회는 이벤트 루프에서 바로 수행
+    - 쓰기는 잠금 대기(busy_timeout)가 생길 수 있어 스레드로 넘겨 실행 (aset)
+    - 커넥션은 프로세스별로 생성 (fork 이후 부모 커넥션을 재사용하지 않음)
+    - 만료된 값은 조회 시 miss로 처리하고, purge_expired()로 일괄 삭제 (run_purge로 주기 실행)
+
+    Example:
+        cache = SqliteCache("geocode_cache.sqlite3", namespace="geocode")
+        value = cache.get("경기도 성남시 분당구 불정로 6")
+        if value is None:
+            value = await load()
+            await cache.aset("경기도 성남시 분당구 불정로 6", value, ttl=86400)
+    """
+
+    def __init__(
+            self,
+            path: str,
+            namespace: str = "default",
+            busy_timeout: float = 5.0,
+            clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.namespace = namespace
+        self.busy_timeout = busy_timeout
+        self._clock = clock
+        self._pid: Optional[int] = None
+        self._reader: Optional[sqlite3.Connection] = None
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.writes = 0
+        self.purged = 0
+        self.errors = 0
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "writes": self.writes,
+            "purged": self.purged,
+            "errors": self.errors,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    # --- 커넥션 ---
+    def _connect(self) -> sqlite3.Connection:
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL에서는 NORMAL이어도 커밋 단위 일관성이 보장됨 (체크포인트 시에만 fsync)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value BLOB NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key)"
+            ") WITHOUT ROWID"
+        )
+        # 만료 엔트리 일괄 삭제(purge_expired)가 전체 테이블을 훑지 않도록
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (namespace, expires_at)")
+        return conn
+
+    def _ensure_connections(self) -> None:
+        if self._pid == os.getpid():
+            return
+        self._reader = self._connect()
+        self._writer = self._connect()
+        self._pid = os.getpid()
+
+    def close(self) -> None:
+        for conn in (self._reader, self._writer):
+            if conn is not None and self._pid == os.getpid():
+                conn.close()
+        self._reader = self._writer = None
+        self._pid = None
+
+    # --- 조회/저장 ---
+    def get(self, key: str) -> Optional[bytes]:
+        """값을 반환합니다. 없거나 만료되었으면 None (miss)"""
+        try:
+            self._ensure_connections()
+            row = self._reader.execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+        except sqlite3.Error:
+            # 캐시 장애는 조회 실패(miss)로만 취급하고 업스트림 호출로 대체
+            self.errors += 1
+            self.misses += 1
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+        if row[1] <= self._clock():
+            self.expired += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        try:
+            self._ensure_connections()
+            with self._write_lock:
+                self._writer.execute(
+                    "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (self.namespace, key, value, self._clock() + ttl)
+                )
+            self.writes += 1
+        except sqlite3.Error:
+            self.errors += 1
+
+    async def aset(self, key: str, value: bytes, ttl: float) -> None:
+        """set()을 스레드에서 실행 (다른 워커의 쓰기 잠금을 기다리는 동안 이벤트 루프를 막지 않음)"""
+        self._ensure_connections()
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        self._ensure_connections()
+        with self._write_lock:
+            self._writer.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key))
+
+    def purge_expired(self) -> int:
+        """만료된 엔트리를 삭제하고 삭제한 개수를 반환합니다."""
+        self._ensure_connections()
+        with self._write_lock:
+            cursor = self._writer.execute(
+                "DELETE FROM cache WHERE namespace = ? AND expires_at <= ?",
+                (self.namespace, self._clock())
+            )
+        self.purged += cursor.rowcount
+        return cursor.rowcount
+
+    async def run_purge(self, interval: float) -> None:
+        """
+        interval초마다 만료된 엔트리를 스레드에서 삭제합니다. (lifespan에서 태스크로 실행하고 종료 시 취소)
+        여러 워커가 같은 파일에 실행해도 삭제만 중복될 뿐 결과는 같음
+        """
+        while True:
+            try:
+                removed = await asyncio.to_thread(self.purge_expired)
+                if removed:
+                    log.info(f"영속 캐시 만료 엔트리 삭제 ({self.namespace}): {removed}개")
+            except sqlite3.Error as e:
+                self.errors += 1
+                log.warning(f"영속 캐시 만료 엔트리 삭제 실패 ({self.namespace}): {e}")
+            await asyncio.sleep(interval)
+
+    def __len__(self) -> int:
+        self._ensure_connections()
+        return self._reader.execute(
+            "SELECT COUNT(*) FROM cache WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
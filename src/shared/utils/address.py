@@ -0,0 +1,70 @@
+"""
+한국 주소 문자열 정규화.
+같은 주소의 표기 차이(공백, 문장부호, 시/도 약칭, 도로명/지번 번호 표기)를 하나의 키로 모읍니다.
+"""
+import re
+import unicodedata
+
+
+# 시/도 약칭 -> 정식 명칭
+_SIDO_ALIASES = {
+    "서울": "서울특별시", "서울시": "서울특별시",
+    "부산": "부산광역시", "부산시": "부산광역시",
+    "대구": "대구광역시", "대구시": "대구광역시",
+    "인천": "인천광역시", "인천시": "인천광역시",
+    "광주": "광주광역시",  # "광주시"는 경기도 광주시와 겹치므로 변환하지 않음
+    "대전": "대전광역시", "대전시": "대전광역시",
+    "울산": "울산광역시", "울산시": "울산광역시",
+    "세종": "세종특별자치시", "세종시": "세종특별자치시",
+    "경기": "경기도",
+    "강원": "강원특별자치도", "강원도": "강원특별자치도",
+    "충북": "충청북도",
+    "충남": "충청남도",
+    "전북": "전북특별자치도", "전라북도": "전북특별자치도",
+    "전남": "전라남도",
+    "경북": "경상북도",
+    "경남": "경상남도",
+    "제주": "제주특별자치도", "제주도": "제주특별자치도",
+}
+
+# 괄호 안의 참고항목 (예: "(정자동)", "(역삼동, OO빌딩)")
+_PARENTHESIZED = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+# "178번지 1호", "178 번지" -> "178-1", "178"
+_LOT_SUFFIX = re.compile(r"(\d+)\s*번지(?:\s*(\d+)\s*호)?")
+# "178 - 1" -> "178-1"
+_NUMBER_DASH = re.compile(r"(\d+)\s*[-‐‑–—~]\s*(\d+)")
+# 도로명과 건물번호 사이 공백 통일: "불정로6" -> "불정로 6", "테헤란로 12길3" -> "테헤란로12길 3"
+_ROAD_NUMBER = re.compile(r"(\S+?(?:로|길))\s*(\d+(?:-\d+)?)(?=\s|$)")
+_ROAD_SPLIT = re.compile(r"(\S+로)\s+(\d+(?:번)?길)")
+# 하이픈을 제외한 문장부호
+_PUNCTUATION = re.compile(r"[^\w\s-]")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_address(address: str) -> str:
+    """
+    주소를 캐시 키용 정규형으로 변환합니다.
+
+    Example:
+        normalize_address("경기 성남시 분당구 불정로6 (정자동)")
+        # "경기도 성남시 분당구 불정로 6"
+        normalize_address("서울시 강남구 역삼동 737번지")
+        # "서울특별시 강남구 역삼동 737"
+    """
+    text = unicodedata.normalize("NFKC", address).lower()
+    text = _PARENTHESIZED.sub(" ", text)
+    text = _LOT_SUFFIX.sub(lambda m: f"{m.group(1)}-{m.group(2)}" if m.group(2) else m.group(1), text)
+    text = _NUMBER_DASH.sub(r"\1-\2", text)
+    text = _PUNCTUATION.sub(" ", text)
+    text = _SPACES.sub(" ", text).strip()
+
+    tokens = text.split(" ")
+    if tokens and tokens[0] == "대한민국":
+        tokens = tokens[1:]
+    if tokens:
+        tokens[0] = _SIDO_ALIASES.get(tokens[0], tokens[0])
+    text = " ".join(tokens)
+
+    # "테헤란로 12길" -> "테헤란로12길" (도로명 표기 통일) 후 건물번호 앞 공백 통일
+    text = _ROAD_SPLIT.sub(r"\1\2", text)
+    return _ROAD_NUMBER.sub(r"\1 \2", text)
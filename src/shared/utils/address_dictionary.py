@@ -0,0 +1,230 @@
+"""
+오프라인 주소 사전 (정규화 주소 -> 위경도).
+
+CSV 덤프(address, lat, lng 컬럼)를 정규화된 주소 순으로 정렬한 바이너리 파일로 한 번 변환해 두고,
+서버는 이 파일을 mmap으로 열어 이진 탐색/접두사 탐색합니다. (파일 전체를 메모리에 올리지 않음)
+
+파일 구조 (리틀 엔디언, 8바이트 정렬):
+    magic(8) | count(uint64) | offsets(uint64 x (count + 1)) | coords(float64 x count x 2) | keys(UTF-8)
+    - keys: 정규화 주소를 UTF-8 바이트 순으로 정렬해 이어 붙인 것 (i번째 키 = keys[offsets[i]:offsets[i + 1]])
+    - coords: [위도, 경도] 쌍
+
+Example:
+    python -m shared.utils.address_dictionary build juso.csv data/address_dictionary.bin
+"""
+import argparse
+import asyncio
+import csv
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from shared.utils.address import normalize_address
+from shared.utils.logger.root import log
+
+
+_MAGIC = b"ADRDICT1"
+_HEADER = struct.Struct("<8sQ")
+
+
+def build(rows: Iterable[Tuple[str, float, float]], out_path: str) -> int:
+    """(주소, 위도, 경도) 목록으로 사전 파일을 만들고 항목 수를 반환합니다. 정규화 후 같은 주소는 마지막 값을 사용"""
+    entries: Dict[bytes, Tuple[float, float]] = {}
+    for address, lat, lng in rows:
+        key = normalize_address(address)
+        if key:
+            entries[key.encode("utf-8")] = (float(lat), float(lng))
+
+    keys = sorted(entries)
+    offsets = np.zeros(len(keys) + 1, dtype="<u8")
+    offsets[1:] = np.cumsum([len(key) for key in keys])
+    coords = np.array([entries[key] for key in keys], dtype="<f8").reshape(-1, 2)
+
+    if os.path.dirname(out_path):
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    tmp_path = f"{out_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(keys)))
+        f.write(offsets.tobytes())
+        f.write(coords.tobytes())
+        f.write(b"".join(keys))
+    os.replace(tmp_path, out_path)
+    return len(keys)
+
+
+def read_csv(path: str) -> Iterator[Tuple[str, float, float]]:
+    """address, lat, lng 컬럼이 있는 CSV(UTF-8, 헤더 포함)를 읽습니다. 좌표가 잘못된 행은 건너뜀"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            try:
+                yield row["address"], float(row["lat"]), float(row["lng"])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+
+class AddressDictionary:
+    """
+    오프라인 지오코딩 사전.
+
+    - path: build()로 만든 사전 파일 (읽기 전용, mmap). 없으면 오버레이만 사용
+    - overlay_path: 사전에 없어 네트워크로 조회한 결과를 덧붙여 쓰는 CSV (재시작 시 다시 읽음).
+      사전 파일을 다시 만들 때 원본 덤프와 함께 입력으로 넣으면 됩니다.
+
+    키는 모두 normalize_address()로 정규화한 주소입니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, overlay_path: Optional[str] = None):
+        self.path = path
+        self.overlay_path = overlay_path
+        self._mm: Optional[mmap.mmap] = None
+        self._count = 0
+        self._offsets: Optional[np.ndarray] = None
+        self._coords: Optional[np.ndarray] = None
+        self._keys_at = 0
+        self._overlay: Dict[str, Tuple[float, float]] = {}
+        self._overlay_lock = threading.Lock()
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return self._count + len(self._overlay)
+
+    # --- 로드 ---
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path and os.path.exists(self.path):
+            try:
+                self._open(self.path)
+            except (OSError, ValueError) as e:
+                log.warning(f"주소 사전 파일을 열지 못했습니다: {e}")
+        if self.overlay_path and os.path.exists(self.overlay_path):
+            for address, lat, lng in read_csv(self.overlay_path):
+                self._overlay[normalize_address(address)] = (lat, lng)
+
+    def _open(self, path: str) -> None:
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC:
+            mm.close()
+            raise ValueError(f"주소 사전 형식이 아닙니다: {path}")
+        offsets_at = _HEADER.size
+        coords_at = offsets_at + 8 * (count + 1)
+        # 배열은 mmap 영역을 그대로 참조 (복사 없음)
+        self._offsets = np.frombuffer(mm, dtype="<u8", count=count + 1, offset=offsets_at)
+        self._coords = np.frombuffer(mm, dtype="<f8", count=count * 2, offset=coords_at).reshape(-1, 2)
+        self._keys_at = coords_at + 16 * count
+        self._count = count
+        self._mm = mm
+
+    def _key(self, i: int) -> bytes:
+        start = self._keys_at + int(self._offsets[i])
+        return self._mm[start:self._keys_at + int(self._offsets[i + 1])]
+
+    def _lower_bound(self, target: bytes) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    # --- 조회 ---
+    def lookup(self, address: str) -> Optional[Tuple[float, float]]:
+        """주소의 (위도, 경도). 사전과 오버레이 어디에도 없으면 None"""
+        self._ensure_loaded()
+        key = normalize_address(address)
+        coords = self._overlay.get(key)
+        if coords is None and self._count:
+            target = key.encode("utf-8")
+            i = self._lower_bound(target)
+            if i < self._count and self._key(i) == target:
+                lat, lng = self._coords[i]
+                coords = (float(lat), float(lng))
+        if coords is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return coords
+
+    def prefix(self, prefix: str, limit: int = 20) -> List[Tuple[str, float, float]]:
+        """정규화 주소가 prefix로 시작하는 항목 (주소 자동완성용). 사전 파일만 검색하며 주소 순으로 반환"""
+        self._ensure_loaded()
+        target = normalize_address(prefix).encode("utf-8")
+        results = []
+        i = self._lower_bound(target)
+        while i < self._count and len(results) < limit:
+            key = self._key(i)
+            if not key.startswith(target):
+                break
+            lat, lng = self._coords[i]
+            results.append((key.decode("utf-8"), float(lat), float(lng)))
+            i += 1
+        return results
+
+    # --- 오버레이 ---
+    async def remember(self, address: str, lat: float, lng: float) -> None:
+        """네트워크로 조회한 결과를 오버레이에 추가합니다. 파일 쓰기는 스레드에서 수행"""
+        self._ensure_loaded()
+        key = normalize_address(address)
+        if not key or key in self._overlay:
+            return
+        self._overlay[key] = (lat, lng)
+        if self.overlay_path:
+            await asyncio.to_thread(self._append_overlay, key, lat, lng)
+
+    def _append_overlay(self, key: str, lat: float, lng: float) -> None:
+        with self._overlay_lock:
+            try:
+                if os.path.dirname(self.overlay_path):
+                    os.makedirs(os.path.dirname(self.overlay_path), exist_ok=True)
+                is_new = not os.path.exists(self.overlay_path)
+                with open(self.overlay_path, "a", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    if is_new:
+                        writer.writerow(["address", "lat", "lng"])
+                    writer.writerow([key, lat, lng])
+            except OSError as e:
+                # 메모리 오버레이에는 남아 있으므로 조회에는 영향 없음 (재시작 후에만 유실)
+                log.warning(f"주소 사전 오버레이 저장 실패: {e}")
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._count,
+            "overlay_entries": len(self._overlay),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="주소 CSV 덤프로 오프라인 주소 사전 파일을 만듭니다.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_parser = sub.add_parser("build")
+    build_parser.add_argument("inputs", nargs="+", help="address, lat, lng 컬럼이 있는 CSV (오버레이 CSV 포함 가능)")
+    build_parser.add_argument("output", help="출력 사전 파일 경로")
+    args = parser.parse_args()
+
+    def rows():
+        for path in args.inputs:
+            yield from read_csv(path)
+
+    count = build(rows(), args.output)
+    print(f"{count} addresses -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+
+@dataclass(slots=True)
+class Outcome:
+    """단일 작업 결과. 실패하면 error에 예외가 담기고 value는 None"""
+    value: Any = None
+    error: Optional[BaseException] = None
+    latency: float = 0.0  # 초
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def map_bounded(
+        fn: Callable[[T], Awaitable[Any]],
+        items: Iterable[T],
+        concurrency: int
+) -> List[Outcome]:
+    """
+    items 각각에 fn을 최대 concurrency개까지 동시에 실행하고 입력 순서대로 결과를 반환합니다.
+    한 작업의 예외는 다른 작업에 영향을 주지 않고 해당 Outcome.error로 반환됩니다.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(item: T) -> Outcome:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                value = await fn(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                return Outcome(error=e, latency=time.perf_counter() - started)
+            return Outcome(value=value, latency=time.perf_counter() - started)
+
+    return await asyncio.gather(*(run(item) for item in items))
+
+
+async def map_unique(
+        fn: Callable[[T], Awaitable[Any]],
+        items: List[T],
+        key: Callable[[T], K],
+        concurrency: int
+) -> Tuple[List[Outcome], int]:
+    """
+    key가 같은 항목은 한 번만 실행하고 결과를 원래 위치에 나눠 담습니다. (dedupe -> fan-out -> scatter)
+    대표 항목은 key별로 처음 등장한 항목입니다.
+
+    Returns:
+        (입력 순서대로의 결과 목록, 실제로 실행한 고유 항목 수)
+    """
+    slots: Dict[Hashable, int] = {}
+    unique: List[T] = []
+    positions: List[int] = []
+    for item in items:
+        k = key(item)
+        slot = slots.get(k)
+        if slot is None:
+            slot = slots[k] = len(unique)
+            unique.append(item)
+        positions.append(slot)
+
+    outcomes = await map_bounded(fn, unique, concurrency)
+    return [outcomes[slot] for slot in positions], len(unique)
@@ -0,0 +1,112 @@
+"""
+좌표 계산 유틸리티 (WGS84 위경도).
+스칼라 함수(haversine_m 등)와 함께, 후보가 많을 때 쓰는 NumPy 배열 버전(*_many, rank_nearest)을 제공합니다.
+"""
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+EARTH_RADIUS_M = 6_371_008.8
+# 위도 1도의 길이 (미터)
+METERS_PER_DEGREE = 111_320.0
+
+
+def snap_key(lat: float, lng: float, tolerance_m: float) -> Tuple[int, int]:
+    """
+    좌표를 한 변이 tolerance_m인 격자 칸 번호로 변환합니다.
+    같은 칸의 좌표는 같은 키를 가지므로 허용 오차 안의 좌표를 하나로 묶을 때 사용합니다.
+    경도 방향 칸 크기는 위도에 따라 보정합니다 (위도 칸 번호 기준이므로 같은 행의 칸 크기는 동일).
+    """
+    lat_step = tolerance_m / METERS_PER_DEGREE
+    row = math.floor(lat / lat_step)
+    row_lat = (row + 0.5) * lat_step
+    lng_step = lat_step / max(math.cos(math.radians(row_lat)), 1e-6)
+    return row, math.floor(lng / lng_step)
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 대원 거리 (미터)"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+# --- NumPy 배열 버전 ---
+def naver_to_wgs84(mapx, mapy) -> Tuple[np.ndarray, np.ndarray]:
+    """네이버 지역 검색 좌표(WGS84 x 10^7 정수) 배열 -> (위도 배열, 경도 배열)"""
+    return np.asarray(mapy, dtype=np.float64) / 1e7, np.asarray(mapx, dtype=np.float64) / 1e7
+
+
+def haversine_many(lat: float, lng: float, lats, lngs) -> np.ndarray:
+    """한 지점에서 여러 지점까지의 대원 거리 (미터) 배열"""
+    phi1 = math.radians(lat)
+    phi2 = np.radians(lats)
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(np.asarray(lngs, dtype=np.float64) - lng)
+    a = np.sin(d_phi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def bearing_many(lat: float, lng: float, lats, lngs) -> np.ndarray:
+    """한 지점에서 여러 지점을 바라보는 초기 방위각 (도, 북쪽 0 기준 시계 방향 0~360)"""
+    phi1 = math.radians(lat)
+    phi2 = np.radians(lats)
+    d_lambda = np.radians(np.asarray(lngs, dtype=np.float64) - lng)
+    y = np.sin(d_lambda) * np.cos(phi2)
+    x = math.cos(phi1) * np.sin(phi2) - math.sin(phi1) * np.cos(phi2) * np.cos(d_lambda)
+    return np.degrees(np.arctan2(y, x)) % 360.0
+
+
+def bbox_around(lat: float, lng: float, radius_m: float) -> Tuple[float, float, float, float]:
+    """(lat, lng) 중심 반경 radius_m 원을 감싸는 경계 상자 (최소 위도, 최소 경도, 최대 위도, 최대 경도)"""
+    d_lat = radius_m / METERS_PER_DEGREE
+    d_lng = d_lat / max(math.cos(math.radians(min(abs(lat) + d_lat, 89.9))), 1e-6)
+    return lat - d_lat, lng - d_lng, lat + d_lat, lng + d_lng
+
+
+def in_bbox(lats, lngs, bbox: Tuple[float, float, float, float]) -> np.ndarray:
+    """경계 상자 안에 있는 지점의 불리언 마스크"""
+    min_lat, min_lng, max_lat, max_lng = bbox
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    return (lats >= min_lat) & (lats <= max_lat) & (lngs >= min_lng) & (lngs <= max_lng)
+
+
+def rank_nearest(
+        lat: float,
+        lng: float,
+        lats,
+        lngs,
+        k: Optional[int] = None,
+        max_distance_m: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (lat, lng)에서 가까운 지점 k개의 인덱스와 거리(미터)를 가까운 순으로 반환합니다.
+    max_distance_m이 있으면 경계 상자로 먼저 거른 뒤 남은 지점만 거리를 계산합니다.
+    경로 API처럼 비싼 호출 전에 후보를 줄일 때 사용합니다.
+
+    Example:
+        lats, lngs = naver_to_wgs84([p.mapx for p in places], [p.mapy for p in places])
+        index, distance = rank_nearest(37.40, 127.11, lats, lngs, k=3, max_distance_m=2000)
+        nearest = [places[i] for i in index]
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    candidates = np.arange(len(lats))
+    if max_distance_m is not None:
+        candidates = np.flatnonzero(in_bbox(lats, lngs, bbox_around(lat, lng, max_distance_m)))
+    distances = haversine_many(lat, lng, lats[candidates], lngs[candidates])
+    if max_distance_m is not None:
+        within = distances <= max_distance_m
+        candidates, distances = candidates[within], distances[within]
+    if k is not None and k < len(distances):
+        # 전체 정렬 대신 상위 k개만 골라 정렬
+        top = np.argpartition(distances, k)[:k]
+        candidates, distances = candidates[top], distances[top]
+    order = np.argsort(distances, kind="stable")
+    return candidates[order], distances[order]
@@ -0,0 +1,215 @@
+import re
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import orjson
+
+PathItem = Union[str, int]
+WILDCARD = "*"
+
+# 구조 문자만 빠르게 찾고, 숫자/리터럴/공백은 건너뜀
+_TOKEN = re.compile(rb'[{}\[\],:"]')
+# 관심 없는(또는 통째로 캡처 중인) 하위 트리는 괄호와 문자열만 추적하며 건너뜀
+_BRACKET = re.compile(rb'[{}\[\]"]')
+# 좌표 배열처럼 문자열/중첩이 없는 평탄한 배열이 연속된 구간은 정규식 한 번에 건너뜀
+_FLAT_ARRAYS = re.compile(rb'(?:\[[^\[\]{}"]*\][\s,]*)+')
+# 여는 따옴표 다음부터 닫는 따옴표까지 (이스케이프 처리)
+_STRING_BODY = re.compile(rb'(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+class JsonProjection:
+    """
+    JSON 문서를 청크 단위로 받아 지정한 경로의 값만 디코딩하는 증분 파서.
+    전체 객체 트리를 만들지 않고, 경로에 해당하는 바이트 구간만 orjson으로 디코딩합니다.
+
+    경로는 객체 키(str)와 배열 인덱스(int)로 구성하며 "*"는 모든 키/인덱스와 일치합니다.
+
+    Example:
+        # 첫 번째 Feature의 properties만 추출
+        projection = JsonProjection(("features", 0, "properties"))
+        for chunk in chunks:
+            projection.feed(chunk)
+            if projection.done:
+                break
+        properties = projection.results[0]
+
+        # 모든 Feature의 geometry 추출
+        JsonProjection(("features", "*", "geometry"))
+    """
+
+    def __init__(self, path: Sequence[PathItem], max_matches: Optional[int] = None):
+        self.path: Tuple[PathItem, ...] = tuple(path)
+        if max_matches is None and WILDCARD not in self.path:
+            max_matches = 1
+        self.max_matches = max_matches
+        self.results: List[Any] = []
+
+        self._buf = bytearray()
+        self._base = 0  # _buf[0]의 문서 내 절대 위치
+        self._pos = 0  # 다음에 읽을 _buf 내 위치
+        # 프레임: [컨테이너 종류(b"{" / b"["), 현재 키 또는 인덱스, 키를 기다리는 중인지]
+        self._stack: List[list] = []
+        self._primitive_start: Optional[int] = 0  # 숫자/리터럴 값이 시작될 수 있는 절대 위치
+        self._capture_start: Optional[int] = None
+        # 0보다 크면 하위 트리를 건너뛰는(또는 캡처하는) 중이며, 값은 남은 괄호 깊이
+        self._opaque_depth = 0
+        self._finished = False
+
+    @property
+    def done(self) -> bool:
+        """필요한 값을 모두 찾았거나 문서가 끝났으면 True (이후 청크는 읽지 않아도 됨)"""
+        if self._finished:
+            return True
+        return self.max_matches is not None and len(self.results) >= self.max_matches
+
+    def feed(self, chunk: bytes) -> None:
+        if self.done:
+            return
+        self._buf += chunk
+        self._scan()
+        self._compact()
+
+    # --- 내부 구현 ---
+    def _matches(self) -> bool:
+        """현재 위치에서 시작하는 값의 경로가 대상 경로와 일치하는지"""
+        if len(self._stack) != len(self.path):
+            return False
+        for frame, expected in zip(self._stack, self.path):
+            if expected != WILDCARD and frame[1] != expected:
+                return False
+        return True
+
+    def _on_path(self) -> bool:
+        """현재 위치에서 시작하는 값 안에 대상 경로가 있을 수 있는지 (경로의 접두사인지)"""
+        if len(self._stack) >= len(self.path):
+            return False
+        for frame, expected in zip(self._stack, self.path):
+            if expected != WILDCARD and frame[1] != expected:
+                return False
+        return True
+
+    def _emit(self, raw: bytes) -> None:
+        self.results.append(orjson.loads(raw))
+
+    def _end_primitive(self, end: int) -> None:
+        start = self._primitive_start
+        self._primitive_start = None
+        if start is None:
+            return
+        raw = bytes(self._buf[start - self._base:end]).strip()
+        if raw and self._matches():
+            self._emit(raw)
+
+    def _scan_opaque(self) -> bool:
+        """하위 트리 끝까지 건너뜀. 청크가 부족하면 False"""
+        buf = self._buf
+        depth = self._opaque_depth
+        pos = self._pos
+        while depth:
+            m = _BRACKET.search(buf, pos)
+            if m is None:
+                pos = len(buf)
+                break
+            i = m.start()
+            c = buf[i]
+            if c == 0x22:  # "
+                end = _STRING_BODY.match(buf, i + 1)
+                if end is None:
+                    pos = i
+                    break
+                pos = end.end()
+                continue
+            if c == 0x5B:  # [
+                flat = _FLAT_ARRAYS.match(buf, i)
+                if flat is not None and flat.end() < len(buf):
+                    pos = flat.end()
+                    continue
+            depth += 1 if c in b"{[" else -1
+            pos = i + 1
+        self._opaque_depth = depth
+        self._pos = pos
+        if depth:
+            return False
+        if self._capture_start is not None:
+            self._emit(bytes(buf[self._capture_start - self._base:pos]))
+            self._capture_start = None
+        return True
+
+    def _scan(self) -> None:
+        buf = self._buf
+        stack = self._stack
+        while not self.done:
+            if self._opaque_depth and not self._scan_opaque():
+                return
+            m = _TOKEN.search(buf, self._pos)
+            if m is None:
+                return
+            i = m.start()
+            c = buf[i:i + 1]
+
+            if c == b'"':
+                end = _STRING_BODY.match(buf, i + 1)
+                if end is None:
+                    # 문자열이 다음 청크로 이어짐
+                    self._pos = i
+                    return
+                self._pos = end.end()
+                top = stack[-1] if stack else None
+                if top is not None and top[0] == b"{" and top[2]:
+                    raw_key = bytes(buf[i + 1:self._pos - 1])
+                    top[1] = orjson.loads(b'"' + raw_key + b'"') if b"\\" in raw_key else raw_key.decode()
+                else:
+                    self._primitive_start = None
+                    if self._matches():
+                        self._emit(bytes(buf[i:self._pos]))
+                continue
+
+            self._pos = i + 1
+            if c == b"{" or c == b"[":
+                self._primitive_start = None
+                if self._matches():
+                    # 대상 값: 끝 괄호까지 통째로 잘라 한 번에 디코딩
+                    self._capture_start = self._base + i
+                    self._opaque_depth = 1
+                elif not self._on_path():
+                    # 대상 경로와 무관한 하위 트리는 파싱하지 않고 건너뜀
+                    self._opaque_depth = 1
+                elif c == b"{":
+                    stack.append([c, None, True])
+                else:
+                    stack.append([c, 0, False])
+                    self._primitive_start = self._base + i + 1
+            elif c == b":":
+                stack[-1][2] = False
+                self._primitive_start = self._base + i + 1
+            elif c == b",":
+                self._end_primitive(i)
+                top = stack[-1]
+                if top[0] == b"{":
+                    top[2] = True
+                else:
+                    top[1] += 1
+                    self._primitive_start = self._base + i + 1
+            else:  # } or ]
+                self._end_primitive(i)
+                stack.pop()
+                if not stack:
+                    self._finished = True
+
+    def _compact(self) -> None:
+        """이미 처리한 바이트를 버려 메모리를 일정하게 유지 (캡처 중인 구간은 보존)"""
+        keep_from = self._base + self._pos
+        for start in (self._capture_start, self._primitive_start):
+            if start is not None:
+                keep_from = min(keep_from, start)
+        drop = keep_from - self._base
+        if drop > 0:
+            del self._buf[:drop]
+            self._base += drop
+            self._pos -= drop
+
+
+def project(document: bytes, path: Sequence[PathItem], max_matches: Optional[int] = None) -> List[Any]:
+    """메모리에 있는 JSON 바이트에서 경로에 해당하는 값만 디코딩합니다."""
+    projection = JsonProjection(path, max_matches)
+    projection.feed(document)
+    return projection.results
@@ -0,0 +1,91 @@
+"""
+위경도 점 반경 검색용 KD-tree.
+점을 지구 중심 3차원 좌표(미터)로 바꿔 저장하므로 현 길이(chord) 기준 유클리드 거리로
+대원 거리 반경 검색을 정확히 할 수 있습니다. (경도 방향 왜곡/날짜변경선 문제 없음)
+"""
+import math
+from typing import List
+
+import numpy as np
+
+from shared.utils.geo import EARTH_RADIUS_M
+
+
+def to_xyz(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """위경도 배열 -> (N, 3) 지구 중심 좌표 (미터)"""
+    phi = np.radians(lats)
+    lam = np.radians(lngs)
+    cos_phi = np.cos(phi)
+    return np.column_stack([cos_phi * np.cos(lam), cos_phi * np.sin(lam), np.sin(phi)]) * EARTH_RADIUS_M
+
+
+def chord_length(distance_m: float) -> float:
+    """대원 거리 -> 같은 두 점 사이의 직선(현) 거리"""
+    return 2 * EARTH_RADIUS_M * math.sin(min(distance_m / (2 * EARTH_RADIUS_M), math.pi / 2))
+
+
+class KDTree:
+    """
+    정적 KD-tree. 점이 추가되면 새로 만들어야 합니다. (N log N 빌드)
+    노드마다 경계 상자를 보관하여 반경 검색 시 상자까지의 거리로 가지치기하고,
+    리프(leaf_size개 이하)는 NumPy로 한 번에 거리를 계산합니다.
+    """
+
+    def __init__(self, points: np.ndarray, leaf_size: int = 16):
+        self.points = np.asarray(points, dtype=np.float64)
+        self.leaf_size = leaf_size
+        self.index = np.arange(len(self.points))
+        self._lo: List[np.ndarray] = []
+        self._hi: List[np.ndarray] = []
+        self._range: List[tuple] = []  # (start, end)
+        self._children: List[tuple] = []  # (left, right), 리프는 (-1, -1)
+        if len(self.points):
+            self._build(0, len(self.points))
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _build(self, start: int, end: int) -> int:
+        node = len(self._range)
+        segment = self.index[start:end]
+        pts = self.points[segment]
+        lo, hi = pts.min(axis=0), pts.max(axis=0)
+        self._lo.append(lo)
+        self._hi.append(hi)
+        self._range.append((start, end))
+        self._children.append((-1, -1))
+        if end - start > self.leaf_size:
+            # 가장 넓게 퍼진 축의 중앙값으로 분할
+            axis = int(np.argmax(hi - lo))
+            mid = (start + end) // 2
+            order = np.argpartition(pts[:, axis], mid - start)
+            self.index[start:end] = segment[order]
+            left = self._build(start, mid)
+            right = self._build(mid, end)
+            self._children[node] = (left, right)
+        return node
+
+    def query_radius(self, center: np.ndarray, radius: float) -> np.ndarray:
+        """center로부터 radius(같은 좌표 단위) 이내 점의 인덱스"""
+        if not len(self.points):
+            return np.empty(0, dtype=np.intp)
+        center = np.asarray(center, dtype=np.float64)
+        radius_sq = radius * radius
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            # 경계 상자까지의 최단 거리로 가지치기
+            gap = np.maximum(np.maximum(self._lo[node] - center, center - self._hi[node]), 0.0)
+            if gap @ gap > radius_sq:
+                continue
+            left, right = self._children[node]
+            if left < 0:
+                start, end = self._range[node]
+                candidates = self.index[start:end]
+                diff = self.points[candidates] - center
+                found.append(candidates[np.einsum("ij,ij->i", diff, diff) <= radius_sq])
+            else:
+                stack.append(left)
+                stack.append(right)
+        return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
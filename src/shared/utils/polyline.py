@@ -0,0 +1,54 @@
+"""
+Google Encoded Polyline Algorithm Format 인코딩/디코딩.
+https://developers.google.com/maps/documentation/utilities/polylinealgorithm
+"""
+from typing import List, Sequence, Tuple
+
+
+def _encode_value(value: int, out: List[str]) -> None:
+    value = ~(value << 1) if value < 0 else value << 1
+    while value >= 0x20:
+        out.append(chr((0x20 | (value & 0x1F)) + 63))
+        value >>= 5
+    out.append(chr(value + 63))
+
+
+def encode_flat(coordinates: Sequence[float], precision: int = 5) -> str:
+    """
+    [경도0, 위도0, 경도1, 위도1, ...] 평탄 배열을 인코딩합니다.
+    (폴리라인 형식은 위도, 경도 순서이므로 순서를 바꿔서 인코딩)
+    """
+    factor = 10 ** precision
+    out: List[str] = []
+    prev_lat = prev_lng = 0
+    for i in range(0, len(coordinates) - 1, 2):
+        lat = round(coordinates[i + 1] * factor)
+        lng = round(coordinates[i] * factor)
+        _encode_value(lat - prev_lat, out)
+        _encode_value(lng - prev_lng, out)
+        prev_lat, prev_lng = lat, lng
+    return "".join(out)
+
+
+def decode(polyline: str, precision: int = 5) -> List[Tuple[float, float]]:
+    """[(위도, 경도), ...]"""
+    factor = 10 ** precision
+    points: List[Tuple[float, float]] = []
+    index = lat = lng = 0
+    length = len(polyline)
+    while index < length:
+        deltas = []
+        for _ in range(2):
+            shift = result = 0
+            while True:
+                b = ord(polyline[index]) - 63
+                index += 1
+                result |= (b & 0x1F) << shift
+                shift += 5
+                if b < 0x20:
+                    break
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+        lat += deltas[0]
+        lng += deltas[1]
+        points.append((lat / factor, lng / factor))
+    return points
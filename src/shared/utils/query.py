@@ -0,0 +1,47 @@
+"""
+검색어 정규화.
+같은 의도의 검색어 표기 차이(유니코드 조합, 공백, 문장부호, 조사, 키워드 순서)를 하나의 캐시 키로 모읍니다.
+"""
+import re
+import unicodedata
+
+
+# 검색어 토큰(공백 기준) 끝에 붙는 조사 (긴 것부터 검사).
+# 한 글자 조사는 명사 끝 글자로 거의 쓰이지 않는 것만 사용. 아래는 명사 끝 글자와 겹쳐 제외
+#   이/가/도/로: "떡볶이", "한우명가", "제주도", "을지로"
+#   과/의/을/와/랑: "피부과", "민주주의", "한마을", "오타와", "노랑"
+_PARTICLES = (
+    "에서는", "으로는", "에서", "으로", "이랑", "까지", "부터", "에게", "한테", "처럼",
+    "은", "는", "를", "에",
+)
+# 조사를 떼고 남는 글자가 이보다 짧으면 떼지 않음 ("사과" -> "사" 방지)
+_MIN_STEM = 2
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_SPACES = re.compile(r"\s+")
+_HANGUL = re.compile(r"[가-힣]$")
+
+
+def _strip_particle(token: str) -> str:
+    if not _HANGUL.search(token):
+        return token
+    for particle in _PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= _MIN_STEM:
+            return token[:-len(particle)]
+    return token
+
+
+def normalize_search_query(query: str) -> str:
+    """
+    검색어를 캐시 키용 정규형으로 변환합니다.
+
+    Example:
+        normalize_search_query("판교역  맛집!")      # "맛집 판교역"
+        normalize_search_query("맛집 판교역에서")    # "맛집 판교역"
+        normalize_search_query("ＰＡＮＧＹＯ 카페")  # "pangyo 카페"
+    """
+    text = unicodedata.normalize("NFKC", query).lower()
+    text = _PUNCTUATION.sub(" ", text)
+    text = _SPACES.sub(" ", text).strip()
+    # 조사는 토큰 끝에서만 뗌 (토큰 중간이나 검색어 전체 문자열에는 적용하지 않음)
+    tokens = {_strip_particle(token) for token in text.split(" ") if token}
+    return " ".join(sorted(tokens))
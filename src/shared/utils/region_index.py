@@ -0,0 +1,221 @@
+"""
+행정구역 경계 GeoJSON 기반 오프라인 지역 조회 (좌표 -> 시/도, 시/군/구, 읍/면/동).
+
+- 폴리곤 경계 상자를 STR(Sort-Tile-Recursive) 방식으로 묶은 트리로 후보 폴리곤을 고르고
+- 후보마다 모든 변을 NumPy로 한 번에 검사하는 교차 횟수(even-odd) 판정으로 포함 여부를 확인합니다.
+  (외곽선과 구멍(hole)을 같은 변 배열에 담으므로 구멍 안의 점은 자동으로 제외)
+"""
+import math
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+from shared.utils.logger.root import log
+
+
+# 지역 명칭 속성 이름 (경계 데이터 출처별로 다름)
+_AREA_KEYS = (
+    ("area1", "area2", "area3", "area4"),
+    ("sido_nm", "sgg_nm", "emd_nm", "ri_nm"),
+    ("SIDO_NM", "SGG_NM", "EMD_NM", "RI_NM"),
+)
+# "서울특별시 종로구 사직동"처럼 전체 명칭 하나로 주는 경우
+_FULL_NAME_KEYS = ("adm_nm", "ADM_NM", "name", "NAME")
+
+
+def region_names(properties: Dict[str, Any]) -> Optional[Tuple[str, str, str, str]]:
+    """Feature 속성에서 (시/도, 시/군/구, 읍/면/동, 리) 명칭을 추출합니다. 명칭이 없으면 None"""
+    for keys in _AREA_KEYS:
+        if any(properties.get(key) for key in keys):
+            return tuple(str(properties.get(key) or "") for key in keys)  # type: ignore[return-value]
+    for key in _FULL_NAME_KEYS:
+        tokens = str(properties.get(key) or "").split()
+        if len(tokens) >= 3:
+            # 시/군/구는 "성남시 분당구"처럼 두 단어일 수 있음 (네이버 area2 표기와 같음)
+            return tokens[0], " ".join(tokens[1:-1]), tokens[-1], ""
+        if tokens:
+            return tokens[0], tokens[1] if len(tokens) > 1 else "", "", ""
+    return None
+
+
+class _Polygon:
+    __slots__ = ("names", "x1", "y1", "x2", "y2")
+
+    def __init__(self, names: Tuple[str, str, str, str], rings: List[List[List[float]]]):
+        self.names = names
+        starts, ends = [], []
+        for ring in rings:
+            points = np.asarray(ring, dtype=np.float64)[:, :2]
+            if len(points) < 3:
+                continue
+            starts.append(points)
+            ends.append(np.roll(points, -1, axis=0))
+        start = np.concatenate(starts) if starts else np.empty((0, 2))
+        end = np.concatenate(ends) if ends else np.empty((0, 2))
+        self.x1, self.y1 = start[:, 0].copy(), start[:, 1].copy()
+        self.x2, self.y2 = end[:, 0].copy(), end[:, 1].copy()
+
+    def bbox(self) -> Tuple[float, float, float, float]:
+        return float(self.x1.min()), float(self.y1.min()), float(self.x1.max()), float(self.y1.max())
+
+    def contains(self, x: float, y: float) -> bool:
+        crosses = (self.y1 > y) != (self.y2 > y)
+        if not crosses.any():
+            return False
+        x1, y1, x2, y2 = self.x1[crosses], self.y1[crosses], self.x2[crosses], self.y2[crosses]
+        x_at = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+        return bool(np.count_nonzero(x < x_at) % 2)
+
+
+class STRTree:
+    """
+    정적 경계 상자 트리 (Sort-Tile-Recursive 묶음).
+    상자를 x 중심으로 정렬해 세로 띠로 나누고 띠 안에서 y 중심으로 정렬해 리프를 node_capacity개씩 묶은 뒤,
+    위 레벨은 인접한 노드를 node_capacity개씩 묶어 루트까지 올라갑니다.
+    레벨마다 노드 상자를 하나의 배열로 보관하여 조회 시 후보 노드를 한 번에 검사합니다.
+    """
+
+    def __init__(self, boxes: np.ndarray, node_capacity: int = 16):
+        self.node_capacity = node_capacity
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        self.items = self._pack_order(boxes)
+        # levels[0]: 리프 (항목 상자, self.items 순서). 이후 레벨의 i번째 노드는 아래 레벨의 [i*M, (i+1)*M) 노드를 포함
+        self.levels: List[np.ndarray] = [boxes[self.items]]
+        while len(self.levels[-1]) > 1:
+            self.levels.append(self._parent_boxes(self.levels[-1]))
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _pack_order(self, boxes: np.ndarray) -> np.ndarray:
+        n = len(boxes)
+        if n == 0:
+            return np.empty(0, dtype=np.intp)
+        cx = (boxes[:, 0] + boxes[:, 2]) / 2
+        cy = (boxes[:, 1] + boxes[:, 3]) / 2
+        leaves = math.ceil(n / self.node_capacity)
+        slice_size = math.ceil(n / math.ceil(math.sqrt(leaves))) if leaves > 1 else n
+        # 띠 크기를 노드 용량의 배수로 맞춰 노드가 띠 경계를 넘지 않게 함
+        slice_size = math.ceil(slice_size / self.node_capacity) * self.node_capacity
+        by_x = np.argsort(cx, kind="stable")
+        order = [
+            part[np.argsort(cy[part], kind="stable")]
+            for part in (by_x[i:i + slice_size] for i in range(0, n, slice_size))
+        ]
+        return np.concatenate(order)
+
+    def _parent_boxes(self, boxes: np.ndarray) -> np.ndarray:
+        m = self.node_capacity
+        parents = np.empty((math.ceil(len(boxes) / m), 4), dtype=np.float64)
+        for i in range(len(parents)):
+            group = boxes[i * m:(i + 1) * m]
+            parents[i] = (group[:, 0].min(), group[:, 1].min(), group[:, 2].max(), group[:, 3].max())
+        return parents
+
+    def query_point(self, x: float, y: float) -> np.ndarray:
+        """(x, y)를 포함하는 상자의 항목 인덱스 (생성 시 boxes의 인덱스)"""
+        if not len(self.items):
+            return np.empty(0, dtype=np.intp)
+        m = self.node_capacity
+        nodes = np.arange(len(self.levels[-1]))
+        for level in range(len(self.levels) - 1, -1, -1):
+            boxes = self.levels[level][nodes]
+            nodes = nodes[(boxes[:, 0] <= x) & (x <= boxes[:, 2]) & (boxes[:, 1] <= y) & (y <= boxes[:, 3])]
+            if not len(nodes):
+                return np.empty(0, dtype=np.intp)
+            if level:
+                # 아래 레벨의 자식 노드 인덱스
+                children = (nodes[:, None] * m + np.arange(m)).ravel()
+                nodes = children[children < len(self.levels[level - 1])]
+        return self.items[nodes]
+
+
+class RegionIndex:
+    """
+    행정구역 경계 GeoJSON(Polygon/MultiPolygon FeatureCollection, WGS84)으로 좌표의 지역 명칭을 찾습니다.
+    경계가 겹치면 가장 작은(상자 면적 기준) 폴리곤을 사용하므로 시/군/구와 읍/면/동 경계를 함께 넣어도 됩니다.
+
+    Example:
+        index = RegionIndex("data/emd.geojson")
+        index.lookup(37.5013, 127.0396)  # ("서울특별시", "강남구", "역삼동", "")
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._polygons: List[_Polygon] = []
+        self._areas: Optional[np.ndarray] = None
+        self._tree: Optional[STRTree] = None
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._polygons)
+
+    def load(self) -> None:
+        """경계 파일을 읽어 색인을 만듭니다. 파일이 크면 기동 시 스레드에서 미리 호출하세요"""
+        if self._loaded:
+            return
+        if self.path and os.path.exists(self.path):
+            try:
+                with open(self.path, "rb") as f:
+                    self.add_features(orjson.loads(f.read()).get("features") or [])
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                log.warning(f"행정구역 경계 파일을 읽지 못했습니다: {e}")
+        self._loaded = True
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def add_features(self, features: List[Dict[str, Any]]) -> int:
+        """GeoJSON Feature 목록을 추가하고 색인을 다시 만듭니다. 추가한 폴리곤 수를 반환"""
+        added = 0
+        for feature in features:
+            names = region_names(feature.get("properties") or {})
+            geometry = feature.get("geometry") or {}
+            if names is None:
+                continue
+            if geometry.get("type") == "Polygon":
+                parts = [geometry.get("coordinates") or []]
+            elif geometry.get("type") == "MultiPolygon":
+                parts = geometry.get("coordinates") or []
+            else:
+                continue
+            for rings in parts:
+                polygon = _Polygon(names, rings)
+                if len(polygon.x1):
+                    self._polygons.append(polygon)
+                    added += 1
+        boxes = np.array([polygon.bbox() for polygon in self._polygons], dtype=np.float64).reshape(-1, 4)
+        self._areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+        self._tree = STRTree(boxes)
+        self._loaded = True
+        return added
+
+    def lookup(self, lat: float, lng: float) -> Optional[Tuple[str, str, str, str]]:
+        """(시/도, 시/군/구, 읍/면/동, 리). 어느 경계에도 속하지 않으면 None"""
+        self._ensure_loaded()
+        if self._tree is None:
+            self.misses += 1
+            return None
+        candidates = self._tree.query_point(lng, lat)
+        for i in candidates[np.argsort(self._areas[candidates], kind="stable")]:
+            if self._polygons[i].contains(lng, lat):
+                self.hits += 1
+                return self._polygons[i].names
+        self.misses += 1
+        return None
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "polygons": len(self._polygons),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
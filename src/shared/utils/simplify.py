@@ -0,0 +1,65 @@
+"""
+경로(폴리라인) 단순화.
+"""
+import math
+
+import numpy as np
+
+from shared.utils.geo import METERS_PER_DEGREE
+
+
+# 줌 레벨 0에서 적도 기준 픽셀당 미터 (256px 타일, Web Mercator)
+_METERS_PER_PIXEL_Z0 = 156_543.03392
+
+
+def tolerance_for_zoom(zoom: float, lat: float, pixels: float = 1.0) -> float:
+    """지도 줌 레벨에서 pixels 픽셀에 해당하는 거리(미터). 이보다 작은 굴곡은 화면에서 구분되지 않음"""
+    return pixels * _METERS_PER_PIXEL_Z0 * math.cos(math.radians(lat)) / (2 ** zoom)
+
+
+def douglas_peucker(points: np.ndarray, tolerance_m: float) -> np.ndarray:
+    """
+    Douglas-Peucker 단순화. 남길 점의 인덱스(오름차순)를 반환합니다.
+
+    각 구간에서 내부 점들의 선분까지 거리를 NumPy로 한 번에 계산하며,
+    재귀 대신 명시적 스택을 사용합니다.
+
+    Args:
+        points: (N, 2) [경도, 위도] 배열
+        tolerance_m: 허용 오차 (미터). 선분과의 거리가 이보다 작은 점은 제거
+    """
+    n = len(points)
+    if n <= 2 or tolerance_m <= 0:
+        return np.arange(n)
+
+    # 경로 중심 위도 기준 등장방형 투영으로 미터 단위 평면 좌표로 변환 (도보 경로 규모에서는 오차 무시 가능)
+    lat0 = math.radians(float(points[:, 1].mean()))
+    xy = np.empty((n, 2), dtype=np.float64)
+    xy[:, 0] = points[:, 0] * (METERS_PER_DEGREE * math.cos(lat0))
+    xy[:, 1] = points[:, 1] * METERS_PER_DEGREE
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        a = xy[start]
+        ab = xy[end] - a
+        ap = xy[start + 1:end] - a
+        length_sq = ab @ ab
+        if length_sq == 0.0:
+            dist = np.hypot(ap[:, 0], ap[:, 1])
+        else:
+            # 선분 위 최근접점까지의 거리 (투영 비율을 [0, 1]로 제한)
+            t = np.clip(ap @ ab / length_sq, 0.0, 1.0)
+            diff = ap - t[:, None] * ab
+            dist = np.hypot(diff[:, 0], diff[:, 1])
+        i = int(dist.argmax())
+        if dist[i] > tolerance_m:
+            mid = start + 1 + i
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+    return np.flatnonzero(keep)
@@ -0,0 +1,66 @@
+"""
+여러 지점 방문 순서 최적화 (열린 경로 TSP 근사).
+최근접 이웃으로 초기 경로를 만든 뒤 2-opt로 교차 구간을 풉니다.
+지점 수가 수십 개 이하인 일정/경유지 정렬용입니다.
+"""
+from typing import List
+
+import numpy as np
+
+
+def nearest_neighbor(cost: np.ndarray, end_fixed: bool = False) -> List[int]:
+    """0번에서 출발해 가장 가까운 미방문 지점을 차례로 고른 순서. end_fixed면 마지막 지점은 항상 끝에 둠"""
+    n = len(cost)
+    last = n - 1 if end_fixed and n > 1 else None
+    visited = np.zeros(n, dtype=bool)
+    visited[0] = True
+    if last is not None:
+        visited[last] = True
+    order = [0]
+    while not visited.all():
+        row = np.where(visited, np.inf, cost[order[-1]])
+        nxt = int(row.argmin())
+        visited[nxt] = True
+        order.append(nxt)
+    if last is not None:
+        order.append(last)
+    return order
+
+
+def two_opt(order: List[int], cost: np.ndarray, end_fixed: bool = False, max_passes: int = 50) -> List[int]:
+    """
+    구간을 뒤집어 총 비용이 줄어드는 동안 반복합니다. 첫 지점(출발지)은 고정이고,
+    end_fixed면 마지막 지점도 고정합니다. 비용 행렬은 대칭이라고 가정합니다.
+    """
+    order = list(order)
+    n = len(order)
+    last_movable = n - 2 if end_fixed else n - 1
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, last_movable):
+            for j in range(i + 1, last_movable + 1):
+                a, b = order[i - 1], order[i]
+                c = order[j]
+                d = order[j + 1] if j + 1 < n else None
+                before = cost[a, b] + (cost[c, d] if d is not None else 0.0)
+                after = cost[a, c] + (cost[b, d] if d is not None else 0.0)
+                if after < before - 1e-9:
+                    order[i:j + 1] = reversed(order[i:j + 1])
+                    improved = True
+        if not improved:
+            break
+    return order
+
+
+def path_cost(order: List[int], cost: np.ndarray) -> float:
+    return float(sum(cost[a, b] for a, b in zip(order, order[1:])))
+
+
+def order_stops(cost: np.ndarray, end_fixed: bool = False) -> List[int]:
+    """
+    0번 지점에서 출발해 모든 지점을 한 번씩 방문하는 순서 (지점 인덱스 목록).
+    비대칭 비용(왕복 소요 시간이 다른 경우)은 평균으로 대칭화해 사용합니다.
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    cost = (cost + cost.T) / 2
+    return two_opt(nearest_neighbor(cost, end_fixed), cost, end_fixed)
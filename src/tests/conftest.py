@@ -0,0 +1,16 @@
+import pytest
+
+
+class FakeClock:
+    """clock 인자로 주입하는 가짜 시계. now를 직접 옮겨 TTL/쿨다운/지연을 검증"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
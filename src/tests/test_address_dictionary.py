@@ -0,0 +1,71 @@
+import asyncio
+
+from handler.naver.map_handler import NaverMapClient
+from handler.naver.models import GeocodeAddress, GeocodeResponse
+from shared.utils.address_dictionary import AddressDictionary, build, read_csv
+
+ROWS = [
+    ("경기도 성남시 분당구 불정로 6", 37.3595963, 127.1054328),
+    ("경기도 성남시 분당구 판교역로 166", 37.3952, 127.1109),
+    ("경기도 성남시 분당구 판교역로 235", 37.4019, 127.1086),
+    ("서울특별시 강남구 테헤란로 152", 37.5000, 127.0364),
+]
+
+
+def test_dictionary_lookup_and_prefix(tmp_path):
+    path = str(tmp_path / "dict.bin")
+    assert build(ROWS, path) == 4
+    dictionary = AddressDictionary(path)
+
+    assert dictionary.lookup("경기 성남시 분당구 불정로6") == (37.3595963, 127.1054328)
+    assert dictionary.lookup("서울 강남구 테헤란로 152 (역삼동)") == (37.5000, 127.0364)
+    assert dictionary.lookup("서울특별시 강남구 테헤란로 153") is None
+    assert [row[0] for row in dictionary.prefix("경기 성남시 분당구 판교역로")] == [
+        "경기도 성남시 분당구 판교역로 166", "경기도 성남시 분당구 판교역로 235"
+    ]
+    assert dictionary.stats["hits"] == 2 and dictionary.stats["misses"] == 1
+
+
+def test_empty_and_missing_dictionary(tmp_path):
+    path = str(tmp_path / "empty.bin")
+    assert build([], path) == 0
+    assert AddressDictionary(path).lookup("경기도 성남시 분당구 불정로 6") is None
+    assert AddressDictionary(str(tmp_path / "missing.bin")).lookup("경기도 성남시 분당구 불정로 6") is None
+
+
+def test_overlay_is_written_back_and_reloaded(tmp_path):
+    overlay = str(tmp_path / "overlay.csv")
+    dictionary = AddressDictionary(overlay_path=overlay)
+    asyncio.run(dictionary.remember("경기 성남시 분당구 불정로6", 37.3595963, 127.1054328))
+
+    assert AddressDictionary(overlay_path=overlay).lookup("경기도 성남시 분당구 불정로 6") == (37.3595963, 127.1054328)
+    # 오버레이 CSV는 그대로 사전 빌드 입력으로 사용 가능
+    assert build(read_csv(overlay), str(tmp_path / "dict.bin")) == 1
+
+
+def test_get_coordinates_uses_dictionary_before_network(tmp_path, monkeypatch):
+    path = str(tmp_path / "dict.bin")
+    build(ROWS[:1], path)
+    client = NaverMapClient()
+    client.geocode_cache = None
+    client.address_dictionary = AddressDictionary(path, str(tmp_path / "overlay.csv"))
+    calls = []
+
+    async def fake_request(method, endpoint, **kwargs):
+        calls.append(kwargs["params"]["query"])
+        return GeocodeResponse(status="OK", total_count=1, addresses=[
+            GeocodeAddress("서울특별시 강남구 테헤란로 152", "", "", 127.0364, 37.5000)
+        ])
+
+    monkeypatch.setattr(client, "request", fake_request)
+
+    async def main():
+        known = await client.get_coordinates("경기 성남시 분당구 불정로6")
+        first = await client.get_coordinates("서울 강남구 테헤란로 152")
+        second = await client.get_coordinates("서울특별시 강남구 테헤란로 152")
+        return known, first, second
+
+    known, first, second = asyncio.run(main())
+    assert known == (37.3595963, 127.1054328)
+    assert first == second == (37.5000, 127.0364)
+    assert calls == ["서울 강남구 테헤란로 152"]
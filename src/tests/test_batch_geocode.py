@@ -0,0 +1,98 @@
+import asyncio
+
+from handler.naver.map_handler import NaverMapClient
+from handler.naver.models import GeocodeAddress, GeocodeResponse, Region, ReverseGeocodeResponse, ReverseGeocodeResult
+from shared.utils.fanout import map_bounded, map_unique
+from shared.utils.geo import haversine_m, snap_key
+
+
+def test_map_bounded_keeps_order_and_limits_concurrency():
+    running = 0
+    peak = 0
+
+    async def work(i):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (5 - i % 5))
+        running -= 1
+        if i == 3:
+            raise ValueError("boom")
+        return i * 10
+
+    outcomes = asyncio.run(map_bounded(work, range(10), concurrency=3))
+    assert peak <= 3
+    assert [o.value for o in outcomes if o.ok] == [i * 10 for i in range(10) if i != 3]
+    assert isinstance(outcomes[3].error, ValueError)
+
+
+def test_map_unique_runs_each_key_once():
+    calls = []
+
+    async def work(item):
+        calls.append(item)
+        return item.upper()
+
+    outcomes, unique = asyncio.run(map_unique(work, ["a", "B", "b", "a"], key=str.lower, concurrency=2))
+    assert [o.value for o in outcomes] == ["A", "B", "B", "A"]
+    assert unique == 2 and sorted(calls) == ["B", "a"]
+
+
+def test_geocode_batch_dedupes_and_reports_per_item_status():
+    client = NaverMapClient()
+    client.geocode_cache = None
+    calls = []
+
+    async def fake_geocode(query, count=1, cache=False):
+        calls.append(query)
+        if "없는" in query:
+            return GeocodeResponse(status="OK", total_count=0)
+        if "오류" in query:
+            raise RuntimeError("upstream failed")
+        return GeocodeResponse(status="OK", total_count=1, addresses=[
+            GeocodeAddress("경기도 성남시 분당구 불정로 6", "", "", 127.1054328, 37.3595963)
+        ])
+
+    client.geocode = fake_geocode
+    result = asyncio.run(client.geocode_batch([
+        "경기도 성남시 분당구 불정로 6",
+        "없는 주소",
+        "경기 성남시 분당구 불정로6",
+        "오류 주소",
+    ]))
+
+    assert [item.status for item in result.items] == ["ok", "not_found", "ok", "error"]
+    assert result.items[2].deduplicated and (result.items[2].lat, result.items[2].lng) == (37.3595963, 127.1054328)
+    assert result.items[3].error == "upstream failed"
+    assert (result.total, result.unique, result.succeeded) == (4, 3, 2)
+    assert len(calls) == 3
+
+
+def test_snap_key_groups_points_within_tolerance():
+    assert snap_key(37.359600, 127.105430, 10) == snap_key(37.359601, 127.105431, 10)
+    assert snap_key(37.359600, 127.105430, 10) != snap_key(37.359800, 127.105430, 10)
+    assert abs(haversine_m(37.3596, 127.1054, 37.3696, 127.1054) - 1111.9) < 1
+
+
+def test_reverse_geocode_batch_scatters_unique_lookups():
+    client = NaverMapClient()
+    calls = []
+
+    async def fake_reverse_geocode(lat, lng, orders="legalcode", cache=False):
+        calls.append((lat, lng))
+        if lat > 38:
+            return ReverseGeocodeResponse(status_code=3)
+        return ReverseGeocodeResponse(status_code=0, results=[
+            ReverseGeocodeResult("legalcode", "4113510300", Region("경기도", "성남시 분당구", "정자동"))
+        ])
+
+    client.reverse_geocode = fake_reverse_geocode
+    lats = [37.359600, 38.5, 37.359601, 37.359600]
+    lngs = [127.105430, 127.0, 127.105431, 127.105430]
+    result = asyncio.run(client.reverse_geocode_batch(lats, lngs, tolerance_m=10))
+
+    assert [item.status for item in result.items] == ["ok", "not_found", "ok", "ok"]
+    assert [item.deduplicated for item in result.items] == [False, False, True, True]
+    assert result.items[2].address == "경기도 성남시 분당구 정자동"
+    assert (result.items[2].lat, result.items[2].lng) == (37.359601, 127.105431)
+    assert result.unique == 2 and calls == [(37.3596, 127.10543), (38.5, 127.0)]
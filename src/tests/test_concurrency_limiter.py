@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from shared.infra.wrapper.concurrency_limiter import AdaptiveLimiter, BulkheadConfig, BulkheadFullError
+
+
+def test_limit_grows_additively_while_saturated():
+    limiter = AdaptiveLimiter("t", BulkheadConfig(initial_limit=2, max_limit=10))
+
+    async def scenario():
+        for _ in range(20):
+            await asyncio.gather(limiter.acquire(), limiter.acquire())
+            limiter.release(0.01, overloaded=False)
+            limiter.release(0.01, overloaded=False)
+
+    asyncio.run(scenario())
+    assert 2 < limiter.limit <= 10
+
+
+def test_limit_shrinks_multiplicatively_on_overload(clock):
+    limiter = AdaptiveLimiter("t", BulkheadConfig(initial_limit=20, backoff_ratio=0.5), clock=clock)
+
+    async def scenario():
+        async with limiter.slot() as permit:
+            permit.status = 503
+
+    asyncio.run(scenario())
+    assert limiter.limit == 10
+    assert limiter.overloads == 1
+
+
+def test_full_queue_rejects_immediately():
+    limiter = AdaptiveLimiter("t", BulkheadConfig(initial_limit=1, max_queue=1))
+
+    async def scenario():
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        with pytest.raises(BulkheadFullError):
+            await limiter.acquire()
+        limiter.release(0.01, overloaded=False)
+        await waiter
+        assert limiter.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_leak_a_slot():
+    limiter = AdaptiveLimiter("t", BulkheadConfig(initial_limit=1))
+
+    async def scenario():
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release(0.01, overloaded=False)
+        assert limiter.in_flight == 0
+        assert limiter.queued == 0
+
+    asyncio.run(scenario())
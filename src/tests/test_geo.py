@@ -0,0 +1,44 @@
+import asyncio
+
+import numpy as np
+
+from handler.sk.models import RouteMatrix, RouteSummary
+from handler.sk.tmap_handler import TMapClient
+from shared.infra.wrapper.response_cache import ResponseCache
+from shared.utils.geo import bbox_around, bearing_many, haversine_m, haversine_many, in_bbox, rank_nearest
+
+
+def test_vectorized_geo_matches_scalar():
+    rng = np.random.default_rng(3)
+    lats = 37.0 + rng.random(500)
+    lngs = 126.5 + rng.random(500)
+    distances = haversine_many(37.5, 127.0, lats, lngs)
+    assert np.allclose(distances, [haversine_m(37.5, 127.0, a, b) for a, b in zip(lats, lngs)])
+    # 북/동/남/서
+    assert np.allclose(bearing_many(37.5, 127.0, [37.6, 37.5, 37.4, 37.5], [127.0, 127.1, 127.0, 126.9]),
+                       [0, 90, 180, 270], atol=0.1)
+    # 경계 상자는 반경 안의 점을 모두 포함
+    assert in_bbox(lats, lngs, bbox_around(37.5, 127.0, 20000))[distances <= 20000].all()
+
+    index, nearest = rank_nearest(37.5, 127.0, lats, lngs, k=5, max_distance_m=20000)
+    expected = np.argsort(distances)[:5]
+    assert list(index) == [i for i in expected if distances[i] <= 20000]
+    assert np.all(np.diff(nearest) >= 0)
+
+
+def test_matrix_nearest_k_limits_destinations_per_origin():
+    calls = []
+    client = TMapClient()
+    client._cache = ResponseCache()
+
+    async def fake_fetch(start, end, start_name, end_name, option):
+        calls.append((start, end))
+        return RouteSummary(total_distance_m=round(abs(end[0] - start[0]) * 1e5), total_time_sec=60, description=None)
+
+    client._fetch_route_summary = fake_fetch
+    origins = [(37.50, 127.06)]
+    destinations = [(37.53, 127.06), (37.51, 127.06), (37.52, 127.06), (37.505, 127.06)]
+
+    matrix = asyncio.run(client.get_route_matrix(origins, destinations, max_distance_m=1e5, nearest_k=2))
+    assert matrix.status == [RouteMatrix.SKIPPED, RouteMatrix.OK, RouteMatrix.SKIPPED, RouteMatrix.OK]
+    assert sorted(end for _, end in calls) == [(37.505, 127.06), (37.51, 127.06)]
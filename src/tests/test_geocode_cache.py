@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from apis.v1.endpoints.geocode import router
+from handler.geocoder import RacingGeocoder, get_geocoder
+from handler.naver.map_handler import NaverMapClient, get_naver_map_client
+from handler.naver.models import GeocodeAddress, GeocodeResponse
+from shared.infra.wrapper.sqlite_cache import SqliteCache
+from shared.utils.address import normalize_address
+
+
+@pytest.mark.parametrize("variant", [
+    "경기 성남시 분당구 불정로6 (정자동)",
+    "경기도  성남시 분당구 불정로 6",
+    "대한민국 경기도 성남시 분당구 불정로 6,",
+])
+def test_road_address_variants_share_key(variant):
+    assert normalize_address(variant) == "경기도 성남시 분당구 불정로 6"
+
+
+@pytest.mark.parametrize("variant", ["서울시 강남구 역삼동 737번지", "서울 강남구 역삼동 737"])
+def test_lot_number_variants_share_key(variant):
+    assert normalize_address(variant) == "서울특별시 강남구 역삼동 737"
+
+
+def test_lot_number_with_sub_number():
+    assert normalize_address("정자동 178번지 1호") == normalize_address("정자동 178 - 1") == "정자동 178-1"
+
+
+def test_sqlite_cache_ttl_and_metrics(tmp_path, clock):
+    cache = SqliteCache(str(tmp_path / "cache.sqlite3"), namespace="t", clock=clock)
+
+    assert cache.get("a") is None
+    cache.set("a", b"1", ttl=10)
+    assert cache.get("a") == b"1"
+
+    clock.now += 10
+    assert cache.get("a") is None
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 2
+    assert cache.stats["expired"] == 1
+    assert cache.purge_expired() == 1
+
+
+def test_periodic_purge_and_stats_endpoint(tmp_path, clock):
+    cache = SqliteCache(str(tmp_path / "cache.sqlite3"), namespace="naver-geocode", clock=clock)
+    cache.set("old", b"1", ttl=10)
+    cache.set("new", b"2", ttl=100)
+    clock.now += 10
+
+    async def purge_once():
+        task = asyncio.create_task(cache.run_purge(interval=3600))
+        while cache.purged == 0:
+            await asyncio.sleep(0.001)
+        task.cancel()
+
+    asyncio.run(purge_once())
+    assert len(cache) == 1 and cache.get("new") == b"2"
+
+    class FakeNaverMapClient:
+        geocode_cache = cache
+
+    app = FastAPI()
+    app.include_router(router, prefix="/geocode")
+    app.dependency_overrides[get_naver_map_client] = FakeNaverMapClient
+    app.dependency_overrides[get_geocoder] = lambda: RacingGeocoder({"naver": None})
+    with TestClient(app) as client:
+        stats = client.get("/geocode/stats").json()["persistent_cache"]
+    assert (stats["entries"], stats["purged"], stats["hits"]) == (1, 1, 1)
+
+
+def test_sqlite_cache_is_shared_across_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    SqliteCache(path, namespace="t").set("a", b"1", ttl=60)
+    assert SqliteCache(path, namespace="t").get("a") == b"1"
+    assert SqliteCache(path, namespace="other").get("a") is None
+
+
+def test_geocode_uses_persistent_cache_for_address_variants(tmp_path, monkeypatch):
+    client = NaverMapClient()
+    client.geocode_cache = SqliteCache(str(tmp_path / "geocode.sqlite3"), namespace="naver-geocode")
+    calls = []
+
+    async def fake_request(method, endpoint, **kwargs):
+        calls.append(kwargs["params"]["query"])
+        return GeocodeResponse(status="OK", total_count=1, addresses=[
+            GeocodeAddress("경기도 성남시 분당구 불정로 6", "경기도 성남시 분당구 정자동 178-1", "", 127.1054328, 37.3595963)
+        ])
+
+    monkeypatch.setattr(client, "request", fake_request)
+
+    async def main():
+        first = await client.get_coordinates("경기도 성남시 분당구 불정로 6")
+        second = await client.get_coordinates("경기 성남시 분당구 불정로6")
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first == second == (37.3595963, 127.1054328)
+    assert calls == ["경기도 성남시 분당구 불정로 6"]
+    assert client.geocode_cache.stats["hits"] == 1
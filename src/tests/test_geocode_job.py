@@ -0,0 +1,187 @@
+import asyncio
+import csv
+import io
+
+import orjson
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from apis.v1.endpoints.geocode import router
+from core.exceptions import BadRequestException, register_application_exception
+from core.middleware.log_middleware import LOG_BODY_MAX_BYTES, request_log_middleware
+from handler.naver.geocode_job import GeocodeJobManager, get_geocode_job_manager
+from handler.naver.models import GeocodeAddress, GeocodeResponse
+
+
+class FakeMapClient:
+    def __init__(self, block_on=None):
+        self.queries = []
+        self.block_on = block_on
+
+    async def geocode(self, query, count=10, cache=False):
+        self.queries.append(query)
+        if self.block_on is not None and len(self.queries) >= self.block_on:
+            await asyncio.Event().wait()
+        if "없는" in query:
+            return GeocodeResponse(status="OK", total_count=0)
+        return GeocodeResponse(status="OK", total_count=1, addresses=[
+            GeocodeAddress(query, "", "", 127.0 + len(query) / 1000, 37.5)
+        ])
+
+
+async def _chunks(data, size=7):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+async def _run(manager, data, format, column="address"):
+    job = await manager.create(_chunks(data), format, column)
+    await manager._tasks[job.id]
+    output = b"".join([chunk async for chunk in manager.iter_output(job)])
+    return job, output
+
+
+CSV = (
+    "id,address\n"
+    "1,서울시 강남구 테헤란로 152\n"
+    "2,\"서울특별시 강남구 테헤란로 152\"\n"
+    "3,\n"
+    "4,없는 주소 1\n"
+    "5,\"경기 성남시 분당구 불정로6 (정자동)\"\n"
+).encode("utf-8")
+
+
+def test_csv_job_dedupes_normalized_addresses_and_appends_result_columns(tmp_path):
+    client = FakeMapClient()
+    manager = GeocodeJobManager(client, str(tmp_path), chunk_size=2)
+    job, output = asyncio.run(_run(manager, CSV, "csv"))
+
+    rows = list(csv.DictReader(io.StringIO(output.decode("utf-8"))))
+    assert [r["id"] for r in rows] == ["1", "2", "3", "4", "5"]
+    assert [r["geocode_status"] for r in rows] == ["ok", "ok", "invalid", "not_found", "ok"]
+    assert rows[0]["geocode_lat"] == "37.5"
+    # 표기만 다른 같은 주소(청크가 달라도)는 한 번만 조회
+    assert len(client.queries) == 3 and job.deduplicated == 1
+    assert (job.status, job.rows, job.succeeded, job.not_found, job.invalid) == ("completed", 5, 3, 1, 1)
+    assert job.progress()["percent"] == 100.0
+
+
+def test_ndjson_job_resumes_from_checkpoint_after_restart(tmp_path):
+    data = b"".join(orjson.dumps({"id": i, "addr": f"서울특별시 중구 세종대로 {i}"}) + b"\n" for i in range(10))
+    data += b"not json\n"
+
+    # 네 번째 조회 중에 종료 -> 첫 청크까지만 체크포인트
+    blocked = FakeMapClient(block_on=4)
+    first = GeocodeJobManager(blocked, str(tmp_path), chunk_size=3, concurrency=1)
+
+    async def interrupted():
+        job = await first.create(_chunks(data), "ndjson", "addr")
+        while len(blocked.queries) < 4:
+            await asyncio.sleep(0.001)
+        await first.shutdown()
+        return job, b"".join([chunk async for chunk in first.iter_output(job)])
+
+    job, partial = asyncio.run(interrupted())
+    assert job.status == "running" and job.rows == 3
+    assert len(partial.splitlines()) == 3
+
+    # 재시작: 체크포인트에서 복원해 남은 행만 처리
+    client = FakeMapClient()
+    restarted = GeocodeJobManager(client, str(tmp_path), chunk_size=3)
+    (loaded,) = restarted.load()
+    assert loaded.id == job.id and loaded.rows == 3
+
+    async def resume():
+        assert restarted.resume_pending() == [loaded]
+        await restarted._tasks[loaded.id]
+        return b"".join([chunk async for chunk in restarted.iter_output(loaded)])
+
+    output = asyncio.run(resume())
+    records = [orjson.loads(line) for line in output.splitlines()]
+    assert [r.get("id") for r in records] == list(range(10)) + [None]
+    assert records[-1]["geocode"]["status"] == "invalid"
+    assert client.queries == [f"서울특별시 중구 세종대로 {i}" for i in range(3, 10)]
+    assert (loaded.status, loaded.rows, loaded.succeeded) == ("completed", 11, 10)
+
+
+def test_cp949_input_is_detected_and_undecodable_input_is_rejected(tmp_path):
+    client = FakeMapClient()
+    manager = GeocodeJobManager(client, str(tmp_path))
+    job, output = asyncio.run(_run(manager, CSV.decode("utf-8").encode("cp949"), "csv"))
+
+    assert job.encoding == "cp949"
+    assert client.queries[0] == "서울시 강남구 테헤란로 152"
+    # 결과는 항상 UTF-8
+    rows = list(csv.DictReader(io.StringIO(output.decode("utf-8"))))
+    assert rows[4]["address"] == "경기 성남시 분당구 불정로6 (정자동)"
+
+    with pytest.raises(BadRequestException):
+        asyncio.run(_run(manager, b"id,address\n1,\xff\xfe\xff\n", "csv"))
+    # 실패한 업로드는 작업 디렉터리를 남기지 않음
+    assert [name for name in tmp_path.iterdir()] == [tmp_path / job.id]
+
+
+def test_only_one_worker_runs_a_job_and_every_worker_reports_its_status(tmp_path):
+    data = b"".join(orjson.dumps({"addr": f"서울특별시 중구 세종대로 {i}"}) + b"\n" for i in range(6))
+    blocked, other = FakeMapClient(block_on=3), FakeMapClient()
+    # 같은 작업 디렉터리를 공유하는 두 워커
+    first = GeocodeJobManager(blocked, str(tmp_path), chunk_size=2, concurrency=1)
+    second = GeocodeJobManager(other, str(tmp_path), chunk_size=2)
+
+    async def main():
+        job = await first.create(_chunks(data), "ndjson", "addr")
+        while len(blocked.queries) < 3:
+            await asyncio.sleep(0.001)
+
+        # 다른 워커도 기동 시 재개를 시도하지만 lock을 잡은 워커만 실행
+        (loaded,) = await asyncio.to_thread(second.load)
+        assert second.resume_pending() == [loaded]
+        await second._tasks[job.id]
+        assert other.queries == []
+
+        # 조회는 어느 워커에서든 체크포인트 기준으로 응답
+        seen = await second.get(job.id)
+        assert (seen.status, seen.rows) == ("running", 2)
+        assert [j.id for j in await second.list_jobs()] == [job.id]
+
+        # 실행하던 워커가 멈추면 다른 워커가 체크포인트부터 이어받음
+        await first.shutdown()
+        second.start(seen)
+        await second._tasks[job.id]
+        return job.id
+
+    job_id = asyncio.run(main())
+    assert other.queries == [f"서울특별시 중구 세종대로 {i}" for i in range(2, 6)]
+    finished = asyncio.run(first.get(job_id))
+    assert (finished.status, finished.rows, finished.succeeded) == ("completed", 6, 6)
+
+
+def test_upload_through_app_with_default_curl_content_type_and_non_utf8_body(tmp_path):
+    manager = GeocodeJobManager(FakeMapClient(), str(tmp_path))
+    app = FastAPI()
+    app.middleware("http")(request_log_middleware)
+    app.include_router(router, prefix="/geocode")
+    register_application_exception(app)
+    app.dependency_overrides[get_geocode_job_manager] = lambda: manager
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return {"size": len(await request.body())}
+
+    # 한글 CSV는 CP949로 저장된 경우가 많음
+    data = "id,address\n1,서울특별시 중구 세종대로 110\n".encode("cp949")
+    with TestClient(app) as client:
+        # curl --data-binary 기본값(form-urlencoded)과 Content-Type이 없는 요청 모두 스트리밍으로 업로드
+        for headers in ({"content-type": "application/x-www-form-urlencoded"}, {}):
+            response = client.post("/geocode/jobs", content=data, headers=headers)
+            assert response.status_code == 202
+            job = manager.jobs[response.json()["id"]]
+            with open(job.input_path, "rb") as f:
+                assert f.read() == data
+
+        # 로그용으로 읽는 작은 바디와 읽지 않는 큰 바디 모두 UTF-8이 아니어도 500이 나지 않음
+        for size in (2, LOG_BODY_MAX_BYTES + 2):
+            response = client.post("/echo", content=b"\xb0\xa1" * (size // 2),
+                                   headers={"content-type": "application/x-www-form-urlencoded"})
+            assert response.json() == {"size": size}
@@ -0,0 +1,110 @@
+import asyncio
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from core.config import Settings
+from core.exceptions import ExternalAPIError
+from handler.geocoder import RacingGeocoder
+from handler.kakao.models import KakaoAddressResponse, KakaoRegionResponse
+from shared.infra.wrapper.resilience import HedgePolicy
+
+
+def _provider(delay, result, log, name, error=None):
+    async def call(address):
+        log.append(("start", name))
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            log.append(("cancelled", name))
+            raise
+        if error:
+            raise error
+        return result
+    return call
+
+
+def test_kakao_models_parse_local_api_payloads():
+    address = KakaoAddressResponse.from_json(orjson.dumps({
+        "meta": {"total_count": 1},
+        "documents": [{
+            "address_name": "경기 성남시 분당구 판교역로 166", "address_type": "ROAD_ADDR",
+            "x": "127.110449", "y": "37.394726",
+            "address": {"address_name": "경기 성남시 분당구 백현동 532"},
+            "road_address": {"address_name": "경기 성남시 분당구 판교역로 166"},
+        }],
+    }))
+    assert (address.first.lat, address.first.lng) == (37.394726, 127.110449)
+    assert address.first.jibun_address == "경기 성남시 분당구 백현동 532"
+
+    region = KakaoRegionResponse.from_json(orjson.dumps({"documents": [
+        {"region_type": "H", "code": "4113565500", "region_1depth_name": "경기도",
+         "region_2depth_name": "성남시 분당구", "region_3depth_name": "백현동"},
+        {"region_type": "B", "code": "4113511000", "region_1depth_name": "경기도",
+         "region_2depth_name": "성남시 분당구", "region_3depth_name": "백현동"},
+    ]}))
+    assert region.legal().code == "4113511000"
+    assert region.legal().to_address() == "경기도 성남시 분당구 백현동"
+
+
+def test_hedge_calls_second_provider_when_first_is_slow_and_cancels_loser():
+    log = []
+    geocoder = RacingGeocoder({
+        "naver": _provider(0.5, (37.0, 127.0), log, "naver"),
+        "kakao": _provider(0.01, (37.1, 127.1), log, "kakao"),
+    }, default_hedge_delay=0.02)
+
+    match = asyncio.run(geocoder.geocode("판교역로 166"))
+    assert (match.provider, match.lat) == ("kakao", 37.1)
+    assert log == [("start", "naver"), ("start", "kakao"), ("cancelled", "naver")]
+    assert geocoder.stats["naver"].cancelled == 1 and geocoder.stats["kakao"].wins == 1
+    # 취소된 호출은 실패/지연 통계에 반영하지 않음
+    assert geocoder.stats["naver"].completed == 0
+
+
+def test_failover_on_error_or_empty_and_all_failed():
+    log = []
+    geocoder = RacingGeocoder({
+        "naver": _provider(0.001, None, log, "naver", error=RuntimeError("503")),
+        "kakao": _provider(0.001, (37.1, 127.1), log, "kakao"),
+    }, default_hedge_delay=10)
+    assert asyncio.run(geocoder.geocode("a")).provider == "kakao"
+
+    empty = RacingGeocoder({
+        "naver": _provider(0.001, None, log, "naver"),
+        "kakao": _provider(0.001, None, log, "kakao", error=RuntimeError("503")),
+    })
+    assert asyncio.run(empty.geocode("a")) is None
+
+    broken = RacingGeocoder({
+        "naver": _provider(0.001, None, log, "naver", error=RuntimeError("503")),
+        "kakao": _provider(0.001, None, log, "kakao", error=RuntimeError("503")),
+    })
+    with pytest.raises(ExternalAPIError):
+        asyncio.run(broken.geocode("a"))
+
+
+def test_stats_reorder_providers():
+    log = []
+    geocoder = RacingGeocoder({
+        "naver": _provider(0.001, None, log, "naver"),
+        "kakao": _provider(0.001, (37.1, 127.1), log, "kakao"),
+    }, strategy="race", hedge_policy=HedgePolicy(min_samples=3))
+    assert geocoder.ranked() == ["naver", "kakao"]
+
+    async def main():
+        for _ in range(3):
+            await geocoder.geocode("a")
+
+    asyncio.run(main())
+    # 네이버는 결과를 찾지 못하므로 점수가 나빠져 카카오가 먼저
+    assert geocoder.ranked() == ["kakao", "naver"]
+
+
+def test_race_strategy_setting_rejects_unknown_values(monkeypatch):
+    monkeypatch.setenv("GEOCODE_RACE_STRATEGY", "racing")
+    with pytest.raises(ValidationError):
+        Settings()
+    monkeypatch.setenv("GEOCODE_RACE_STRATEGY", "race")
+    assert Settings().GEOCODE_RACE_STRATEGY == "race"
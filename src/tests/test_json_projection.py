@@ -0,0 +1,53 @@
+import orjson
+import pytest
+
+from shared.utils.json_projection import JsonProjection, project
+
+DOCUMENT = orjson.dumps({
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [127.1, 37.5]},
+            "properties": {"totalDistance": 6337, "totalTime": 4562, "description": "보행자 \"경로\""},
+        },
+        {
+            "type": "Feature",
+            "geometry": {"type": "LineString", "coordinates": [[127.1, 37.5], [127.2, 37.6]]},
+            "properties": {"description": "직진 [100m], {우회전}"},
+        },
+    ],
+})
+
+
+@pytest.mark.parametrize("path, expected", [
+    (("features", 0, "properties"), [{"totalDistance": 6337, "totalTime": 4562, "description": "보행자 \"경로\""}]),
+    (("features", 0, "properties", "totalTime"), [4562]),
+    (("features", "*", "geometry", "type"), ["Point", "LineString"]),
+    (("features", 1, "geometry", "coordinates", "*"), [[127.1, 37.5], [127.2, 37.6]]),
+    (("type",), ["FeatureCollection"]),
+    (("missing",), []),
+])
+def test_project_matches_full_decode(path, expected):
+    assert project(DOCUMENT, path) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_chunked_feed_gives_same_result(chunk_size):
+    projection = JsonProjection(("features", "*", "geometry"))
+    for i in range(0, len(DOCUMENT), chunk_size):
+        projection.feed(DOCUMENT[i:i + chunk_size])
+    assert projection.results == [f["geometry"] for f in orjson.loads(DOCUMENT)["features"]]
+    assert projection.done
+
+
+def test_stops_after_first_match_without_reading_rest():
+    projection = JsonProjection(("features", 0, "properties"))
+    consumed = 0
+    for i in range(0, len(DOCUMENT), 16):
+        projection.feed(DOCUMENT[i:i + 16])
+        consumed = i + 16
+        if projection.done:
+            break
+    assert consumed < len(DOCUMENT)
+    assert projection.results[0]["totalDistance"] == 6337
@@ -0,0 +1,118 @@
+import asyncio
+import unicodedata
+
+import pytest
+
+from handler.naver import map_handler
+from handler.naver.map_handler import NaverSearchClient
+from handler.naver.models import LocalPlace
+from handler.naver.place_index import PlaceIndex
+from shared.utils.query import normalize_search_query
+
+
+def _place(i, link=None):
+    return LocalPlace(title=f"업체 {i}", link=f"https://example.com/{i}" if link is None else link, category="",
+                      description="", telephone="", address=f"주소 {i}", road_address="", mapx=0, mapy=0)
+
+
+def _client(monkeypatch, pages, delays=None):
+    monkeypatch.setattr(map_handler, "get_rate_limiter", lambda name: None)
+    client = NaverSearchClient()
+    calls = []
+    running = 0
+    peak = 0
+
+    async def fake_search_local(query, display=5, start=1, sort="random", cache=False):
+        nonlocal running, peak
+        calls.append(start)
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep((delays or {}).get(start, 0.001))
+        finally:
+            running -= 1
+        return pages.get(start, [])
+
+    client.search_local = fake_search_local
+    return client, calls, lambda: peak
+
+
+def _collect(client, **kwargs):
+    async def scenario():
+        return [place async for place in client.iter_local("판교 맛집", **kwargs)]
+    return asyncio.run(scenario())
+
+
+def test_iter_local_dedupes_and_stops_at_last_page(monkeypatch):
+    pages = {
+        1: [_place(i) for i in range(5)],
+        6: [_place(3), _place(5), _place(6), _place(7, link=""), _place(8)],
+        11: [_place(9), _place(7, link="")],
+    }
+    client, calls, peak = _client(monkeypatch, pages)
+    places = _collect(client, max_results=100, concurrency=2)
+    assert sorted(p.title for p in places) == sorted(f"업체 {i}" for i in range(10))
+    # 16번부터는 11번 페이지가 짧게 끝난 뒤로는 요청하지 않음
+    assert max(calls) <= 16 and peak() <= 2
+
+
+def test_iter_local_yields_in_arrival_order_and_stops_early(monkeypatch):
+    pages = {start: [_place(start + i) for i in range(5)] for start in range(1, 100, 5)}
+    client, calls, _ = _client(monkeypatch, pages, delays={1: 0.05})
+    places = _collect(client, max_results=7, concurrency=4)
+    # 느린 1번 페이지보다 6번 페이지가 먼저 도착, 7개를 채우는 데 필요한 두 페이지만 요청
+    assert [p.title for p in places[:5]] == [f"업체 {i}" for i in range(6, 11)]
+    assert len(places) == 7 and sorted(calls) == [1, 6]
+
+
+def test_normalize_search_query_merges_trivial_variants():
+    assert normalize_search_query("판교 맛집") == normalize_search_query("맛집  판교!")
+    assert normalize_search_query("판교에서 맛집") == normalize_search_query("판교 맛집")
+    assert normalize_search_query("강남역에 카페") == normalize_search_query("카페 강남역")
+    assert normalize_search_query("ＣＧＶ 판교") == normalize_search_query("cgv 판교")
+    # 조합형 한글(NFD)도 같은 키
+    assert normalize_search_query(unicodedata.normalize("NFD", "판교 맛집")) == normalize_search_query("판교 맛집")
+    # 명사 끝 글자와 겹치는 경우는 떼지 않음
+    assert normalize_search_query("을지로 떡볶이") == "떡볶이 을지로"
+    assert normalize_search_query("사과") == "사과"
+
+
+@pytest.mark.parametrize("noun, stem", [
+    ("피부과", "피부"), ("성형외과", "성형외"), ("한마을", "한마"),
+    ("민주주의", "민주주"), ("오타와", "오타"), ("노랑", "노"),
+])
+def test_normalize_search_query_keeps_nouns_ending_like_particles(noun, stem):
+    # 명사 끝 글자가 조사와 같아도 잘라서 다른 검색어와 같은 키가 되지 않아야 함
+    assert normalize_search_query(f"강남 {noun}") == f"강남 {noun}"
+    assert normalize_search_query(f"강남 {noun}") != normalize_search_query(f"강남 {stem}")
+
+
+def test_normalize_search_query_strips_particles_per_token_only():
+    assert normalize_search_query("피부과를 강남역에서") == normalize_search_query("강남역 피부과")
+    # 토큰 중간의 조사 모양 글자는 그대로
+    assert normalize_search_query("은행 에버랜드") == "에버랜드 은행"
+
+
+def test_search_local_query_cache_hits_for_variants():
+    client = NaverSearchClient()
+    client.place_index = PlaceIndex()
+    calls = []
+
+    async def fake_request(method, endpoint, params=None, **kwargs):
+        calls.append(params["query"])
+        return type("Resp", (), {"items": [_place(len(calls))]})()
+
+    client.request = fake_request
+
+    async def scenario():
+        a = await client.search_local("판교 맛집", cache=True)
+        b = await client.search_local("맛집 판교에서", cache=True)
+        c = await client.search_local("판교 맛집", start=6, cache=True)
+        d = await client.search_local("판교 맛집")
+        return a, b, c, d
+
+    a, b, c, d = asyncio.run(scenario())
+    assert calls == ["판교 맛집", "판교 맛집", "판교 맛집"]
+    assert a == b and a != c
+    assert client.query_cache.stats["hits"] == 1
+    assert client.query_cache.stats["hit_ratio"] == 1 / 3
@@ -0,0 +1,75 @@
+import orjson
+
+from core.responses import FastJSONResponse
+from handler.base import model_reader
+from handler.naver.models import GeocodeResponse, LocalSearchResponse, ReverseGeocodeResponse
+
+GEOCODE = orjson.dumps({
+    "status": "OK",
+    "meta": {"totalCount": 1, "page": 1, "count": 1},
+    "addresses": [{
+        "roadAddress": "경기도 성남시 분당구 불정로 6 NAVER그린팩토리",
+        "jibunAddress": "경기도 성남시 분당구 정자동 178-1 NAVER그린팩토리",
+        "englishAddress": "6, Buljeong-ro, Bundang-gu, Seongnam-si, Gyeonggi-do, Republic of Korea",
+        "addressElements": [{"types": ["SIDO"], "longName": "경기도", "shortName": "경기도", "code": ""}],
+        "x": "127.1054328",
+        "y": "37.3595963",
+        "distance": 0.0,
+    }],
+    "errorMessage": "",
+})
+
+REVERSE_GEOCODE = orjson.dumps({
+    "status": {"code": 0, "name": "ok", "message": "done"},
+    "results": [{
+        "name": "legalcode",
+        "code": {"id": "4113510300", "type": "L", "mappingId": "02135103"},
+        "region": {
+            "area0": {"name": "kr"},
+            "area1": {"name": "경기도", "alias": "경기"},
+            "area2": {"name": "성남시 분당구"},
+            "area3": {"name": "정자동"},
+            "area4": {"name": ""},
+        },
+    }],
+})
+
+
+def test_geocode_response_decodes_typed_fields():
+    result = GeocodeResponse.from_json(GEOCODE)
+    assert result.total_count == 1
+    assert (result.first.lat, result.first.lng) == (37.3595963, 127.1054328)
+
+
+def test_geocode_response_without_match_has_no_first():
+    result = GeocodeResponse.from_json(b'{"status":"OK","meta":{"totalCount":0},"addresses":[]}')
+    assert result.first is None
+
+
+def test_reverse_geocode_region_to_address():
+    result = ReverseGeocodeResponse.from_json(REVERSE_GEOCODE)
+    assert result.ok
+    assert result.results[0].code == "4113510300"
+    assert result.results[0].region.to_address() == "경기도 성남시 분당구 정자동"
+
+
+def test_local_place_coordinates():
+    result = LocalSearchResponse.from_json(orjson.dumps({
+        "total": 1, "start": 1, "display": 1,
+        "items": [{"title": "<b>카페</b>", "mapx": "1270541234", "mapy": "373591234"}],
+    }))
+    place = result.items[0]
+    assert (place.lat, place.lng) == (37.3591234, 127.0541234)
+    assert place.road_address == ""
+
+
+def test_model_reader_is_stable_per_model():
+    # singleflight/캐시 키에 reader가 포함되므로 같은 모델이면 같은 reader여야 함
+    assert model_reader(GeocodeResponse.from_json) is model_reader(GeocodeResponse.from_json)
+    assert model_reader(GeocodeResponse.from_json) is not model_reader(ReverseGeocodeResponse.from_json)
+
+
+def test_fast_json_response_serializes_slotted_models():
+    response = FastJSONResponse(ReverseGeocodeResponse.from_json(REVERSE_GEOCODE))
+    body = orjson.loads(response.body)
+    assert body["results"][0]["region"]["area2"] == "성남시 분당구"
@@ -0,0 +1,68 @@
+import asyncio
+import gzip
+
+import orjson
+from aiohttp import web
+
+from core.responses import passthrough_response
+from handler.base import BaseClient
+from shared.infra.wrapper.aiohttp_wrapper import AioHttpClient
+
+BODY = orjson.dumps({"type": "FeatureCollection", "features": [{"properties": {"totalDistance": 120}}]})
+GZIPPED = gzip.compress(BODY)
+
+
+async def _fetch_raw(accept_encoding):
+    """gzip으로 응답하는 가짜 업스트림에 request_raw로 요청하고 (업스트림이 받은 Accept-Encoding, 결과)를 반환"""
+    received = []
+
+    async def route(request):
+        received.append(request.headers.get("Accept-Encoding"))
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            return web.Response(body=GZIPPED, content_type="application/json", headers={"Content-Encoding": "gzip"})
+        return web.Response(body=BODY, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_post("/tmap/routes/pedestrian", route)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    transport = AioHttpClient()
+    try:
+        client = BaseClient(f"http://127.0.0.1:{port}", http_client=transport)
+        raw = await client.request_raw("POST", "/tmap/routes/pedestrian", accept_encoding=accept_encoding, json={})
+    finally:
+        await transport.close_session()
+        await runner.cleanup()
+    return received[0], raw
+
+
+def test_request_raw_keeps_upstream_gzip_bytes_and_headers():
+    sent, raw = asyncio.run(_fetch_raw("gzip, deflate"))
+
+    # 클라이언트의 Accept-Encoding을 그대로 전달하고, 압축을 풀지 않은 바이트를 보존
+    assert sent == "gzip, deflate"
+    assert raw.content == GZIPPED and raw.content_encoding == "gzip"
+
+    response = passthrough_response(raw)
+    assert response.body == GZIPPED
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["Content-Type"].startswith("application/json")
+    assert gzip.decompress(response.body) == BODY
+
+
+def test_request_raw_asks_for_identity_without_client_accept_encoding():
+    sent, raw = asyncio.run(_fetch_raw(None))
+
+    # 클라이언트가 압축을 받을 수 없으면 업스트림에도 압축하지 말라고 요청 (gzip 바이트를 JSON으로 내보내지 않음)
+    assert sent == "identity"
+    assert raw.content == BODY and raw.content_encoding is None
+
+    response = passthrough_response(raw)
+    assert response.body == BODY
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept-Encoding"
@@ -0,0 +1,146 @@
+import asyncio
+
+import numpy as np
+
+from handler.naver.map_handler import NaverSearchClient
+from handler.naver.models import LocalPlace
+from handler.naver import place_index
+from handler.naver.place_index import PlaceIndex, rank_places
+from shared.utils.geo import haversine_m
+from shared.utils.kdtree import KDTree, chord_length, to_xyz
+
+
+def _place(title, lat, lng, category="음식점>한식", link=""):
+    return LocalPlace(title=title, link=link, category=category, description="", telephone="",
+                      address="", road_address="", mapx=round(lng * 1e7), mapy=round(lat * 1e7))
+
+
+def test_kdtree_radius_query_matches_brute_force():
+    rng = np.random.default_rng(7)
+    lats = 37.3 + rng.random(3000) * 0.2
+    lngs = 127.0 + rng.random(3000) * 0.2
+    tree = KDTree(to_xyz(lats, lngs), leaf_size=8)
+    center_lat, center_lng = 37.4, 127.1
+    found = set(tree.query_radius(to_xyz(np.array([center_lat]), np.array([center_lng]))[0], chord_length(1500)))
+    expected = {i for i in range(3000) if haversine_m(center_lat, center_lng, lats[i], lngs[i]) <= 1500}
+    assert found == expected and expected
+
+
+def test_rank_places_orders_candidates_and_skips_missing_coordinates():
+    places = [
+        _place("먼 곳", 37.4200, 127.1080),
+        _place("가까운 곳", 37.4010, 127.1080),
+        _place("좌표 없음", 0, 0),
+        _place("중간", 37.4100, 127.1080),
+    ]
+    ranked = rank_places(places, 37.4000, 127.1080, k=2)
+    assert [p.title for p, _ in ranked] == ["가까운 곳", "중간"]
+    assert [p.title for p, _ in rank_places(places, 37.4000, 127.1080, max_distance_m=1500)] == ["가까운 곳", "중간"]
+
+
+def test_place_index_nearby_filters_and_sorts():
+    now = [1000.0]
+    index = PlaceIndex(clock=lambda: now[0])
+    index.add_many([
+        _place("판교 카페", 37.4010, 127.1080, category="카페,디저트", link="a"),
+        _place("판교 국밥", 37.4000, 127.1070, link="b"),
+        _place("강남 카페", 37.4980, 127.0270, category="카페,디저트", link="c"),
+    ])
+    # 같은 link는 갱신만 하고 개수는 그대로
+    assert index.add_many([_place("판교 국밥", 37.4001, 127.1070, link="b")]) == 0
+    assert len(index) == 3
+
+    near = index.nearby(37.4000, 127.1070, 500)
+    assert [p.title for p, _ in near] == ["판교 국밥", "판교 카페"]
+    assert near[0][1] < near[1][1] < 500
+    assert [p.title for p, _ in index.nearby(37.4000, 127.1070, 500, category="카페")] == ["판교 카페"]
+
+    now[0] += 100
+    index.add_many([_place("판교 국밥", 37.4001, 127.1070, link="b")])
+    assert [p.title for p, _ in index.nearby(37.4000, 127.1070, 500, max_age=50)] == ["판교 국밥"]
+
+
+def test_place_index_persists_between_instances(tmp_path, monkeypatch):
+    # 여러 배치로 나눠 직렬화해도 하나의 JSON 배열로 저장
+    monkeypatch.setattr(place_index, "_SERIALIZE_BATCH", 2)
+    path = str(tmp_path / "places.json")
+    index = PlaceIndex(path, save_every=5, clock=lambda: 1000.0)
+
+    async def add_and_save():
+        index.add_many([_place(f"판교 카페 {i}", 37.4010 + i * 1e-4, 127.1080, link=str(i)) for i in range(5)])
+        index.schedule_save()
+        await index._saving
+
+    asyncio.run(add_and_save())
+    restored = PlaceIndex(path, clock=lambda: 1000.0)
+    restored.load()
+    assert len(restored) == 5
+    [(place, _)] = restored.nearby(37.4010, 127.1080, 5)
+    assert place.title == "판교 카페 0" and place.link == "0"
+
+
+def test_place_index_evicts_old_places_and_caps_size(clock):
+    index = PlaceIndex(max_places=10, max_age=100, clock=clock)
+    index.add_many([_place(f"오래된 곳 {i}", 37.4, 127.1 + i * 1e-4, link=f"old{i}") for i in range(3)])
+    clock.now = 200
+    index.add_many([_place(f"새 곳 {i}", 37.4, 127.1 + i * 1e-4, link=f"new{i}") for i in range(3)])
+    assert index.evict() == 3 and len(index) == 3
+
+    # 최대 개수를 넘으면 오래 전에 수집한 업체부터 90%까지 삭제
+    for i in range(8):
+        clock.now += 1
+        index.add_many([_place(f"추가 {i}", 37.41, 127.1 + i * 1e-4, link=f"more{i}")])
+    assert len(index) == 9
+    titles = {p.title for p, _ in index.nearby(37.4, 127.1, 5000)}
+    assert {f"추가 {i}" for i in range(8)} <= titles
+    assert len([title for title in titles if title.startswith("새 곳")]) == 1
+    # 삭제 후에도 link로 갱신
+    assert index.add_many([_place("추가 7", 37.41, 127.1007, link="more7")]) == 0
+
+
+def test_search_nearby_goes_upstream_only_when_coverage_is_thin():
+    client = NaverSearchClient()
+    client.place_index = PlaceIndex()
+    calls = []
+
+    async def fake_request(method, endpoint, params=None, **kwargs):
+        calls.append(params["query"])
+        return type("Resp", (), {"items": [
+            _place(f"카페 {i}", 37.4 + i * 0.0005, 127.1, category="카페", link=str(i)) for i in range(5)
+        ]})()
+
+    client.request = fake_request
+
+    async def scenario():
+        first = await client.search_nearby(37.4, 127.1, 1000, category="카페", min_results=3)
+        second = await client.search_nearby(37.4, 127.1, 1000, category="카페", min_results=3)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    # 역지오코딩 클라이언트가 없으면 지역 명칭 없이 검색
+    assert calls == ["카페"]
+    assert len(first) == len(second) == 5
+
+
+def test_search_nearby_adds_area_name_to_fallback_query():
+    class FakeMapClient:
+        async def get_address(self, lat, lng):
+            return "경기도 성남시 분당구 백현동"
+
+    client = NaverSearchClient(FakeMapClient())
+    client.place_index = PlaceIndex()
+    calls = []
+
+    async def fake_request(method, endpoint, params=None, **kwargs):
+        calls.append(params["query"])
+        return type("Resp", (), {"items": []})()
+
+    client.request = fake_request
+
+    async def scenario():
+        await client.search_nearby(37.39, 127.11, 1000, category="카페", min_results=1)
+        # 검색어를 직접 주면 그대로 사용
+        await client.search_nearby(37.39, 127.11, 1000, category="카페", query="판교 카페", min_results=1)
+
+    asyncio.run(scenario())
+    assert calls == ["분당구 백현동 카페", "판교 카페"]
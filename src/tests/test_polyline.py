@@ -0,0 +1,47 @@
+import struct
+from array import array
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from apis.v1.endpoints.sk import router
+from handler.sk.models import PedestrianRoute
+from handler.sk.tmap_handler import get_tmap_client
+from shared.utils import polyline
+
+
+def test_route_compact_output_formats():
+    route = PedestrianRoute(120, 90, array("d", [127.06, 37.50, 127.061, 37.501, 127.062, 37.502]))
+    assert polyline.decode(route.to_polyline()) == [(37.50, 127.06), (37.501, 127.061), (37.502, 127.062)]
+
+    packed = route.to_float32_bytes()
+    assert len(packed) == len(route) * 2 * 4
+    values = struct.unpack(f"<{len(route) * 2}f", packed)
+    assert all(abs(a - b) < 1e-5 for a, b in zip(values, route.coordinates))
+
+
+def test_polyline_reference_vector():
+    assert polyline.encode_flat([-120.2, 38.5, -120.95, 40.7, -126.453, 43.252]) == "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+
+
+def test_binary_output_omits_missing_totals():
+    routes = [PedestrianRoute(120, 90, array("d", [127.06, 37.50, 127.061, 37.501])),
+              PedestrianRoute(None, None, array("d", [127.06, 37.50, 127.061, 37.501]))]
+
+    class FakeTMapClient:
+        async def get_route(self, *args, **kwargs):
+            return routes.pop(0)
+
+    app = FastAPI()
+    app.include_router(router, prefix="/sk")
+    app.dependency_overrides[get_tmap_client] = FakeTMapClient
+    params = {"start_lat": 37.50, "start_lng": 127.06, "end_lat": 37.501, "end_lng": 127.061, "output_format": "binary"}
+
+    with TestClient(app) as client:
+        full = client.post("/sk/pedestrian", params=params)
+        partial = client.post("/sk/pedestrian", params=params)
+
+    assert (full.headers["X-Route-Total-Distance"], full.headers["X-Route-Total-Time"]) == ("120", "90")
+    assert partial.headers["X-Route-Points"] == "2"
+    assert "X-Route-Total-Distance" not in partial.headers and "X-Route-Total-Time" not in partial.headers
+    assert len(partial.content) == 2 * 2 * 4
@@ -0,0 +1,85 @@
+import asyncio
+
+import numpy as np
+import orjson
+
+from handler.naver.map_handler import NaverMapClient
+from handler.naver.models import Region, ReverseGeocodeResponse, ReverseGeocodeResult
+from shared.utils.region_index import RegionIndex, STRTree, region_names
+
+
+def _square(x0, y0, x1, y1):
+    return [[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]
+
+
+def _feature(properties, *rings, multi=None):
+    if multi is not None:
+        geometry = {"type": "MultiPolygon", "coordinates": multi}
+    else:
+        geometry = {"type": "Polygon", "coordinates": list(rings)}
+    return {"type": "Feature", "properties": properties, "geometry": geometry}
+
+
+FEATURES = [
+    # 구 경계 안에 동 경계 두 개 (작은 경계 우선)
+    _feature({"sido_nm": "서울특별시", "sgg_nm": "강남구"}, _square(127.00, 37.40, 127.10, 37.50)),
+    _feature({"adm_nm": "서울특별시 강남구 역삼동"}, _square(127.00, 37.40, 127.05, 37.45)),
+    # 구멍이 있는 경계: 구멍 안은 구 경계로 처리
+    _feature({"adm_nm": "서울특별시 강남구 삼성동"}, _square(127.05, 37.45, 127.10, 37.50),
+             _square(127.07, 37.47, 127.08, 37.48)),
+    # 섬이 있는 MultiPolygon
+    _feature({"adm_nm": "경기도 성남시 분당구 정자동"},
+             multi=[[_square(127.10, 37.35, 127.12, 37.37)], [_square(127.13, 37.35, 127.14, 37.36)]]),
+]
+
+
+def test_region_names_from_common_property_schemas():
+    assert region_names({"area1": "서울특별시", "area2": "강남구", "area3": "역삼동"}) == ("서울특별시", "강남구", "역삼동", "")
+    assert region_names({"adm_nm": "경기도 성남시 분당구 정자동"}) == ("경기도", "성남시 분당구", "정자동", "")
+    assert region_names({"SIDO_NM": "부산광역시", "SGG_NM": "해운대구"}) == ("부산광역시", "해운대구", "", "")
+    assert region_names({"code": "1168010100"}) is None
+
+
+def test_str_tree_point_query_matches_brute_force():
+    rng = np.random.default_rng(11)
+    lo = rng.random((2000, 2)) * 100
+    boxes = np.hstack([lo, lo + rng.random((2000, 2)) * 5])
+    tree = STRTree(boxes, node_capacity=8)
+    for x, y in rng.random((50, 2)) * 100:
+        expected = np.flatnonzero((boxes[:, 0] <= x) & (x <= boxes[:, 2]) & (boxes[:, 1] <= y) & (y <= boxes[:, 3]))
+        assert sorted(tree.query_point(x, y)) == list(expected)
+
+
+def test_region_index_lookup(tmp_path):
+    path = tmp_path / "regions.geojson"
+    path.write_bytes(orjson.dumps({"type": "FeatureCollection", "features": FEATURES}))
+    index = RegionIndex(str(path))
+
+    assert index.lookup(37.42, 127.02) == ("서울특별시", "강남구", "역삼동", "")
+    assert index.lookup(37.46, 127.06) == ("서울특별시", "강남구", "삼성동", "")
+    assert index.lookup(37.475, 127.075) == ("서울특별시", "강남구", "", "")
+    assert index.lookup(37.355, 127.135) == ("경기도", "성남시 분당구", "정자동", "")
+    assert index.lookup(35.0, 129.0) is None
+    assert len(index) == 5 and index.stats["misses"] == 1
+
+
+def test_get_address_uses_region_index_before_network(monkeypatch):
+    client = NaverMapClient()
+    client.region_index = RegionIndex()
+    client.region_index.add_features(FEATURES)
+    calls = []
+
+    async def fake_reverse_geocode(lat, lng, orders="legalcode", cache=False):
+        calls.append((lat, lng))
+        region = Region("부산광역시", "해운대구", "우동")
+        return ReverseGeocodeResponse(status_code=0, results=[ReverseGeocodeResult("legalcode", "", region)])
+
+    monkeypatch.setattr(client, "reverse_geocode", fake_reverse_geocode)
+
+    async def main():
+        return await client.get_address(37.42, 127.02), await client.get_address(35.16, 129.16)
+
+    offline, fallback = asyncio.run(main())
+    assert offline == "서울특별시 강남구 역삼동"
+    assert fallback == "부산광역시 해운대구 우동"
+    assert calls == [(35.16, 129.16)]
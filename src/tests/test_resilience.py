@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from handler.base import BaseClient
+from handler.kakao.local_handler import KakaoLocalClient
+from handler.naver.map_handler import NaverMapClient
+from handler.sk.tmap_handler import TMapClient
+from shared.infra.wrapper.resilience import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+    HedgePolicy,
+    LatencyTracker,
+    RetryPolicy,
+)
+
+
+def test_retry_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.5)
+    for attempt in range(10):
+        assert 0 <= policy.backoff(attempt) <= min(0.5, 0.1 * 2 ** attempt)
+
+
+def test_circuit_opens_after_threshold_and_probes_half_open(clock):
+    breaker = CircuitBreaker("t", CircuitBreakerPolicy(failure_threshold=2, recovery_timeout=10), clock=clock)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # 시험 요청은 1개만 허용
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens_circuit(clock):
+    breaker = CircuitBreaker("t", CircuitBreakerPolicy(failure_threshold=1, recovery_timeout=5), clock=clock)
+    breaker.record_failure()
+    clock.now = 5
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_hedge_delay_uses_quantile_after_warmup():
+    tracker = LatencyTracker()
+    policy = HedgePolicy(quantile=0.9, min_delay=0.01, max_delay=1.0, min_samples=10)
+    for i in range(9):
+        tracker.record(0.1)
+    assert tracker.hedge_delay(policy) is None
+    for i in range(91):
+        tracker.record(0.1 if i < 80 else 0.5)
+    assert tracker.hedge_delay(policy) == 0.5
+
+
+def test_unclassified_error_during_half_open_probe_reopens_circuit(clock):
+    class BrokenClient(BaseClient):
+        retry_policy = None
+
+        async def _send(self, method, url, **kwargs):
+            raise KeyError("reader bug")
+
+    client = BrokenClient("https://example.com")
+    client._circuit_breaker = breaker = CircuitBreaker(
+        "t", CircuitBreakerPolicy(failure_threshold=1, recovery_timeout=5), clock=clock)
+    breaker.record_failure()
+    clock.now = 5
+
+    with pytest.raises(KeyError):
+        asyncio.run(client._execute("GET", "https://example.com/", idempotent=True))
+    # 시험 슬롯을 점유한 채 HALF_OPEN에 머무르지 않고 실패로 기록되어 다시 열림
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now = 10
+    breaker.before_call()
+
+
+def test_hedging_is_off_by_default():
+    assert NaverMapClient.hedge_policy is None
+    assert TMapClient.hedge_policy is None
+    assert KakaoLocalClient.hedge_policy is None
@@ -0,0 +1,105 @@
+import asyncio
+
+from shared.infra.wrapper.response_cache import (
+    CachePolicy,
+    CacheableResponse,
+    ResponseCache,
+    parse_cache_control,
+)
+
+
+def make_loader(responses):
+    calls = []
+
+    async def loader(etag):
+        calls.append(etag)
+        return responses[min(len(calls), len(responses)) - 1]
+
+    return loader, calls
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('max-age=60, No-Cache, private="x"') == {
+        "max-age": "60", "no-cache": None, "private": "x"
+    }
+
+
+def test_fresh_entry_is_served_without_calling_upstream(clock):
+    cache = ResponseCache(clock=clock)
+    loader, calls = make_loader([CacheableResponse(200, {"v": 1}, size=10)])
+
+    async def scenario():
+        first = await cache.fetch("k", CachePolicy(ttl=60), loader)
+        clock.now = 30
+        second = await cache.fetch("k", CachePolicy(ttl=60), loader)
+        return first, second
+
+    assert asyncio.run(scenario()) == ({"v": 1}, {"v": 1})
+    assert calls == [None]
+    assert cache.hits == 1 and cache.misses == 1
+
+
+def test_stale_entry_is_served_and_refreshed_in_background(clock):
+    cache = ResponseCache(clock=clock)
+    loader, calls = make_loader([
+        CacheableResponse(200, "old", size=3),
+        CacheableResponse(200, "new", size=3),
+    ])
+    policy = CachePolicy(ttl=10, stale_while_revalidate=100)
+
+    async def scenario():
+        await cache.fetch("k", policy, loader)
+        clock.now = 20
+        stale = await cache.fetch("k", policy, loader)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        refreshed = await cache.fetch("k", policy, loader)
+        return stale, refreshed
+
+    assert asyncio.run(scenario()) == ("old", "new")
+    assert len(calls) == 2
+
+
+def test_not_modified_response_reuses_cached_value(clock):
+    cache = ResponseCache(clock=clock)
+    loader, calls = make_loader([
+        CacheableResponse(200, "body", size=4, etag='"abc"'),
+        CacheableResponse(304, None),
+    ])
+
+    async def scenario():
+        await cache.fetch("k", CachePolicy(ttl=10), loader)
+        clock.now = 11
+        return await cache.fetch("k", CachePolicy(ttl=10), loader)
+
+    assert asyncio.run(scenario()) == "body"
+    assert calls == [None, '"abc"']
+    assert cache.revalidations == 1
+
+
+def test_no_store_and_max_age_are_honored(clock):
+    cache = ResponseCache(clock=clock)
+
+    async def scenario():
+        no_store, _ = make_loader([CacheableResponse(200, 1, size=1, cache_control="no-store")])
+        await cache.fetch("a", CachePolicy(ttl=60), no_store)
+        short, _ = make_loader([CacheableResponse(200, 2, size=1, cache_control="max-age=5")])
+        await cache.fetch("b", CachePolicy(ttl=60), short)
+
+    asyncio.run(scenario())
+    assert cache.get_entry("a") is None
+    assert cache.get_entry("b").expires_at == 5
+
+
+def test_lru_eviction_by_entry_count_and_bytes():
+    cache = ResponseCache(max_entries=2, max_bytes=100)
+    cache.set("a", 1, size=10, ttl=60)
+    cache.set("b", 2, size=10, ttl=60)
+    cache.get_entry("a")
+    cache.set("c", 3, size=10, ttl=60)
+    assert cache.get_entry("b") is None
+    assert cache.get_entry("a") is not None
+
+    cache.set("big", 4, size=95, ttl=60)
+    assert len(cache) == 1
+    assert cache.total_bytes == 95
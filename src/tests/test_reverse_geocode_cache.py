@@ -0,0 +1,62 @@
+import asyncio
+
+from handler.naver.map_handler import NaverMapClient
+from handler.naver.models import Region, ReverseGeocodeResponse, ReverseGeocodeResult
+from shared.infra.wrapper.response_cache import ResponseCache
+from shared.utils import geohash
+
+
+def make_client(calls):
+    client = NaverMapClient()
+    client._cache = ResponseCache()
+
+    async def fake_request(method, endpoint, **kwargs):
+        calls.append(kwargs["params"]["coords"])
+        await asyncio.sleep(0)
+        return ReverseGeocodeResponse(status_code=0, results=[
+            ReverseGeocodeResult("legalcode", "4113510300", Region("경기도", "성남시 분당구", "정자동"))
+        ])
+
+    client.request = fake_request
+    return client
+
+
+def test_geohash_roundtrip_and_cell_size():
+    cell = geohash.encode(37.3595963, 127.1054328, 7)
+    min_lat, min_lng, max_lat, max_lng = geohash.decode_bbox(cell)
+    assert min_lat <= 37.3595963 < max_lat and min_lng <= 127.1054328 < max_lng
+    assert geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+
+def test_points_in_same_cell_reuse_cached_region():
+    calls = []
+    client = make_client(calls)
+
+    async def main():
+        # 같은 7자리 셀(약 150m) 안의 서로 다른 좌표
+        first = await client.get_address(37.35960, 127.10543)
+        second = await client.get_address(37.35965, 127.10550)
+        return first, second
+
+    assert asyncio.run(main()) == ("경기도 성남시 분당구 정자동",) * 2
+    assert len(calls) == 1
+
+
+def test_concurrent_misses_in_same_cell_are_coalesced():
+    calls = []
+    client = make_client(calls)
+
+    async def main():
+        return await asyncio.gather(*(
+            client.reverse_geocode(37.35960 + i * 1e-5, 127.10543, orders="legalcode", cache=True) for i in range(5)
+        ))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_road_address_orders_use_finer_cells():
+    client = NaverMapClient()
+    assert len(client._reverse_geocode_cell(37.3, 127.1, "legalcode")) == 7
+    assert len(client._reverse_geocode_cell(37.3, 127.1, "legalcode,roadaddr")) == 9
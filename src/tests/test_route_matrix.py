@@ -0,0 +1,114 @@
+import asyncio
+
+from handler.sk.models import PedestrianRoute, RouteMatrix, RouteSummary
+from handler.sk.tmap_handler import TMapClient
+from shared.infra.wrapper.concurrency_limiter import RateLimiter
+from shared.infra.wrapper.response_cache import ResponseCache
+
+
+def make_client(calls):
+    client = TMapClient()
+    client._cache = ResponseCache()
+
+    async def fake_fetch(start, end, start_name, end_name, option):
+        calls.append((start, end))
+        if end[0] == 0:
+            raise RuntimeError("upstream failed")
+        return RouteSummary(total_distance_m=round(abs(end[0] - start[0]) * 1e5), total_time_sec=60, description=None)
+
+    client._fetch_route_summary = fake_fetch
+    return client
+
+
+def test_matrix_skips_far_pairs_and_reports_errors():
+    calls = []
+    client = make_client(calls)
+    origins = [(37.50, 127.06), (37.60, 127.06)]
+    destinations = [(37.51, 127.06), (0, 127.06)]
+
+    matrix = asyncio.run(client.get_route_matrix(origins, destinations, max_distance_m=5000))
+
+    assert (matrix.rows, matrix.cols) == (2, 2)
+    assert matrix.status == [RouteMatrix.OK, RouteMatrix.SKIPPED, RouteMatrix.SKIPPED, RouteMatrix.SKIPPED]
+    assert matrix.distance_m[matrix.index(0, 0)] == 1000
+    assert (matrix.computed, matrix.skipped, matrix.failed) == (1, 3, 0)
+    assert len(calls) == 1
+
+    matrix = asyncio.run(client.get_route_matrix(origins[:1], destinations, max_distance_m=1e8))
+    assert matrix.status == [RouteMatrix.OK, RouteMatrix.ERROR]
+    # 캐시된 쌍은 다시 호출하지 않음 (실패한 쌍만 호출)
+    assert len(calls) == 2
+
+
+def test_summary_cache_shares_snapped_pairs():
+    calls = []
+    client = make_client(calls)
+
+    async def main():
+        await client.get_route_summary((37.500000, 127.06), (37.51, 127.06), cache=True)
+        await client.get_route_summary((37.500001, 127.06), (37.51, 127.06), cache=True)
+        await client.get_route_matrix([(37.500002, 127.06)], [(37.51, 127.06)], option=10)
+
+    asyncio.run(main())
+    assert len(calls) == 1
+
+
+def test_rate_limiter_spaces_requests_after_burst(monkeypatch, clock):
+    limiter = RateLimiter("t", rate=2, burst=2, clock=clock)
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        clock.now += delay
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    async def main():
+        for _ in range(4):
+            await limiter.acquire()
+
+    asyncio.run(main())
+    assert sleeps == [0.5, 0.5]
+
+
+ROUTE_GEOJSON = {
+    "type": "FeatureCollection",
+    "features": [
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [127.06, 37.50]},
+         "properties": {"totalDistance": 120, "totalTime": 90}},
+        {"type": "Feature", "geometry": {"type": "LineString", "coordinates": [[127.06, 37.50], [127.061, 37.501]]},
+         "properties": {}},
+        {"type": "Feature", "geometry": {"type": "LineString", "coordinates": [[127.061, 37.501], [127.062, 37.502]]},
+         "properties": {}},
+    ],
+}
+
+
+def test_pedestrian_route_packs_line_coordinates():
+    route = PedestrianRoute.from_geojson(ROUTE_GEOJSON)
+    assert (route.total_distance_m, route.total_time_sec) == (120, 90)
+    assert route.points() == [[127.06, 37.50], [127.061, 37.501], [127.062, 37.502]]
+    assert route.coordinates.itemsize * len(route.coordinates) == 3 * 16
+    assert route.to_geojson()["features"][0]["geometry"]["coordinates"] == route.points()
+
+
+def test_route_cache_uses_snapped_coordinates_and_options():
+    client = TMapClient()
+    calls = []
+
+    async def fake_request(method, endpoint, **kwargs):
+        calls.append(kwargs["json"]["searchOption"])
+        return PedestrianRoute.from_geojson(ROUTE_GEOJSON)
+
+    client.request = fake_request
+
+    async def main():
+        first = await client.get_route(127.060000, 37.500000, 127.062, 37.502)
+        second = await client.get_route(127.060001, 37.500001, 127.062, 37.502)
+        await client.get_route(127.060000, 37.500000, 127.062, 37.502, search_option=10)
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first is second
+    assert calls == ["0", "10"]
+    assert client.route_cache.total_bytes == 2 * first.nbytes
@@ -0,0 +1,66 @@
+import asyncio
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from apis.v1.endpoints.sk import router
+from core.exceptions import register_application_exception
+from handler.sk.models import PedestrianRoute
+from handler.sk.tmap_handler import TMapClient, get_tmap_client
+from shared.utils.simplify import douglas_peucker, tolerance_for_zoom
+
+
+def test_douglas_peucker_drops_collinear_points_and_keeps_corners():
+    # 동쪽으로 직진 후 북쪽으로 꺾는 경로 (중간 점들은 직선 위)
+    points = np.array([[127.0 + i * 1e-4, 37.0] for i in range(10)] + [[127.0009, 37.0 + i * 1e-4] for i in range(1, 10)])
+    kept = douglas_peucker(points, tolerance_m=1.0)
+    assert kept.tolist() == [0, 9, 18]
+    assert douglas_peucker(points, tolerance_m=1e6).tolist() == [0, 18]
+
+
+def test_zoom_tolerance_halves_per_level():
+    assert abs(tolerance_for_zoom(16, 37.5) * 2 - tolerance_for_zoom(15, 37.5)) < 1e-9
+    assert 1.5 < tolerance_for_zoom(16, 37.5) < 2.0
+
+
+def test_simplified_routes_are_cached_per_tolerance():
+    client = TMapClient()
+    calls = []
+    coordinates = [[127.0 + i * 1e-5, 37.0 + (i % 2) * 1e-6] for i in range(100)]
+
+    async def fake_request(method, endpoint, **kwargs):
+        calls.append(1)
+        return PedestrianRoute.from_geojson({"features": [
+            {"properties": {"totalDistance": 90}, "geometry": {"type": "LineString", "coordinates": coordinates}}
+        ]})
+
+    client.request = fake_request
+
+    async def main():
+        coarse = await client.get_route(127.0, 37.0, 127.001, 37.0, tolerance_m=5)
+        again = await client.get_route(127.0, 37.0, 127.001, 37.0, tolerance_m=5.1)
+        full = await client.get_route(127.0, 37.0, 127.001, 37.0)
+        return coarse, again, full
+
+    coarse, again, full = asyncio.run(main())
+    assert coarse is again
+    assert len(full) == 100 and len(coarse) == 2
+    assert coarse.total_distance_m == 90
+    assert len(calls) == 1
+
+
+def test_zoom_without_start_lat_is_rejected():
+    class FakeTMapClient:
+        async def get_route(self, *args, **kwargs):
+            raise AssertionError("업스트림을 호출하면 안 됨")
+
+    app = FastAPI()
+    app.include_router(router, prefix="/sk")
+    register_application_exception(app)
+    app.dependency_overrides[get_tmap_client] = FakeTMapClient
+
+    with TestClient(app) as client:
+        response = client.post("/sk/pedestrian", params={"start_lng": 127.06, "end_lat": 37.501,
+                                                         "end_lng": 127.061, "zoom": 16})
+    assert response.status_code == 422
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from shared.infra.wrapper.singleflight import SingleFlight, make_request_key
+
+
+def test_request_key_normalizes_params_and_headers():
+    a = make_request_key("get", "https://x", {"b": 1, "a": "2"}, {"Accept": "json"})
+    b = make_request_key("GET", "https://x", {"a": 2, "b": "1"}, {"accept": "json"})
+    assert a == b
+    assert a != make_request_key("GET", "https://x", {"a": 2}, {"accept": "json"})
+
+
+def test_concurrent_calls_share_one_upstream_call():
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"ok": True}
+
+    async def scenario():
+        sf = SingleFlight()
+        results = await asyncio.gather(*(sf.do("k", fetch) for _ in range(10)))
+        assert sf.inflight_count == 0
+        return results
+
+    results = asyncio.run(scenario())
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_error_is_propagated_to_every_caller():
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def scenario():
+        sf = SingleFlight()
+        return await asyncio.gather(*(sf.do("k", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_cancelling_one_caller_keeps_the_others_running():
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return 42
+
+    async def scenario():
+        sf = SingleFlight()
+        first = asyncio.create_task(sf.do("k", fetch))
+        second = asyncio.create_task(sf.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == 42
+
+
+def test_upstream_is_cancelled_when_all_callers_leave():
+    cancelled = False
+
+    async def fetch():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    async def scenario():
+        sf = SingleFlight()
+        caller = asyncio.create_task(sf.do("k", fetch))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0)
+        assert sf.inflight_count == 0
+
+    asyncio.run(scenario())
+    assert cancelled
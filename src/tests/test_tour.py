@@ -0,0 +1,68 @@
+import asyncio
+from array import array
+
+import numpy as np
+
+from handler.sk.models import PedestrianRoute, RouteSummary
+from handler.sk.tmap_handler import TMapClient
+from shared.infra.wrapper.response_cache import ResponseCache
+from shared.utils.tour import order_stops, path_cost
+
+
+def test_order_stops_untangles_crossing_path():
+    # 일직선 위의 지점을 뒤섞어 입력해도 한 방향으로 방문
+    xs = np.array([0.0, 5.0, 1.0, 4.0, 2.0, 3.0])
+    cost = np.abs(xs[:, None] - xs[None, :])
+    order = order_stops(cost)
+    assert [xs[i] for i in order] == [0, 1, 2, 3, 4, 5]
+    # 도착지 고정
+    order = order_stops(cost[[0, 2, 4, 1]][:, [0, 2, 4, 1]], end_fixed=True)
+    assert order[0] == 0 and order[-1] == 3 and path_cost(order, cost[[0, 2, 4, 1]][:, [0, 2, 4, 1]]) == 5
+
+
+def test_multi_stop_route_orders_stops_and_chains_legs():
+    client = TMapClient()
+    client._cache = ResponseCache()
+    calls = []
+
+    async def fake_get_route(start_x, start_y, end_x, end_y, search_option=0, sort="index", pass_list=None,
+                             cache=True, tolerance_m=None):
+        vias = [tuple(map(float, p.split(","))) for p in pass_list.split("_")] if pass_list else []
+        calls.append(vias)
+        coords = [(start_x, start_y), *vias, (end_x, end_y)]
+        return PedestrianRoute(100 * (len(coords) - 1), 60 * (len(coords) - 1),
+                               array("d", [v for point in coords for v in point]))
+
+    client.get_route = fake_get_route
+    start = (37.50, 127.00)
+    # 북쪽으로 일직선, 순서를 뒤섞어 입력
+    stops = [(37.50 + 0.001 * k, 127.00) for k in (7, 2, 5, 1, 8, 3, 6, 4)]
+
+    result = asyncio.run(client.get_multi_stop_route(start, stops))
+    assert [stops[i][0] for i in result.order] == sorted(s[0] for s in stops)
+    # 경유지 5개 + 끝점 -> 두 구간, 구간 경계 좌표는 한 번만
+    assert result.legs == 2 and [len(c) for c in calls] == [5, 1]
+    assert len(result.route) == 1 + len(stops)
+    assert result.route.total_distance_m == 100 * len(stops)
+    assert result.estimated_pairs == 9 * 8
+
+    # 캐시된 경로 요약이 있으면 직선 거리 대신 사용
+    client._cache.set(client._summary_key(start, stops[0], 0), RouteSummary(1, 1, None), 256, ttl=60)
+    client._cache.set(client._summary_key(stops[0], start, 0), RouteSummary(1, 1, None), 256, ttl=60)
+    result = asyncio.run(client.get_multi_stop_route(start, stops))
+    assert result.estimated_pairs == 9 * 8 - 2 and sorted(result.order) == list(range(len(stops)))
+
+
+def test_tour_cost_matrix_ignores_expired_summaries(clock):
+    client = TMapClient()
+    client._cache = ResponseCache(clock=clock)
+    a, b = (37.50, 127.00), (37.51, 127.00)
+    client._cache.set(client._summary_key(a, b, 0), RouteSummary(1, 1, None), 256, ttl=60)
+
+    cost, estimated = client._tour_cost_matrix([a, b], 0)
+    assert cost[0, 1] == 1 and estimated == 1
+
+    # TTL이 지난 요약 대신 직선 거리 추정 사용
+    clock.now += 61
+    cost, estimated = client._tour_cost_matrix([a, b], 0)
+    assert cost[0, 1] > 1000 and estimated == 2
@@ -0,0 +1,21 @@
+import asyncio
+
+from handler.base import BaseClient
+from shared.infra.wrapper.aiohttp_wrapper import AioHttpClient
+
+
+def test_base_clients_share_one_session():
+    async def scenario():
+        transport = AioHttpClient()
+        naver = BaseClient("https://maps.apigw.ntruss.com", http_client=transport)
+        tmap = BaseClient("https://apis.openapi.sk.com/", http_client=transport)
+
+        session_a = await naver._get_session()
+        session_b = await tmap._get_session()
+        assert session_a is session_b
+        assert tmap._build_url("/tmap/routes") == "https://apis.openapi.sk.com/tmap/routes"
+
+        await transport.close_session()
+        assert session_a.closed
+
+    asyncio.run(scenario())